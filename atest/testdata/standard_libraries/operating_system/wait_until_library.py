@@ -14,9 +14,13 @@ class wait_until_library:
 
     def create_after_sleeping(self, path, directory=False):
         if directory:
-            self._run_after_sleeping(os.mkdir, path)
+            self._run_after_sleeping(os.makedirs, path)
         else:
-            self._run_after_sleeping(lambda: open(path, "w", encoding="ASCII").close())
+            self._run_after_sleeping(self._create_file, path)
+
+    def _create_file(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w", encoding="ASCII").close()
 
     def _run_after_sleeping(self, method, *args):
         self._timers.append(Timer(0.1, method, args))
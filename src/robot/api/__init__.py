@@ -88,27 +88,8 @@ See documentations of the individual APIs for more details.
         via the :mod:`robot` root package.
 """
 
-from robot.conf.languages import Language as Language, Languages as Languages
-from robot.model import SuiteVisitor as SuiteVisitor
-from robot.parsing import (
-    get_init_model as get_init_model,
-    get_init_tokens as get_init_tokens,
-    get_model as get_model,
-    get_resource_model as get_resource_model,
-    get_resource_tokens as get_resource_tokens,
-    get_tokens as get_tokens,
-    Token as Token,
-)
-from robot.reporting import ResultWriter as ResultWriter
-from robot.result import (
-    ExecutionResult as ExecutionResult,
-    ResultVisitor as ResultVisitor,
-)
-from robot.running import (
-    TestSuite as TestSuite,
-    TestSuiteBuilder as TestSuiteBuilder,
-    TypeInfo as TypeInfo,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from .exceptions import (
     ContinuableFailure as ContinuableFailure,
@@ -117,3 +98,86 @@ from .exceptions import (
     FatalError as FatalError,
     SkipExecution as SkipExecution,
 )
+
+if TYPE_CHECKING:
+    from robot.conf.languages import Language as Language, Languages as Languages
+    from robot.model import SuiteVisitor as SuiteVisitor
+    from robot.parsing import (
+        get_init_model as get_init_model,
+        get_init_tokens as get_init_tokens,
+        get_model as get_model,
+        get_resource_model as get_resource_model,
+        get_resource_tokens as get_resource_tokens,
+        get_tokens as get_tokens,
+        Token as Token,
+    )
+    from robot.reporting import ResultWriter as ResultWriter
+    from robot.result import (
+        ExecutionResult as ExecutionResult,
+        ResultVisitor as ResultVisitor,
+    )
+    from robot.running import (
+        TestSuite as TestSuite,
+        TestSuiteBuilder as TestSuiteBuilder,
+        TypeInfo as TypeInfo,
+    )
+
+
+# Importing these APIs requires importing most of the framework. They are
+# imported only when used to keep importing `robot.api.deco` and other
+# lightweight submodules fast.
+_LAZY_IMPORTS = {
+    "Language": "robot.conf.languages",
+    "Languages": "robot.conf.languages",
+    "SuiteVisitor": "robot.model",
+    "get_init_model": "robot.parsing",
+    "get_init_tokens": "robot.parsing",
+    "get_model": "robot.parsing",
+    "get_resource_model": "robot.parsing",
+    "get_resource_tokens": "robot.parsing",
+    "get_tokens": "robot.parsing",
+    "Token": "robot.parsing",
+    "ResultWriter": "robot.reporting",
+    "ExecutionResult": "robot.result",
+    "ResultVisitor": "robot.result",
+    "TestSuite": "robot.running",
+    "TestSuiteBuilder": "robot.running",
+    "TypeInfo": "robot.running",
+}
+
+# Lazily imported names must be listed explicitly for `from robot.api import *`.
+__all__ = [
+    "ContinuableFailure",
+    "Error",
+    "ExecutionResult",
+    "Failure",
+    "FatalError",
+    "Language",
+    "Languages",
+    "ResultVisitor",
+    "ResultWriter",
+    "SkipExecution",
+    "SuiteVisitor",
+    "TestSuite",
+    "TestSuiteBuilder",
+    "Token",
+    "TypeInfo",
+    "get_init_model",
+    "get_init_tokens",
+    "get_model",
+    "get_resource_model",
+    "get_resource_tokens",
+    "get_tokens",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"'robot.api' has no attribute '{name}'.")
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -13,9 +13,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Callable, Literal, overload, Sequence, TypeVar, Union
-
-from .interfaces import TypeHints
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    overload,
+    Sequence,
+    TYPE_CHECKING,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .interfaces import TypeHints
 
 F = TypeVar("F", bound=Callable[..., Any])
 K = TypeVar("K", bound=Callable[..., Any])
@@ -90,9 +90,6 @@ Example
 import logging
 from typing import Literal
 
-from robot.output import librarylogger
-from robot.running.context import EXECUTION_CONTEXTS
-
 # LOGLEVEL was introduced in RF 7.0 and naming convention compliant LogLevel in RF 7.4.
 # TODO: Deprecate LOGLEVEL in RF 8.0. Update the above "Log levels" section as well.
 LogLevel = Literal["TRACE", "DEBUG", "INFO", "CONSOLE", "HTML", "WARN", "ERROR"]
@@ -127,6 +124,10 @@ def write(
     The ``CONSOLE`` pseudo level is new in Robot Framework 6.1 and
     the ``console`` argument is new in Robot Framework 7.4.
     """
+    # Imported here to keep importing this module fast outside execution.
+    from robot.output import librarylogger
+    from robot.running.context import EXECUTION_CONTEXTS
+
     if EXECUTION_CONTEXTS.current is not None:
         librarylogger.write(msg, level, html, console)
     else:
@@ -216,4 +217,6 @@ def console(
         to the message.
     :param stream: Name of the standard stream to write the message to.
     """
+    from robot.output import librarylogger
+
     librarylogger.console(msg, newline, stream)
@@ -34,6 +34,9 @@ The publicly exposed parsing entry points are the following:
   functions for `parsing data to model`_ represented as
   an abstract syntax tree (AST).
 
+* :func:`~.parser.parser.update_model` function for updating a parsed
+  model after the data has been edited without parsing everything again.
+
 * `Model objects`_ used by the AST model.
 
 * :class:`~robot.parsing.model.visitor.ModelVisitor`
@@ -164,6 +167,17 @@ section would produce so much output that it is not included here. If
 you are going to work with Robot Framework's AST, you are recommended to
 try that on your own.
 
+Tools like editors that need an up-to-date model when data is edited can
+use the :func:`~.parser.parser.update_model` function. It updates an earlier
+parsed model based on the edited lines and parses only the affected parts
+of the data again::
+
+    from robot.api.parsing import get_model, update_model
+
+    model = get_model('example.robot')
+    # Replace lines 3-4 with new content.
+    model = update_model(model, 3, 4, 'Example\n    Log    Hello!\n')
+
 .. _ast: https://docs.python.org/library/ast.html
 .. _ast.AST: https://docs.python.org/library/ast.html#ast.AST
 .. _ast.NodeVisitor: https://docs.python.org/library/ast.html#ast.NodeVisitor
@@ -493,6 +507,7 @@ from robot.parsing import (
     get_resource_tokens as get_resource_tokens,
     get_tokens as get_tokens,
     Token as Token,
+    update_model as update_model,
 )
 from robot.parsing.model.blocks import (
     CommentSection as CommentSection,
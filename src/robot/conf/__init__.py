@@ -24,10 +24,24 @@ are likely to be rewritten at some point to be more convenient to use.
 Instantiating them is not likely to change, though.
 """
 
+from typing import TYPE_CHECKING
+
 from .languages import (
     Language as Language,
     LanguageLike as LanguageLike,
     Languages as Languages,
     LanguagesLike as LanguagesLike,
 )
-from .settings import RebotSettings as RebotSettings, RobotSettings as RobotSettings
+
+if TYPE_CHECKING:
+    from .settings import RebotSettings as RebotSettings, RobotSettings as RobotSettings
+
+
+def __getattr__(name):
+    # Settings import most of the framework and are not needed, for example,
+    # when only languages are used by the parser. Import them only when needed.
+    if name in ("RebotSettings", "RobotSettings"):
+        from . import settings
+
+        return getattr(settings, name)
+    raise AttributeError(f"'robot.conf' has no attribute '{name}'.")
@@ -15,6 +15,7 @@
 
 import inspect
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Iterator, Union
 
@@ -62,6 +63,7 @@ class Languages:
         for lang in self._get_languages(languages, add_english):
             self._add_language(lang)
         self._bdd_prefix_regexp = None
+        self._bdd_prefix_trie = None
 
     @property
     def bdd_prefix_regexp(self):
@@ -71,6 +73,48 @@ class Languages:
             self._bdd_prefix_regexp = re.compile(rf"({pattern})\s", re.IGNORECASE)
         return self._bdd_prefix_regexp
 
+    def split_bdd_prefix(self, name: str) -> "list[tuple[str, str]]":
+        """Splits BDD prefixes from the given keyword name.
+
+        Returns a list of ``(prefix, rest)`` tuples containing all prefixes
+        that match the name, longest prefix first. Matching is case-insensitive.
+        Prefixes are returned in the normalized format used in
+        :attr:`bdd_prefixes`.
+
+        New in Robot Framework 7.5.
+        """
+        if self._bdd_prefix_trie is None:
+            self._bdd_prefix_trie = self._build_bdd_prefix_trie()
+        trie, max_words = self._bdd_prefix_trie
+        # Fast path for the common case that the name has no prefix.
+        first = name.split(None, 1)
+        if len(first) < 2 or first[0].title() not in trie:
+            return []
+        matches = []
+        node = trie
+        # The last item is excluded because a prefix must be followed by a name.
+        for count, word in enumerate(name.split(None, max_words)[:-1], start=1):
+            node = node.get(word.title())
+            if node is None:
+                break
+            if "" in node:
+                matches.append((node[""], name.split(None, count)[-1]))
+        return matches[::-1]
+
+    def _build_bdd_prefix_trie(self) -> "tuple[dict, int]":
+        # Keys are title-cased words and an empty key contains the prefix
+        # ending at that node.
+        trie = {}
+        max_words = 0
+        for prefix in self.bdd_prefixes:
+            words = prefix.split()
+            node = trie
+            for word in words:
+                node = node.setdefault(word, {})
+            node[""] = " ".join(words)
+            max_words = max(max_words, len(words))
+        return trie, max_words
+
     def reset(self, languages: Iterable[LanguageLike] = (), add_english: bool = True):
         """Resets the instance to the given languages."""
         self.__init__(languages, add_english)
@@ -101,6 +145,7 @@ class Languages:
         for lang in languages:
             self._add_language(lang)
         self._bdd_prefix_regexp = None
+        self._bdd_prefix_trie = None
 
     def _exists(self, path: Path):
         try:
@@ -112,11 +157,12 @@ class Languages:
         if lang in self.languages:
             return
         self.languages.append(lang)
-        self.headers.update({n.title(): v for n, v in lang.headers.items() if n})
-        self.settings.update({n.title(): v for n, v in lang.settings.items() if n})
-        self.bdd_prefixes |= {p.title() for p in lang.bdd_prefixes}
-        self.true_strings |= {s.title() for s in lang.true_strings}
-        self.false_strings |= {s.title() for s in lang.false_strings}
+        translations = _get_translations(lang)
+        self.headers.update(translations.headers)
+        self.settings.update(translations.settings)
+        self.bdd_prefixes |= translations.bdd_prefixes
+        self.true_strings |= translations.true_strings
+        self.false_strings |= translations.false_strings
         for old, new_and_version in lang.deprecations.items():
             try:
                 self._add_deprecation(old, new_and_version, lang)
@@ -174,13 +220,7 @@ class Languages:
         return languages, available
 
     def _get_available_languages(self) -> "dict[str, type[Language]]":
-        available = {}
-        for lang in Language.__subclasses__():
-            available[normalize(lang.code, ignore="-")] = lang
-            available[normalize(lang.name)] = lang
-        if "" in available:
-            available.pop("")
-        return available
+        return _get_available_languages(tuple(Language.__subclasses__()))
 
     def _import_language_module(self, name_or_path) -> "list[Language]":
         def is_language(member):
@@ -221,6 +261,37 @@ class Languages:
         return iter(self.languages)
 
 
+@lru_cache
+def _get_available_languages(
+    languages: "tuple[type[Language], ...]",
+) -> "dict[str, type[Language]]":
+    available = {}
+    for lang in languages:
+        available[normalize(lang.code, ignore="-")] = lang
+        available[normalize(lang.name)] = lang
+    if "" in available:
+        available.pop("")
+    return available
+
+
+class _Translations:
+    """Translations of a single language normalized for lookups."""
+
+    def __init__(self, lang: "Language"):
+        self.headers = {n.title(): v for n, v in lang.headers.items() if n}
+        self.settings = {n.title(): v for n, v in lang.settings.items() if n}
+        self.bdd_prefixes = frozenset(p.title() for p in lang.bdd_prefixes)
+        self.true_strings = frozenset(s.title() for s in lang.true_strings)
+        self.false_strings = frozenset(s.title() for s in lang.false_strings)
+
+
+@lru_cache
+def _get_translations(lang: "Language") -> _Translations:
+    # Languages are equal if they have the same type, so translations are
+    # computed only once per language.
+    return _Translations(lang)
+
+
 class Language:
     """Base class for language definitions.
 
@@ -29,10 +29,13 @@ This module also exposes the following public API:
 - :func:`libdoc` function as a high level programmatic API.
 - :func:`~robot.libdocpkg.builder.LibraryDocumentation` as the API to generate
   :class:`~robot.libdocpkg.model.LibraryDoc` instances.
+- :class:`~robot.libdocpkg.batch.LibdocBatch` for generating documentation for
+  multiple libraries and resources at once.
 
 Libdoc itself is implemented in the :mod:`~robot.libdocpkg` package.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -43,8 +46,9 @@ if __name__ == "__main__" and "robot" not in sys.modules:
 
 from robot.errors import DataError
 from robot.libdocpkg import (
-    ConsoleViewer, format_languages, LANGUAGES, LibraryDocumentation
+    ConsoleViewer, format_languages, LANGUAGES, LibdocBatch, LibraryDocumentation
 )
+from robot.libdocpkg.batch import needs_html_docs
 from robot.utils import Application, seq2str
 
 USAGE = f"""Libdoc -- Robot Framework library documentation generator
@@ -53,6 +57,7 @@ Version:  <VERSION>
 
 Usage:  libdoc [options] library_or_resource output_file
    or:  libdoc [options] library_or_resource list|show|version [names]
+   or:  libdoc [options] library_or_resource_or_dir+ output_dir
 
 Libdoc can generate documentation for Robot Framework libraries and resource
 files. It can generate HTML documentation for humans as well as machine
@@ -104,6 +109,9 @@ Options
  -n --name name           Sets the name of the documented library or resource.
  -v --version version     Sets the version of the documented library or
                           resource.
+    --processes count     Maximum number of processes to use when generating
+                          documentation for multiple libraries or resources.
+                          Defaults to the number of CPUs. New in RF 7.5.
     --quiet               Do not print the path of the generated output file
                           to the console.
  -P --pythonpath path *   Additional locations where to search for libraries
@@ -129,6 +137,26 @@ Examples:
   libdoc --name MyLibrary Remote::10.0.0.42:8270 MyLibrary.xml
   libdoc MyLibrary MyLibrary.libspec
 
+Documenting multiple libraries and resources
+============================================
+
+If the last argument is an existing directory or ends with a path separator,
+documentation is generated for all libraries and resources given before it
+and written to that directory in parallel processes. If a library or resource
+argument is a directory, it is searched recursively for `*.py` and `*.resource`
+files, excluding files and directories starting with an underscore or a dot.
+Output files are named based on the documented files and the format is HTML
+by default. In addition to the actual outputs, an `index.json` file listing
+all documented libraries and resources is created and, with HTML outputs, also
+an `index.html` file. Files that have not changed since the previous run, based
+on hashes stored in `index.json`, are not documented again. This functionality
+is new in RF 7.5.
+
+Examples:
+
+  libdoc src/libraries/ src/resources/ doc/
+  libdoc --format json Collections String src/MyLibrary.py specs/
+
 Viewing information on console
 ==============================
 
@@ -179,6 +207,13 @@ class LibDoc(Application):
         if ConsoleViewer.handles(arguments[1]):
             ConsoleViewer.validate_command(arguments[1], arguments[2:])
             return options, arguments
+        if self._is_batch(arguments):
+            if options["name"] or options["version"]:
+                raise DataError(
+                    "The --name and --version options cannot be used when "
+                    "documenting multiple libraries or resources."
+                )
+            return options, arguments
         if len(arguments) > 2:
             raise DataError("Only two arguments allowed when writing output.")
         return options, arguments
@@ -194,12 +229,24 @@ class LibDoc(Application):
         theme=None,
         language=None,
         pythonpath=None,
+        processes=None,
         quiet=False,
     ):
         if pythonpath:
             sys.path = pythonpath + sys.path
-        lib_or_res, output = args[:2]
         docformat = self._get_docformat(docformat)
+        if self._is_batch(args):
+            return self._batch(
+                args,
+                format,
+                docformat,
+                specdocformat,
+                theme,
+                language,
+                processes,
+                quiet,
+            )
+        lib_or_res, output = args[:2]
         libdoc = LibraryDocumentation(lib_or_res, name, version, docformat)
         if ConsoleViewer.handles(output):
             ConsoleViewer(libdoc).view(output, *args[2:])
@@ -207,11 +254,7 @@ class LibDoc(Application):
         format, specdocformat = self._get_format_and_specdocformat(
             format, specdocformat, output
         )
-        if (
-            format == "HTML"
-            or specdocformat == "HTML"
-            or (format in ("JSON", "LIBSPEC") and specdocformat != "RAW")
-        ):
+        if needs_html_docs(format, specdocformat):
             libdoc.convert_docs_to_html()
         libdoc.save(
             output,
@@ -222,6 +265,60 @@ class LibDoc(Application):
         if not quiet:
             self.console(Path(output).absolute())
 
+    def _is_batch(self, args):
+        output = args[-1]
+        return output.endswith(("/", os.sep)) or os.path.isdir(output)
+
+    def _batch(
+        self,
+        args,
+        format,
+        docformat,
+        specdocformat,
+        theme,
+        language,
+        processes,
+        quiet,
+    ):
+        *sources, output_dir = args
+        format, specdocformat = self._get_format_and_specdocformat(
+            format or "HTML", specdocformat, output_dir
+        )
+        batch = LibdocBatch(
+            output_dir,
+            format,
+            docformat,
+            specdocformat,
+            self._validate_theme(theme, format),
+            self._validate_lang(language),
+            self._get_processes(processes),
+        )
+        failed = 0
+        for entry in batch.build(*sources):
+            if entry["status"] == "failed":
+                self._logger.error(
+                    f"Documenting '{entry['source']}' failed: {entry['error']}"
+                )
+                failed += 1
+            elif entry["status"] == "generated" and not quiet:
+                self.console(Path(output_dir, entry["output"]).absolute())
+        if not quiet:
+            self.console(batch.index.absolute())
+        return min(failed, 250)
+
+    def _get_processes(self, processes):
+        if processes is None:
+            return None
+        try:
+            processes = int(processes)
+            if processes < 1:
+                raise ValueError
+        except ValueError:
+            raise DataError(
+                f"Process count must be a positive integer, got '{processes}'."
+            )
+        return processes
+
     def _get_docformat(self, docformat):
         return self._validate(
             "Doc format",
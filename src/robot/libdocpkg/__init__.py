@@ -18,6 +18,7 @@
 The public Libdoc API is exposed via the :mod:`robot.libdoc` module.
 """
 
+from .batch import LibdocBatch as LibdocBatch
 from .builder import LibraryDocumentation as LibraryDocumentation
 from .consoleviewer import ConsoleViewer as ConsoleViewer
 from .languages import format_languages as format_languages, LANGUAGES as LANGUAGES
@@ -0,0 +1,282 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+from robot.utils import file_writer, get_error_message, html_escape
+from robot.version import VERSION
+
+from .builder import LibraryDocumentation
+
+DIRECTORY_EXTENSIONS = (".py", ".resource")
+EXTENSIONS = {"HTML": "html", "XML": "xml", "JSON": "json", "LIBSPEC": "libspec"}
+
+
+def needs_html_docs(format: str, specdocformat: "str | None") -> bool:
+    """Returns ``True`` if documentation must be converted to HTML."""
+    return (
+        format == "HTML"
+        or specdocformat == "HTML"
+        or (format in ("JSON", "LIBSPEC") and specdocformat != "RAW")
+    )
+
+
+class LibdocBatch:
+    """Generates documentation for multiple libraries and resources at once.
+
+    Documentation is generated in parallel processes and written to the
+    output directory. Files are named based on the documented files and, when
+    a directory is documented, the directory structure is preserved.
+    Directories are searched recursively for library (``*.py``) and resource
+    (``*.resource``) files, excluding files and directories starting with
+    an underscore or a dot. If files like ``lib.py`` and ``lib.resource``
+    would get the same output name, their original extensions are preserved
+    (e.g. ``lib.py.html``). Documenting fails for sources that would still be
+    written to an already used output file.
+
+    In addition to the actual outputs, an ``index.json`` file listing all
+    documented libraries and resources is created. With HTML outputs, also
+    an ``index.html`` file linking to all outputs is created. The JSON index
+    contains hashes of the documented files and the used configuration, and
+    files that have not changed since the previous run are not documented
+    again. Only the documented file itself is taken into account, not, for
+    example, other modules a library imports.
+
+    :param output_dir: Directory where to write outputs.
+    :param format: Output format. Possible values are ``'HTML'`` (default),
+        ``'XML'``, ``'JSON'`` and ``'LIBSPEC'``.
+    :param docformat: Documentation source format.
+    :param specdocformat: Documentation format in spec files.
+    :param theme: HTML theme.
+    :param lang: Default language of HTML outputs.
+    :param processes: Maximum number of processes to use. Defaults to
+        the number of CPUs. If the value is ``1``, documentation is generated
+        in the current process.
+
+    Arguments other than ``output_dir`` and ``processes`` have same semantics
+    as the Libdoc command line options with same names.
+
+    Example::
+
+        from robot.libdoc import LibdocBatch
+
+        for item in LibdocBatch('docs').build('libraries', 'resources'):
+            print(item['source'], item['status'])
+
+    New in Robot Framework 7.5.
+    """
+
+    def __init__(
+        self,
+        output_dir: "Path | str",
+        format: str = "HTML",
+        docformat: "str | None" = None,
+        specdocformat: "str | None" = None,
+        theme: "str | None" = None,
+        lang: "str | None" = None,
+        processes: "int | None" = None,
+    ):
+        self.output_dir = Path(output_dir)
+        self.format = format.upper()
+        self.docformat = docformat
+        self.specdocformat = specdocformat
+        self.theme = theme
+        self.lang = lang
+        self.processes = processes or os.cpu_count() or 1
+
+    @property
+    def index(self) -> Path:
+        return self.output_dir / "index.json"
+
+    def build(self, *sources: "Path | str") -> "list[dict[str, Any]]":
+        """Generates documentation for the given libraries and resources.
+
+        Sources can be library names or paths to library or resource files,
+        and paths to directories containing them.
+
+        :return: Index entries as dictionaries. The ``status`` key tells was
+            the source ``'generated'``, ``'unchanged'`` or has generating
+            documentation ``'failed'``. In the last case the ``error`` key
+            contains the error message.
+        """
+        previous = self._read_index()
+        entries = []
+        jobs = []
+        used = {}
+        for source, output in self._get_sources(sources):
+            entry = {"source": source, "output": output.as_posix()}
+            entries.append(entry)
+            # Lower case to avoid overwriting on case-insensitive file systems.
+            key = entry["output"].lower()
+            if key in used:
+                entry.update(
+                    status="failed",
+                    error=f"Output file '{entry['output']}' is already used "
+                    f"by '{used[key]}'.",
+                )
+                continue
+            used[key] = source
+            entry["hash"] = self._get_hash(source)
+            old = previous.get(entry["output"])
+            if (
+                old
+                and entry["hash"]
+                and old.get("hash") == entry["hash"]
+                and (self.output_dir / output).exists()
+            ):
+                entry.update(old, status="unchanged")
+            else:
+                jobs.append((entry, str(self.output_dir / output)))
+        for (entry, _), result in zip(jobs, self._build(jobs)):
+            entry.update(result)
+        self._write_index(entries)
+        return entries
+
+    def _get_sources(self, sources: "Sequence[Path | str]") -> Iterator[tuple]:
+        extension = EXTENSIONS[self.format]
+        found = list(self._find_sources(sources))
+        counts = Counter(base.as_posix().lower() for _, base, _ in found)
+        for source, base, suffix in found:
+            name = base.name
+            if counts[base.as_posix().lower()] > 1:
+                name += suffix
+            yield source, base.with_name(f"{name}.{extension}")
+
+    def _find_sources(self, sources: "Sequence[Path | str]") -> Iterator[tuple]:
+        """Yields sources, their output paths without suffixes and original suffixes."""
+        for source in sources:
+            source = str(source)
+            path = Path(source.split("::")[0])
+            if path.is_dir() and "::" not in source:
+                for file in sorted(path.rglob("*")):
+                    relative = file.relative_to(path)
+                    if self._is_included(relative) and file.is_file():
+                        yield str(file), relative.with_suffix(""), relative.suffix
+            elif path.is_file():
+                yield source, Path(path.stem), path.suffix
+            else:
+                yield source, Path(path.name), ""
+
+    def _is_included(self, path: Path) -> bool:
+        if any(part.startswith(("_", ".")) for part in path.parts):
+            return False
+        return path.suffix.lower() in DIRECTORY_EXTENSIONS
+
+    def _get_hash(self, source: str) -> "str | None":
+        # Libraries given by name are not hashed, because finding their
+        # source would require importing them.
+        path = Path(source.split("::")[0])
+        if not path.is_file():
+            return None
+        digest = hashlib.sha256()
+        config = (
+            VERSION,
+            source,
+            self.format,
+            self.docformat,
+            self.specdocformat,
+            self.theme,
+            self.lang,
+        )
+        digest.update(repr(config).encode("UTF-8"))
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def _build(self, jobs: "list[tuple]") -> "Iterator[dict[str, Any]]":
+        config = (
+            self.format,
+            self.docformat,
+            needs_html_docs(self.format, self.specdocformat),
+            self.theme,
+            self.lang,
+        )
+        args = [(entry["source"], output, *config) for entry, output in jobs]
+        if len(args) < 2 or self.processes < 2:
+            return (_generate(*a) for a in args)
+        with ProcessPoolExecutor(min(self.processes, len(args))) as executor:
+            return list(executor.map(_generate, *zip(*args)))
+
+    def _read_index(self) -> "dict[str, dict[str, Any]]":
+        try:
+            with open(self.index, encoding="UTF-8") as file:
+                entries = json.load(file)["entries"]
+            return {entry["output"]: entry for entry in entries}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _write_index(self, entries: "list[dict[str, Any]]"):
+        # Failed entries are not written to make sure they are retried.
+        entries = [
+            {name: value for name, value in entry.items() if name != "status"}
+            for entry in entries
+            if entry["status"] != "failed"
+        ]
+        with file_writer(self.index, usage="Libdoc index") as file:
+            json.dump({"generator": f"Libdoc {VERSION}", "entries": entries}, file)
+        if self.format == "HTML":
+            html_index = self.output_dir / "index.html"
+            with file_writer(html_index, usage="Libdoc index") as file:
+                file.write(self._get_html_index(entries))
+
+    def _get_html_index(self, entries: "list[dict[str, Any]]") -> str:
+        rows = "\n".join(
+            f'<tr><td><a href="{html_escape(e["output"])}">'
+            f'{html_escape(e["name"])}</a></td>'
+            f'<td>{html_escape(e["type"])}</td>'
+            f'<td>{html_escape(e["version"])}</td></tr>'
+            for e in sorted(entries, key=lambda e: e["name"].lower())
+        )
+        return f"""\
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<title>Keyword documentation</title>
+</head>
+<body>
+<h1>Keyword documentation</h1>
+<table>
+<tr><th>Name</th><th>Type</th><th>Version</th></tr>
+{rows}
+</table>
+</body>
+</html>
+"""
+
+
+def _generate(source, output, format, docformat, convert_to_html, theme, lang):
+    try:
+        libdoc = LibraryDocumentation(source, doc_format=docformat)
+        if convert_to_html:
+            libdoc.convert_docs_to_html()
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        libdoc.save(output, format, theme, lang)
+    except Exception:
+        return {"status": "failed", "error": get_error_message()}
+    return {
+        "status": "generated",
+        "name": libdoc.name,
+        "type": libdoc.type,
+        "version": libdoc.version,
+    }
@@ -14,10 +14,11 @@
 #  limitations under the License.
 
 import copy
+from collections import Counter
 from collections.abc import (
-    Iterator, Mapping, MutableMapping, MutableSequence, Sequence, Set
+    Iterable, Iterator, Mapping, MutableMapping, MutableSequence, Sequence, Set
 )
-from itertools import chain
+from itertools import chain, islice
 from typing import Literal, NoReturn, Union
 
 from robot.api import logger
@@ -618,9 +619,10 @@ class _List:
             ignore_case: Whether to ignore case in comparison."""
         dupes = []
         list_ = Normalizer(ignore_case).normalize(list_)
-        for item in list_:
+        counts = self._count_values(list_)
+        for item in counts or list_:
             if item not in dupes:
-                count = list_.count(item)
+                count = counts[item] if counts else list_.count(item)
                 if count > 1:
                     logger.info(f"'{item}' found {count} times.")
                     dupes.append(item)
@@ -636,6 +638,7 @@ class _List:
         names: "Mapping[int, str] | Sequence[str] | None" = None,
         ignore_order: bool = False,
         ignore_case: bool = False,
+        max_differences: "int | None" = None,
     ):
         """
         Fails if given lists are unequal.
@@ -670,6 +673,7 @@ class _List:
             names: Optional names for indices shown in the error message.
             ignore_order: Whether to ignore the order of elements.
             ignore_case: Whether to ignore case in comparison.
+            max_differences: Maximum number of differences to report.
 
         Examples:
 
@@ -689,7 +693,10 @@ class _List:
         The optional `ignore_order` argument can be used to ignore the order
         of the elements in the lists. Using it requires items to be sortable.
         This option works recursively with nested lists starting from Robot
-        Framework 7.0.
+        Framework 7.0. If the items are also hashable, the error message lists
+        values that are missing from either list, taking into account how many
+        times each value occurs, instead of differences between indices.
+        Reporting missing values is new in Robot Framework 7.5.
 
         Examples:
 
@@ -703,8 +710,17 @@ class _List:
 
         The `ignore_case` argument can be used to make comparison case-insensitive.
         See the [Ignore case] section for more details. This option is new in
-        Robot Framework 7.0."""
+        Robot Framework 7.0.
+
+        The optional `max_differences` argument limits how many differences
+        are included in the error message. This is useful when comparing large
+        lists, for example, rows got from a database. The number of omitted
+        differences is reported at the end of the message. With `ignore_order`,
+        each missing value is considered a difference. The value must not be
+        negative and `0` means no limit. This option is new in Robot Framework
+        7.5."""
         values = deprecate_no_values(values)
+        validate_max_diffs(max_differences)
         len1 = len(list1)
         len2 = len(list2)
         if len1 != len2:
@@ -714,22 +730,69 @@ class _List:
         elif not isinstance(names, Mapping):
             names = dict(zip(range(len1), names))
         normalize = Normalizer(ignore_case, ignore_order=ignore_order).normalize
-        diffs = list(self._yield_list_diffs(normalize(list1), normalize(list2), names))
-        if diffs:
-            report_error("Lists are different:\n" + "\n".join(diffs), msg, values)
+        list1 = list(normalize(list1))
+        list2 = list(normalize(list2))
+        # Comparing whole lists is a lot faster than comparing items one by one.
+        if list1 == list2:
+            return
+        counts1 = self._count_values(list1) if ignore_order else None
+        counts2 = self._count_values(list2) if counts1 is not None else None
+        if counts1 is not None and counts2 is not None:
+            if counts1 == counts2:
+                return
+            diffs = self._yield_multiset_diffs(counts1, counts2, max_differences)
+        else:
+            diffs = self._yield_list_diffs(list1, list2, names)
+            diffs = limit_diffs(diffs, max_differences)
+        report_error("Lists are different:\n" + "\n".join(diffs), msg, values)
 
     def _yield_list_diffs(
         self,
         list1: Sequence,
         list2: Sequence,
         names: "Mapping[int, str]",
-    ) -> "Iterator[str]":
+    ) -> "Iterator[tuple[str, object, object]]":
         for index, (item1, item2) in enumerate(zip(list1, list2)):
+            if item1 == item2:
+                continue
             name = f" ({names[index]})" if index in names else ""
-            try:
-                assert_equal(item1, item2, msg=f"Index {index}{name}")
-            except AssertionError as err:
-                yield str(err)
+            yield f"Index {index}{name}", item1, item2
+
+    def _yield_multiset_diffs(
+        self,
+        counts1: Counter,
+        counts2: Counter,
+        max_differences: "int | None",
+    ) -> "Iterator[str]":
+        limit = max_differences or None
+        omitted = 0
+        for name, missing in [
+            ("first", counts2 - counts1),
+            ("second", counts1 - counts2),
+        ]:
+            items = list(islice(missing.elements(), limit))
+            omitted += sum(missing.values()) - len(items)
+            if limit is not None:
+                limit -= len(items)
+            if items:
+                yield f"Following values are missing from {name} list: {seq2str(items)}"
+        if omitted:
+            yield omitted_diffs(omitted)
+
+    def _get_missing_values(self, list1: ListLike, list2: ListLike) -> list:
+        # Sets make membership checks fast, but not all values are hashable.
+        try:
+            values = set(list1)
+            return [item for item in list2 if item not in values]
+        except TypeError:
+            return [item for item in list2 if item not in list1]
+
+    def _count_values(self, values: Iterable) -> "Counter | None":
+        """Returns values with their counts or `None` if values are unhashable."""
+        try:
+            return Counter(values)
+        except TypeError:
+            return None
 
     def list_should_contain_sub_list(
         self,
@@ -762,7 +825,7 @@ class _List:
         normalize = Normalizer(ignore_case).normalize
         list1 = normalize(list1)
         list2 = normalize(list2)
-        diffs = seq2str([item for item in list2 if item not in list1])
+        diffs = seq2str(self._get_missing_values(list1, list2))
         if diffs:
             report_error(f"Following values are missing: {diffs}", msg, values)
 
@@ -1283,6 +1346,7 @@ class _Dictionary:
         ignore_keys: "Sequence | None" = None,
         ignore_case: IgnoreCase = False,
         ignore_value_order: bool = False,
+        max_differences: "int | None" = None,
     ):
         """
         Fails if the given dictionaries are not equal.
@@ -1304,6 +1368,7 @@ class _Dictionary:
             ignore_keys: Keys to ignore in the comparison.
             ignore_case: Whether to ignore case in comparison.
             ignore_value_order: Whether to ignore order in list-like values.
+            max_differences: Maximum number of differing values to report.
 
         Examples:
 
@@ -1325,8 +1390,13 @@ class _Dictionary:
         The `ignore_value_order` argument can be used to make comparison in case of
         list-like values to ignore the order of the elements in the lists.
         Using it requires items to be sortable.
-        This option is new in Robot Framework 7.2."""
+        This option is new in Robot Framework 7.2.
+
+        The `max_differences` argument limits how many differing values are
+        included in the error message similarly as with [Lists Should Be Equal].
+        This option is new in Robot Framework 7.5."""
         values = deprecate_no_values(values)
+        validate_max_diffs(max_differences)
         normalize = Normalizer(
             ignore_case=ignore_case,
             ignore_keys=ignore_keys,
@@ -1334,8 +1404,12 @@ class _Dictionary:
         ).normalize
         dict1 = normalize(dict1)
         dict2 = normalize(dict2)
+        # Comparing whole dictionaries is a lot faster than comparing values
+        # one by one. Non-dict mappings do not necessarily support that.
+        if isinstance(dict1, dict) and isinstance(dict2, dict) and dict1 == dict2:
+            return
         self._should_have_same_keys(dict1, dict2, msg, values)
-        self._should_have_same_values(dict1, dict2, msg, values)
+        self._should_have_same_values(dict1, dict2, msg, values, max_differences)
 
     def _should_have_same_keys(
         self,
@@ -1362,17 +1436,27 @@ class _Dictionary:
         dict2: Mapping,
         message: "str | None",
         values: bool,
+        max_differences: "int | None" = None,
     ):
-        errors = []
-        for key in dict2:
-            try:
-                assert_equal(dict1[key], dict2[key], msg=f"Key {key}")
-            except AssertionError as err:
-                errors.append(str(err))
+        errors = list(
+            limit_diffs(self._yield_dict_diffs(dict1, dict2), max_differences)
+        )
         if errors:
             error = "\n".join(["Following keys have different values:", *errors])
             report_error(error, message, values)
 
+    def _yield_dict_diffs(
+        self,
+        dict1: Mapping,
+        dict2: Mapping,
+    ) -> "Iterator[tuple[str, object, object]]":
+        for key in dict2:
+            value1 = dict1[key]
+            value2 = dict2[key]
+            if value1 == value2:
+                continue
+            yield f"Key {key}", value1, value2
+
     def dictionary_should_contain_sub_dictionary(
         self,
         dict1: Mapping,
@@ -1612,7 +1696,7 @@ class Collections(_List, _Dictionary):
 
         [re module]: http://docs.python.org/library/re.html
 """
-        matches = self._get_matches(
+        matches = self._iter_matches(
             sequence=list,
             pattern=pattern,
             case_insensitive=case_insensitive,
@@ -1620,7 +1704,7 @@ class Collections(_List, _Dictionary):
             ignore_case=ignore_case,
             ignore_whitespace=ignore_whitespace,
         )
-        if not matches:
+        if not any(True for _ in matches):
             list = seq2str2(list)
             report_error(f"{list} does not contain match for pattern '{pattern}'.", msg)
 
@@ -1648,7 +1732,7 @@ class Collections(_List, _Dictionary):
             whitespace_insensitive: Deprecated. Use `ignore_whitespace` instead.
             ignore_case: Whether to ignore case when matching.
             ignore_whitespace: Whether to ignore whitespace when matching."""
-        matches = self._get_matches(
+        matches = self._iter_matches(
             sequence=list,
             pattern=pattern,
             case_insensitive=case_insensitive,
@@ -1656,7 +1740,7 @@ class Collections(_List, _Dictionary):
             ignore_case=ignore_case,
             ignore_whitespace=ignore_whitespace,
         )
-        if matches:
+        if any(True for _ in matches):
             list = seq2str2(list)
             report_error(f"{list} contains match for pattern '{pattern}'.", msg)
 
@@ -1757,7 +1841,10 @@ class Collections(_List, _Dictionary):
         )
         return len(matches)
 
-    def _get_matches(
+    def _get_matches(self, sequence: Sequence, pattern: str, **config) -> "list[str]":
+        return list(self._iter_matches(sequence, pattern, **config))
+
+    def _iter_matches(
         self,
         sequence: Sequence,
         pattern: str,
@@ -1765,7 +1852,7 @@ class Collections(_List, _Dictionary):
         whitespace_insensitive: "bool | None" = None,
         ignore_case: bool = True,
         ignore_whitespace: bool = False,
-    ) -> "list[str]":
+    ) -> "Iterator[str]":
         # `ignore_xxx` were added in RF 7.0 for consistency reasons.
         # The idea is that they eventually replace `xxx_insensitive`.
         # TODO: Emit deprecation warnings in RF 8.0.
@@ -1787,7 +1874,7 @@ class Collections(_List, _Dictionary):
             spaceless=ignore_whitespace,
             regexp=regexp,
         )
-        return [s for s in sequence if isinstance(s, str) and matcher.match(s)]
+        return (s for s in sequence if isinstance(s, str) and matcher.match(s))
 
 
 def deprecate_no_values(values: "bool | str") -> bool:
@@ -1801,6 +1888,33 @@ def deprecate_no_values(values: "bool | str") -> bool:
     return bool(values)
 
 
+def validate_max_diffs(max_diffs: "int | None"):
+    if max_diffs is not None and max_diffs < 0:
+        raise ValueError(f"'max_differences' cannot be negative, got {max_diffs}.")
+
+
+def limit_diffs(
+    diffs: "Iterator[tuple[str, object, object]]",
+    max_diffs: "int | None",
+) -> "Iterator[str]":
+    """Formats at most `max_diffs` differences and tells how many were omitted.
+
+    Omitted differences are only counted, not formatted.
+    """
+    for name, value1, value2 in islice(diffs, max_diffs or None):
+        try:
+            assert_equal(value1, value2, msg=name)
+        except AssertionError as err:
+            yield str(err)
+    omitted = sum(1 for _ in diffs)
+    if omitted:
+        yield omitted_diffs(omitted)
+
+
+def omitted_diffs(omitted: int) -> str:
+    return f"... and {omitted} more difference{s(omitted)}."
+
+
 def report_error(default: str, message: "str | None", values: bool = False) -> NoReturn:
     if not message:
         message = default
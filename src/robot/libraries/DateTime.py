@@ -382,6 +382,7 @@ def example_keyword(day: datetime, interval: timedelta):
 import datetime
 import sys
 import time
+from functools import lru_cache
 from typing import Literal, overload, Union
 
 from robot.utils import (
@@ -741,18 +742,7 @@ class Date:
     ) -> datetime.datetime:
         if timestamp.upper() in ("TODAY", "NOW"):
             return datetime.datetime.now()
-        if not input_format:
-            timestamp = self._normalize_timestamp(timestamp)
-            input_format = "%Y-%m-%d %H:%M:%S.%f"
-        return datetime.datetime.strptime(timestamp, input_format)
-
-    def _normalize_timestamp(self, timestamp: str) -> str:
-        numbers = "".join(d for d in timestamp if d.isdigit())
-        if not (8 <= len(numbers) <= 20):
-            raise ValueError(f"Invalid timestamp '{timestamp}'.")
-        d = numbers[:8]
-        t = numbers[8:].ljust(12, "0")
-        return f"{d[:4]}-{d[4:6]}-{d[6:8]} {t[:2]}:{t[2:4]}:{t[4:6]}.{t[6:]}"
+        return _parse_timestamp(timestamp, input_format)
 
     def convert(self, format: str, millis: bool = True) -> DateOutput:
         dt = self.datetime
@@ -812,6 +802,25 @@ class Date:
         )
 
 
+@lru_cache(maxsize=1024)
+def _parse_timestamp(timestamp: str, input_format: "str | None") -> datetime.datetime:
+    # Parsing timestamps using `strptime` is relatively slow and same
+    # timestamps are often converted repeatedly.
+    if not input_format:
+        timestamp = _normalize_timestamp(timestamp)
+        input_format = "%Y-%m-%d %H:%M:%S.%f"
+    return datetime.datetime.strptime(timestamp, input_format)
+
+
+def _normalize_timestamp(timestamp: str) -> str:
+    numbers = "".join(d for d in timestamp if d.isdigit())
+    if not (8 <= len(numbers) <= 20):
+        raise ValueError(f"Invalid timestamp '{timestamp}'.")
+    d = numbers[:8]
+    t = numbers[8:].ljust(12, "0")
+    return f"{d[:4]}-{d[4:6]}-{d[6:8]} {t[:2]}:{t[2:4]}:{t[4:6]}.{t[6:]}"
+
+
 class Time:
 
     def __init__(self, time: TimeInput):
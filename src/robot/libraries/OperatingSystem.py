@@ -13,8 +13,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import codecs
 import fnmatch
 import glob
+import io
+import locale
+import mmap
 import os
 import re
 import shutil
@@ -22,14 +26,15 @@ import subprocess
 import tempfile
 import time
 from datetime import datetime, timedelta
-from typing import NoReturn, Sequence
+from typing import Iterable, NoReturn, Sequence
 
 from robot.api import logger
 from robot.api.types import Secret
 from robot.utils import (
-    abspath, ConnectionCache, console_decode, CONSOLE_ENCODING, del_env_var,
-    get_env_var, get_env_vars, get_time, parse_time, plural_or_not as s, PY_VERSION,
-    safe_str, secs_to_timestr, seq2str, set_env_var
+    abspath, compile_pattern, ConnectionCache, console_decode, CONSOLE_ENCODING,
+    del_env_var, FileWatcher, get_env_var, get_env_vars, get_time, parse_time,
+    PATTERN_CACHE, plural_or_not as s, PY_VERSION, safe_str, secs_to_timestr, seq2str,
+    set_env_var
 )
 from robot.version import get_version
 
@@ -137,6 +142,9 @@ class OperatingSystem:
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     ROBOT_LIBRARY_VERSION = __version__
 
+    def __init__(self):
+        self._markers: dict[str, int] = {}
+
     def run(self, command: str) -> str:
         """_This keyword is considered deprecated. Use the
         [http://robotframework.org/robotframework/latest/libraries/Process.html|
@@ -332,23 +340,383 @@ class OperatingSystem:
         are supported by this keyword only with Robot Framework 4.0 and newer.
 
         Support for regular expressions is new in Robot Framework 5.0.
+        Starting from Robot Framework 7.5, lines that cannot match the pattern
+        are typically not decoded at all, which makes searching large files
+        considerably faster. A consequence is that invalid data on such lines
+        does not cause an error even if ``encoding_errors`` is ``strict``.
         """
         path = self._absnorm(path)
-        if not regexp:
-            pattern = fnmatch.translate(f"{pattern}*")
-        reobj = re.compile(pattern)
+        self._link("Reading file '%s'.", path)
+        lines, total, _ = self._grep(path, pattern, encoding, encoding_errors, regexp)
+        self._info(f"{len(lines)} out of {total} lines matched.")
+        return "\n".join(lines)
+
+    def count_matching_lines_in_file(
+        self,
+        path: str,
+        pattern: str,
+        encoding: str = "UTF-8",
+        encoding_errors: str = "strict",
+        regexp: bool = False,
+    ) -> int:
+        """Returns the number of lines in the specified file matching ``pattern``.
+
+        Lines are matched exactly like with `Grep File`, and the meaning of all
+        arguments is the same, but only the number of the matching lines is
+        returned. This avoids creating a possibly huge string when only
+        the number of matches is needed.
+
+        Examples:
+        | ${count} = | Count Matching Lines In File | /var/log/myapp.log | ERROR |
+        | Should Be Equal | ${count} | ${0} |
+
+        New in Robot Framework 7.5.
+        """
+        path = self._absnorm(path)
+        self._link("Reading file '%s'.", path)
+        lines, total, _ = self._grep(path, pattern, encoding, encoding_errors, regexp)
+        self._info(f"{len(lines)} out of {total} lines matched.")
+        return len(lines)
+
+    def set_file_marker(self, path: str) -> int:
+        """Remembers the current end of the specified file.
+
+        `Get Lines Added Since Marker` can be used later to get lines added
+        to the file after this keyword was used. This is convenient, for
+        example, when verifying what an application has logged during a test.
+        If the file does not exist, the marker is set to the beginning of
+        the file.
+
+        Returns the marker, the current size of the file in bytes, as
+        an integer. It can be given to `Get Lines Added Since Marker`
+        explicitly, which allows having multiple markers for the same file.
+
+        Examples:
+        | Set File Marker | /var/log/myapp.log |
+        | Do Something |
+        | ${lines} = | Get Lines Added Since Marker | /var/log/myapp.log |
+
+        New in Robot Framework 7.5.
+        """
+        path = self._absnorm(path)
+        marker = os.path.getsize(path) if os.path.isfile(path) else 0
+        self._markers[path] = marker
+        self._link(f"Set marker of file '%s' to {marker}.", path)
+        return marker
+
+    def get_lines_added_since_marker(
+        self,
+        path: str,
+        pattern: "str | None" = None,
+        encoding: str = "UTF-8",
+        encoding_errors: str = "strict",
+        regexp: bool = False,
+        marker: "int | None" = None,
+        update_marker: bool = True,
+    ) -> str:
+        """Returns lines added to the specified file after `Set File Marker`.
+
+        Only the part of the file after the marker is read, which makes this
+        keyword fast also with huge files. Only complete lines are returned.
+        Possible incomplete last line, that is, a line not followed by
+        a newline, is returned by a later call after it has been completed.
+        If the file is shorter than the marker, it is expected to have
+        been rotated or truncated and it is read from the beginning.
+
+        If the ``pattern`` is given, only lines matching it are returned.
+        The ``pattern``, ``encoding``, ``encoding_errors`` and ``regexp``
+        arguments have the same semantics as with `Grep File`. Lines are
+        returned as a single string concatenated together with newlines
+        similarly as with `Grep File` as well.
+
+        The marker is, by default, the one set by `Set File Marker` with
+        the same file. If no marker has been set, the file is read from
+        the beginning. An explicit marker, for example, a value returned by
+        `Set File Marker` earlier, can be given using the ``marker`` argument.
+        After reading lines, the remembered marker is moved to the end of
+        the last returned line. This can be disabled by giving
+        ``update_marker`` a false value.
+
+        Examples:
+        | Set File Marker | ${LOG} |
+        | Do Something |
+        | ${lines} = | Get Lines Added Since Marker | ${LOG} |
+        | Should Contain | ${lines} | Something done |
+        | Do Something Else |
+        | ${errors} = | Get Lines Added Since Marker | ${LOG} | ERROR |
+        | Should Be Empty | ${errors} |
+
+        New in Robot Framework 7.5.
+        """
+        path = self._absnorm(path)
+        if marker is None:
+            marker = self._markers.get(path, 0)
+        self._link(f"Reading file '%s' starting from {marker}.", path)
+        lines, total, end = self._grep(
+            path, pattern, encoding, encoding_errors, regexp, marker, complete=True
+        )
+        if pattern is None:
+            self._info(f"{total} line{s(total)} added.")
+        else:
+            self._info(f"{len(lines)} out of {total} added lines matched.")
+        if update_marker:
+            self._markers[path] = end
+        return "\n".join(lines)
+
+    def _grep(
+        self,
+        path: str,
+        pattern: "str | None",
+        encoding: str,
+        encoding_errors: str,
+        regexp: bool,
+        start: int = 0,
+        complete: bool = False,
+    ) -> "tuple[list[str], int, int]":
+        """Returns matching lines, total number of lines and end position.
+
+        Files are memory-mapped and, if the encoding allows it, searched for
+        text that all matching lines must contain before decoding any lines.
+        Only candidate lines are decoded and matched against the actual
+        pattern.
+        """
+        if pattern is None:
+            reobj = None
+        elif regexp:
+            reobj = compile_pattern(pattern)
+        else:
+            reobj = PATTERN_CACHE.compile(f"{pattern}*", glob=True)
         encoding = self._map_encoding(encoding)
+        byte_encoding = self._get_byte_encoding(encoding)
+        required = b""
+        if byte_encoding and reobj and encoding_errors == "strict":
+            required = self._get_required_bytes(pattern, reobj, regexp, byte_encoding)
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if start > size:
+                start = 0
+            if start == size:
+                return [], 0, size
+            try:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                data = file.read()
+        try:
+            # Lines can be counted and only complete lines returned without
+            # decoding only if newlines can be detected from bytes.
+            if byte_encoding:
+                encoding = byte_encoding
+                end = self._get_last_line_end(data, start, size) if complete else size
+                total = self._count_lines(data, start, end)
+            else:
+                end = size
+                total = None
+            if required:
+                lines = self._grep_bytes(data, start, end, reobj, required, encoding)
+            elif start == 0 and end == size:
+                lines, count = self._grep_text(path, reobj, encoding, encoding_errors)
+            else:
+                text = io.TextIOWrapper(
+                    io.BytesIO(data[start:end]), encoding, encoding_errors
+                )
+                lines, count = self._match_lines(text, reobj)
+            return lines, count if total is None else total, end
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    def _get_byte_encoding(self, encoding: "str | None") -> "str | None":
+        """Returns the codec name if lines can be handled as bytes.
+
+        Such encodings must encode text the same way regardless of context
+        and must not use newline or carriage return bytes in multibyte
+        characters. Returns ``None`` with other encodings.
+        """
+        if encoding in (None, "locale"):
+            encoding = locale.getpreferredencoding(False)
+        try:
+            name = codecs.lookup(encoding).name
+        except LookupError:
+            return None
+        if name.startswith(("utf-7", "iso2022", "hz")):
+            return None
+        if "\r\n".encode(name) != b"\r\n":
+            return None
+        return name
+
+    def _get_last_line_end(self, data: "mmap.mmap | bytes", start: int, size: int):
+        # Carriage return at the very end may be followed by a newline later.
+        newline = data.rfind(b"\n", start, size)
+        carriage_return = data.rfind(b"\r", start, size - 1)
+        return max(newline, carriage_return, start - 1) + 1
+
+    def _count_lines(self, data: "mmap.mmap | bytes", start: int, end: int) -> int:
+        if start >= end:
+            return 0
+        count = 0
+        chunk_size = 2**24
+        for offset in range(start, end, chunk_size):
+            chunk_end = min(offset + chunk_size, end)
+            chunk = data[offset:chunk_end]
+            count += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+            if chunk.endswith(b"\r") and data[chunk_end : chunk_end + 1] == b"\n":
+                count -= chunk_end < end
+        if data[end - 1 : end] not in (b"\n", b"\r"):
+            count += 1
+        return count
+
+    def _get_required_bytes(
+        self,
+        pattern: str,
+        reobj: "re.Pattern",
+        regexp: bool,
+        encoding: str,
+    ) -> bytes:
+        """Returns bytes that all lines matching the pattern contain.
+
+        Returns empty bytes if such bytes cannot be determined.
+        """
+        if reobj.flags & (re.IGNORECASE | re.VERBOSE):
+            return b""
+        text = self._get_required_text(pattern, regexp)
+        if "\n" in text or "\r" in text:
+            return b""
+        try:
+            return text.encode(encoding)
+        except UnicodeError:
+            return b""
+
+    def _get_required_text(self, pattern: str, regexp: bool) -> str:
+        parts = [""]
+        index = 0
+        if not regexp:
+            while index < len(pattern):
+                char = pattern[index]
+                if char in "*?":
+                    parts.append("")
+                elif char == "[" and self._glob_bracket_end(pattern, index) > 0:
+                    index = self._glob_bracket_end(pattern, index)
+                    parts.append("")
+                else:
+                    parts[-1] += char
+                index += 1
+            return max(parts, key=len)
+        # Regular expressions are analyzed conservatively. Alternatives and
+        # anything inside or after groups or alphanumeric escapes, such as
+        # `\d`, `\x41` and backreferences, are not taken into account.
+        if "|" in pattern:
+            return ""
+        while index < len(pattern):
+            char = pattern[index]
+            if char == "\\":
+                escaped = pattern[index + 1 : index + 2]
+                if not escaped or escaped.isalnum():
+                    break
+                parts[-1] += escaped
+                index += 2
+            elif char in "*?{":
+                parts[-1] = parts[-1][:-1]
+                parts.append("")
+                index = self._regexp_quantifier_end(pattern, index)
+            elif char == "+":
+                parts.append("")
+                index = self._regexp_quantifier_end(pattern, index)
+            elif char == "(":
+                break
+            elif char == "[":
+                parts.append("")
+                index = self._regexp_bracket_end(pattern, index) + 1
+            elif char in ".^$)]":
+                parts.append("")
+                index += 1
+            else:
+                parts[-1] += char
+                index += 1
+        return max(parts, key=len)
+
+    def _glob_bracket_end(self, pattern: str, index: int) -> int:
+        # Same logic as in `fnmatch.translate`. Returns -1 if the bracket
+        # is not closed and thus matches itself.
+        index += 1
+        if pattern[index : index + 1] == "!":
+            index += 1
+        if pattern[index : index + 1] == "]":
+            index += 1
+        return pattern.find("]", index)
+
+    def _regexp_bracket_end(self, pattern: str, index: int) -> int:
+        index += 1
+        if pattern[index : index + 1] == "^":
+            index += 1
+        if pattern[index : index + 1] == "]":
+            index += 1
+        while index < len(pattern) and pattern[index] != "]":
+            index += 2 if pattern[index] == "\\" else 1
+        return index
+
+    def _regexp_quantifier_end(self, pattern: str, index: int) -> int:
+        if pattern[index] == "{":
+            end = pattern.find("}", index)
+            index = end if end > 0 else index
+        index += 1
+        # Lazy and possessive quantifiers like `*?` and `++`.
+        if pattern[index : index + 1] in ("?", "+"):
+            index += 1
+        return index
+
+    def _grep_bytes(
+        self,
+        data: "mmap.mmap | bytes",
+        start: int,
+        end: int,
+        reobj: "re.Pattern",
+        required: bytes,
+        encoding: str,
+    ) -> "list[str]":
         lines = []
-        total_lines = 0
-        self._link("Reading file '%s'.", path)
+        position = start
+        while True:
+            index = data.find(required, position, end)
+            if index < 0:
+                return lines
+            line_start = data.rfind(b"\n", position, index) + 1
+            line_start = max(
+                data.rfind(b"\r", line_start, index) + 1, line_start, position
+            )
+            line_end = data.find(b"\n", index, end)
+            if line_end < 0:
+                line_end = end
+            carriage_return = data.find(b"\r", index, line_end)
+            if carriage_return >= 0:
+                line_end = carriage_return
+            line = data[line_start:line_end].decode(encoding)
+            if reobj.search(line):
+                lines.append(line)
+            position = line_end + (2 if data[line_end : line_end + 2] == b"\r\n" else 1)
+
+    def _grep_text(
+        self,
+        path: str,
+        reobj: "re.Pattern | None",
+        encoding: "str | None",
+        encoding_errors: str,
+    ) -> "tuple[list[str], int]":
         with open(path, encoding=encoding, errors=encoding_errors) as file:
-            for line in file:
-                total_lines += 1
-                line = line.rstrip("\r\n")
-                if reobj.search(line):
-                    lines.append(line)
-            self._info(f"{len(lines)} out of {total_lines} lines matched.")
-            return "\n".join(lines)
+            return self._match_lines(file, reobj)
+
+    def _match_lines(
+        self,
+        lines: "Iterable[str]",
+        reobj: "re.Pattern | None",
+    ) -> "tuple[list[str], int]":
+        matches = []
+        count = 0
+        for line in lines:
+            count += 1
+            line = line.rstrip("\r\n")
+            if reobj is None or reobj.search(line):
+                matches.append(line)
+        return matches, count
 
     def log_file(
         self,
@@ -469,7 +837,7 @@ class OperatingSystem:
 
     def wait_until_removed(
         self,
-        path: str,
+        path: "str | list[str]",
         timeout: "timedelta | None" = timedelta(minutes=1),
     ):
         """Waits until the given file or directory is removed.
@@ -477,30 +845,31 @@ class OperatingSystem:
         The path can be given as an exact path or as a glob pattern.
         See the `Glob patterns` section for details about the supported syntax.
         If the path is a pattern, the keyword waits until all matching
-        items are removed.
+        items are removed. It is also possible to give a list of paths, and
+        then the keyword waits until all of them are removed.
 
         Waits for 1 minute by default, but that can be changed by using the
         ``timeout`` argument. Using a negative value or ``None`` disables the timeout.
 
+        On Linux the keyword uses file system notifications and returns
+        immediately when the path is removed. On other systems the path
+        is checked periodically.
+
         Examples:
         | Wait Until Removed | ${path} |
         | Wait Until Removed | ${path} | 10 seconds |
         | Wait Until Removed | ${path} | timeout=None |
+        | Wait Until Removed | ${paths} | # ${paths} is a list |
 
         Disabling timeout using ``None`` is new in Robot Framework 7.4.
+        Support for multiple paths and using file system notifications
+        are new in Robot Framework 7.5.
         """
-        path = self._absnorm(path)
-        timeout = timeout.total_seconds() if timeout else -1
-        maxtime = time.time() + timeout
-        while self._glob(path):
-            if timeout >= 0 and time.time() > maxtime:
-                self._fail(f"'{path}' was not removed in {secs_to_timestr(timeout)}.")
-            time.sleep(0.1)
-        self._link("'%s' was removed.", path)
+        self._wait_until(path, timeout, "removed")
 
     def wait_until_created(
         self,
-        path: str,
+        path: "str | list[str]",
         timeout: "timedelta | None" = timedelta(minutes=1),
     ):
         """Waits until the given file or directory is created.
@@ -508,27 +877,53 @@ class OperatingSystem:
         The path can be given as an exact path or as a glob pattern.
         See the `Glob patterns` section for details about the supported syntax.
         If the path is a pattern, the keyword returns when an item matching
-        it is created.
+        it is created. It is also possible to give a list of paths, and then
+        the keyword waits until all of them are created.
 
         Waits for 1 minute by default, but that can be changed by using
         the ``timeout`` argument. Using a negative value or ``None`` disables
         the timeout.
 
+        On Linux the keyword uses file system notifications and returns
+        immediately when the path is created. On other systems the path
+        is checked periodically.
+
         Examples:
         | Wait Until Created | ${path} |
         | Wait Until Created | ${path} | 10 seconds |
         | Wait Until Created | ${path} | timeout=None |
+        | Wait Until Created | ${paths} | # ${paths} is a list |
 
         Disabling timeout using ``None`` is new in Robot Framework 7.4.
+        Support for multiple paths and using file system notifications
+        are new in Robot Framework 7.5.
         """
-        path = self._absnorm(path)
+        self._wait_until(path, timeout, "created")
+
+    def _wait_until(
+        self,
+        path: "str | list[str]",
+        timeout: "timedelta | None",
+        action: str,
+    ):
+        paths = [self._absnorm(p) for p in ([path] if isinstance(path, str) else path)]
+        created = action == "created"
         timeout = timeout.total_seconds() if timeout else -1
         maxtime = time.time() + timeout
-        while not self._glob(path):
-            if timeout >= 0 and time.time() > maxtime:
-                self._fail(f"'{path}' was not created in {secs_to_timestr(timeout)}.")
-            time.sleep(0.1)
-        self._link("'%s' was created.", path)
+        with FileWatcher(paths) as watcher:
+            while True:
+                pending = [p for p in paths if bool(self._glob(p)) is not created]
+                if not pending:
+                    break
+                if timeout >= 0 and time.time() > maxtime:
+                    verb = "was" if len(pending) == 1 else "were"
+                    self._fail(
+                        f"{seq2str(pending)} {verb} not {action} in "
+                        f"{secs_to_timestr(timeout)}."
+                    )
+                watcher.wait(maxtime - time.time() if timeout >= 0 else None)
+        for path in paths:
+            self._link(f"'%s' was {action}.", path)
 
     # Dir/file empty
 
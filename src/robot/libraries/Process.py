@@ -13,12 +13,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import mmap
 import os
+import selectors
 import signal as signal_module
 import subprocess
 import sys
 import time
 from collections.abc import Sequence
+from contextlib import contextmanager
 from datetime import timedelta
 from io import IOBase
 from pathlib import Path
@@ -78,6 +81,7 @@ class ProcessResult:
         rc=None,
         output_encoding=None,
         streams_to_close=(),
+        temp_streams=(),
     ):
         self._process = process
         self.stdout_path = self._get_path(stdout)
@@ -92,6 +96,7 @@ class ProcessResult:
             if self._is_custom_stream(stream)
         ]
         self._streams_to_close = streams_to_close
+        self._temp_streams = {stream.name: stream for stream in temp_streams}
 
     def _get_path(self, stream):
         return stream.name if self._is_custom_stream(stream) else None
@@ -126,6 +131,8 @@ class ProcessResult:
         self._stderr = self._read_stream(self.stderr_path, self._process.stderr)
 
     def _read_stream(self, stream_path, stream):
+        if stream_path in self._temp_streams:
+            return self._read_temp_stream(self._temp_streams[stream_path])
         if stream_path:
             stream = open(stream_path, "rb")
         elif not self._is_open(stream):
@@ -139,6 +146,17 @@ class ProcessResult:
                 stream.close()
         return self._format_output(content)
 
+    def _read_temp_stream(self, stream):
+        # Temporary files are memory-mapped so that their content does not
+        # need to be read into memory before decoding it.
+        try:
+            if not os.fstat(stream.fileno()).st_size:
+                return ""
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return self._format_output(content)
+        except (OSError, ValueError):
+            return ""
+
     def _is_open(self, stream):
         return stream and not stream.closed
 
@@ -182,6 +200,7 @@ class ProcessConfiguration:
         self.alias = alias
         self.output_encoding = output_encoding
         self.streams_to_close = []
+        self.temp_streams = []
         self.stdout_stream = self._new_stream(stdout)
         self.stderr_stream = self._get_stderr(stderr, stdout, self.stdout_stream)
         self.stdin_stream = self._get_stdin(stdin)
@@ -191,6 +210,11 @@ class ProcessConfiguration:
     def _new_stream(self, name):
         if not name:
             return subprocess.PIPE
+        if name == "TEMP":
+            # Temporary files are removed when the result object is discarded.
+            stream = NamedTemporaryFile(prefix="robot-process-", suffix=".out")
+            self.temp_streams.append(stream)
+            return stream
         if name == "DEVNULL":
             stream = open(os.devnull, "w", encoding=LOCALE_ENCODING)
         else:
@@ -200,7 +224,7 @@ class ProcessConfiguration:
         return stream
 
     def _get_stderr(self, stderr, stdout, stdout_stream):
-        if stderr and stderr in ["STDOUT", stdout]:
+        if stderr == "STDOUT" or (stderr and stderr == stdout != "TEMP"):
             if stdout_stream == subprocess.PIPE:
                 return subprocess.STDOUT
             return stdout_stream
@@ -301,6 +325,7 @@ class ProcessConfiguration:
             "stdin": self.stdin_stream,
             "output_encoding": self.output_encoding,
             "streams_to_close": tuple(self.streams_to_close),
+            "temp_streams": tuple(self.temp_streams),
         }
 
     def __str__(self):
@@ -370,6 +395,9 @@ class Process:
     - Starting processes on background using the [Start Process] keyword.
     - Waiting started process to complete using [Wait For Process] or
       stopping them with [Terminate Process] or [Terminate All Processes].
+    - Running multiple processes in parallel using [Run Processes] and
+      handling multiple started processes at once using [Wait For Processes]
+      and [Terminate Processes].
 
     This library provides various benefits over using `Run` and other similar
     keywords in the [OperatingSystem] library:
@@ -526,6 +554,16 @@ class Process:
     This way even a huge amount of output cannot cause problems, but naturally
     the output is not available after execution either.
 
+    Yet another option is using a special value `TEMP` that redirects output
+    to an automatically created temporary file. The output is available
+    through the [result object] similarly as normally, and the path to
+    the temporary file is available via its `stdout_path` and `stderr_path`
+    attributes. The output is read from the file only when it is accessed
+    the first time, so large outputs that are not needed do not consume
+    memory. Temporary files are removed automatically when the result object
+    is not used anymore or when [Terminate All Processes] is used.
+    The `TEMP` value is new in Robot Framework 7.5.
+
     Examples:
 
     ```robotframework
@@ -538,10 +576,15 @@ class Process:
 
     Discard output
         ${result} =    Run Process    program    stdout=DEVNULL    stderr=DEVNULL
+
+    Use temporary files
+        ${result} =    Run Process    program    stdout=TEMP    stderr=TEMP
+        Should Contain    ${result.stdout}    Done
     ```
 
-    Note that the created output files are not automatically removed after
-    execution. The user is responsible to remove them if needed.
+    Note that the created output files, excluding temporary files created
+    when using `TEMP`, are not automatically removed after execution.
+    The user is responsible to remove them if needed.
 
     ## Standard input stream
 
@@ -808,6 +851,144 @@ class Process:
         finally:
             self._processes.current = current
 
+    def run_processes(
+        self,
+        *commands: "str | Sequence[str]",
+        max_processes: "int | None" = None,
+        cwd: "str | None" = None,
+        shell: bool = False,
+        stdout: "str | None" = "TEMP",
+        stderr: "str | None" = "TEMP",
+        stdin: Stdin = None,
+        output_encoding: str = "CONSOLE",
+        timeout: "timedelta | None" = None,
+        on_timeout: OnTimeout = "terminate",
+        env: "dict[str, str | Secret] | None" = None,
+        **env_extra: "str | Secret",
+    ) -> "list[ProcessResult | None]":
+        r"""Runs multiple processes in parallel and waits for them to complete.
+
+        Args:
+            *commands: Commands to execute.
+            max_processes: Maximum number of processes to run at the same time.
+              Defaults to the number of CPUs.
+            cwd: Working directory of the processes.
+            shell: Whether to run the commands in a shell.
+            stdout: Standard output configuration.
+            stderr: Standard error configuration.
+            stdin: Process standard input configuration.
+            output_encoding: Encoding for reading command outputs.
+            timeout: Maximum time to wait for each process.
+            on_timeout: Action when timeout occurs.
+            env: Environment variables as a Python dictionary.
+            **env_extra: Override named environment variables using
+                `env:<name>=<value>` syntax.
+
+        Returns:
+            List containing a result object for each command in the same
+            order as the commands. If processes are left running after
+            a timeout, `None` is returned for them.
+
+        Each command can be given either as a list containing the command and
+        its arguments, or as a single string. Strings are split to the command
+        and arguments using the [Split Command Line] keyword unless the commands
+        are run in a shell.
+
+        At most `max_processes` processes are run at the same time. When a
+        process ends, a new one is started until all commands have been run.
+
+        The configuration, including `cwd`, `shell`, `stdin`, `output_encoding`,
+        `env` and `env_extra`, is shared by all processes and it has same
+        semantics as with [Run Process]. Outputs are written to temporary
+        files by default, which avoids problems with large outputs and
+        keeps memory usage low even with many processes. Outputs are available
+        through the returned result objects normally. The `stdout` and `stderr`
+        arguments can be used to change this behavior, but using the same file
+        with all processes is not a good idea.
+
+        The `timeout` applies to each process separately starting from the time
+        it is started. When it is reached, the `on_timeout` action is done
+        similarly as with [Run Process].
+
+        This keyword does not change the [active process].
+
+        Examples:
+
+        ```robotframework
+        *** Test Cases ***
+        Run processes
+            ${results} =    Run Processes    ${command1}    ${command2}    ${command3}
+            Should Be Equal    ${results[0].rc}    0    type=int
+
+        Run processes with concurrency limit and timeout
+            ${results} =    Run Processes    @{commands}    max_processes=10    timeout=1 min
+
+        Run commands given as strings
+            Run Processes    python -c "print('Hi!')"    python script.py
+        ```
+
+        New in Robot Framework 7.5.
+        """
+        config = dict(
+            cwd=cwd,
+            shell=shell,
+            stdout=stdout,
+            stderr=stderr,
+            stdin=stdin,
+            output_encoding=output_encoding,
+            env=env,
+            **env_extra,
+        )
+        max_processes = max_processes or os.cpu_count() or 1
+        timeout = timeout.total_seconds() if timeout else -1
+        logger.info(
+            f"Running {self._count(commands)} with at most {max_processes} "
+            f"in parallel."
+        )
+        pending = list(enumerate(commands))
+        running: dict[subprocess.Popen, tuple[int, "float | None"]] = {}
+        results: "list[ProcessResult | None]" = [None] * len(commands)
+        current = self._processes.current
+        try:
+            while pending or running:
+                while pending and len(running) < max_processes:
+                    index, command = pending.pop(0)
+                    process = self._start_command(command, config)
+                    deadline = time.time() + timeout if timeout > 0 else None
+                    running[process] = (index, deadline)
+                deadlines = [d for _, d in running.values() if d is not None]
+                wait = max(min(deadlines) - time.time(), 0) if deadlines else None
+                self._wait_until_stopped(list(running), wait, first=True)
+                for process, (index, deadline) in list(running.items()):
+                    if process.poll() is not None:
+                        results[index] = self._wait(process)
+                    elif deadline is not None and deadline <= time.time():
+                        logger.info(
+                            f"Process did not complete in {secs_to_timestr(timeout)}."
+                        )
+                        results[index] = self._manage_process_timeout(
+                            process, on_timeout.lower()
+                        )
+                    else:
+                        continue
+                    running.pop(process)
+        except TimeoutExceeded:
+            logger.info("Timeout exceeded.")
+            self._kill(list(running))
+            raise
+        finally:
+            self._processes.current = current
+        return results
+
+    def _start_command(
+        self,
+        command: "str | Sequence[str]",
+        config: "dict[str, object]",
+    ) -> subprocess.Popen:
+        if isinstance(command, str):
+            command = [command] if config["shell"] else self.split_command_line(command)
+        return self.start_process(*command, **config)
+
     def start_process(
         self,
         command: str,
@@ -1047,23 +1228,112 @@ class Process:
         # https://github.com/python/cpython/issues/131064
         if process.stdin and process.stdin.closed:
             process.stdin = None
-        # Timeout is used with communicate() to support Robot's timeouts.
-        while True:
-            try:
-                result.stdout, result.stderr = process.communicate(timeout=0.1)
-            except subprocess.TimeoutExpired:
-                continue
-            except TimeoutExceeded:
-                logger.info("Timeout exceeded.")
-                self._kill(process)
-                raise
+        try:
+            if process.stdin or process.stdout or process.stderr:
+                result.stdout, result.stderr = self._communicate(process)
             else:
-                break
+                self._process_is_stopped(process)
+                process.wait()
+        except TimeoutExceeded:
+            logger.info("Timeout exceeded.")
+            self._kill([process])
+            raise
         result.rc = process.returncode
         result.close_streams()
         logger.info("Process completed.")
         return result
 
+    def _communicate(self, process: subprocess.Popen) -> "tuple[bytes, bytes]":
+        # Timeout is used with communicate() to support Robot's timeouts.
+        while True:
+            try:
+                return process.communicate(timeout=0.1)
+            except subprocess.TimeoutExpired:
+                pass
+
+    def wait_for_processes(
+        self,
+        *handles: Handle,
+        timeout: "timedelta | None" = None,
+        on_timeout: OnTimeout = "continue",
+        until: Literal["all", "first"] = "all",
+    ) -> "list[ProcessResult | None]":
+        """Waits for multiple processes to complete or to reach the given timeout.
+
+        Args:
+            *handles: Process handles or aliases. Uses all processes started
+              by this library by default.
+            timeout: Maximum time to wait for the processes.
+            on_timeout: What to do with processes that are still running
+              when the `timeout` is reached.
+            until: Wait until `all` processes have completed (default) or
+              until the `first` of them completes.
+
+        Returns:
+            List containing a result object for each process in the same order
+            as the processes. Processes that are left running have `None`
+            instead of a result.
+
+        Processes are waited for concurrently. On Linux this keyword returns
+        immediately when processes end, elsewhere the status of the processes
+        is checked periodically.
+
+        The `timeout` and `on_timeout` arguments have same semantics as with
+        the [Wait For Process] keyword. The timeout applies to all processes
+        together, not to each process separately. If processes are terminated
+        or killed, that is done in parallel like with [Terminate Processes].
+
+        When using `until=first`, the keyword returns as soon as any of the
+        processes ends. Other processes that are still running at that point
+        are left running and `None` is returned for them. If none of
+        the processes ends before the timeout, `on_timeout` applies to all
+        of them.
+
+        Examples:
+
+        ```robotframework
+        *** Test Cases ***
+        Wait for all processes
+            ${results} =    Wait For Processes    ${process1}    ${process2}
+            Should Be Equal    ${results[0].rc}    0    type=int
+
+        Wait for all processes started by the library
+            ${results} =    Wait For Processes    timeout=1 minute    on_timeout=kill
+
+        Wait for first process
+            ${results} =    Wait For Processes    @{processes}    until=first
+        ```
+
+        New in Robot Framework 7.5.
+        """
+        processes = self._get_processes(handles)
+        logger.info(f"Waiting for {self._count(processes)} to complete.")
+        timeout = timeout.total_seconds() if timeout else -1
+        first = until.lower() == "first"
+        if timeout <= 0 and not first:
+            return [self._wait(process) for process in processes]
+        running = self._wait_until_stopped(
+            processes, timeout if timeout > 0 else None, first
+        )
+        if running and (not first or len(running) == len(processes)):
+            logger.info(
+                f"{self._count(running)} did not complete in "
+                f"{secs_to_timestr(timeout)}."
+            )
+            on_timeout = on_timeout.lower()
+            if on_timeout == "continue":
+                logger.info("Leaving processes intact.")
+            else:
+                if on_timeout == "kill":
+                    self._kill(running)
+                else:
+                    self._terminate(running)
+                running = []
+        return [None if p in running else self._wait(p) for p in processes]
+
+    def _count(self, processes: Sequence) -> str:
+        return f"{len(processes)} process{'' if len(processes) == 1 else 'es'}"
+
     def terminate_process(
         self,
         handle: Handle = None,
@@ -1107,37 +1377,98 @@ class Process:
             raise RuntimeError(
                 "Terminating processes is not supported by this Python version."
             )
-        terminator = self._kill if kill else self._terminate
-        try:
-            terminator(process)
-        except OSError:
-            if not self._process_is_stopped(process, self.KILL_TIMEOUT):
-                raise
-            logger.debug("Ignored OSError because process was stopped.")
+        if kill:
+            self._kill([process])
+        else:
+            self._terminate([process])
         return self._wait(process)
 
-    def _kill(self, process: subprocess.Popen):
-        logger.info("Forcefully killing process.")
-        if hasattr(os, "killpg"):
-            os.killpg(process.pid, signal_module.SIGKILL)
+    def terminate_processes(
+        self,
+        *handles: Handle,
+        kill: bool = False,
+    ) -> "list[ProcessResult]":
+        """Stops multiple processes gracefully or forcefully in parallel.
+
+        Args:
+            *handles: Process handles or aliases. Uses all processes started
+              by this library by default.
+            kill: Whether to forcefully kill the processes.
+
+        Returns:
+            Result objects in the same order as the processes.
+
+        Raises:
+            RuntimeError: If forceful kill fails.
+
+        Works otherwise like [Terminate Process], but the processes are not
+        stopped one by one. Instead, all of them are first signalled and then
+        they all share the same 30 second grace period. Processes that do not
+        stop during it are killed forcefully. Stopping many processes that do
+        not react to graceful termination thus takes about 30 seconds in total,
+        not 30 seconds per process.
+
+        Examples:
+
+        ```robotframework
+        *** Test Cases ***
+        Terminate processes
+            ${results} =    Terminate Processes    ${process1}    ${process2}    server
+            Should Be Equal    ${results[0].rc}    -15    type=int
+
+        Kill all processes
+            Terminate Processes    kill=True
+        ```
+
+        New in Robot Framework 7.5.
+        """
+        processes = self._get_processes(handles)
+        if kill:
+            self._kill(processes)
         else:
-            process.kill()
-        if not self._process_is_stopped(process, self.KILL_TIMEOUT):
+            self._terminate(processes)
+        return [self._wait(process) for process in processes]
+
+    def _get_processes(self, handles: "Sequence[Handle]") -> "list[subprocess.Popen]":
+        if not handles:
+            return list(self._processes)
+        return [self._processes[handle] for handle in handles]
+
+    def _kill(self, processes: "list[subprocess.Popen]"):
+        for process in processes:
+            logger.info("Forcefully killing process.")
+            self._signal(process, kill=True)
+        if self._wait_until_stopped(processes, self.KILL_TIMEOUT):
             raise RuntimeError("Failed to kill process.")
 
-    def _terminate(self, process: subprocess.Popen):
-        logger.info("Gracefully terminating process.")
-        # Sends signal to the whole process group both on POSIX and on Windows
-        # if supported by the interpreter.
-        if hasattr(os, "killpg"):
-            os.killpg(process.pid, signal_module.SIGTERM)
-        elif hasattr(signal_module, "CTRL_BREAK_EVENT"):
-            process.send_signal(signal_module.CTRL_BREAK_EVENT)
-        else:
-            process.terminate()
-        if not self._process_is_stopped(process, self.TERMINATE_TIMEOUT):
+    def _terminate(self, processes: "list[subprocess.Popen]"):
+        for process in processes:
+            logger.info("Gracefully terminating process.")
+            self._signal(process)
+        # All processes share the same grace period.
+        running = self._wait_until_stopped(processes, self.TERMINATE_TIMEOUT)
+        if running:
             logger.info("Graceful termination failed.")
-            self._kill(process)
+            self._kill(running)
+
+    def _signal(self, process: subprocess.Popen, kill: bool = False):
+        # Sends signal to the whole process group both on POSIX and on Windows
+        # if supported by the interpreter. Killing on Windows only stops
+        # the main process.
+        try:
+            if hasattr(os, "killpg"):
+                signal = signal_module.SIGKILL if kill else signal_module.SIGTERM
+                os.killpg(process.pid, signal)
+            elif kill:
+                process.kill()
+            elif hasattr(signal_module, "CTRL_BREAK_EVENT"):
+                process.send_signal(signal_module.CTRL_BREAK_EVENT)
+            else:
+                process.terminate()
+        except OSError:
+            if not self._process_is_stopped(process, self.KILL_TIMEOUT):
+                raise
+            logger.debug("Ignored OSError because process was stopped.")
 
     def terminate_all_processes(self, kill: bool = False):
         """Terminates all still running processes started by this library.
@@ -1150,12 +1481,13 @@ class Process:
 
         Tries to terminate processes gracefully by default, but can be
         configured to forcefully kill them immediately. See the
-        [Terminate Process] keyword that this keyword uses internally for
-        more details.
+        [Terminate Processes] keyword that this keyword uses internally for
+        more details. Processes are terminated in parallel starting from
+        Robot Framework 7.5.
         """
-        for process in self._processes:
-            if self.is_process_running(process):
-                self.terminate_process(process, kill=kill)
+        running = [process for process in self._processes if process.poll() is None]
+        if running:
+            self.terminate_processes(*running, kill=kill)
         self.__init__()
 
     def send_signal_to_process(
@@ -1364,12 +1696,68 @@ class Process:
         """
         self._processes.switch(handle)
 
-    def _process_is_stopped(self, process: subprocess.Popen, timeout: float) -> bool:
-        stopped = lambda: process.poll() is not None
-        max_time = time.time() + timeout
-        while time.time() <= max_time and not stopped():
-            time.sleep(min(0.1, timeout))
-        return stopped()
+    def _process_is_stopped(
+        self,
+        process: subprocess.Popen,
+        timeout: "float | None" = None,
+    ) -> bool:
+        return not self._wait_until_stopped([process], timeout)
+
+    def _wait_until_stopped(
+        self,
+        processes: "list[subprocess.Popen]",
+        timeout: "float | None" = None,
+        first: bool = False,
+    ) -> "list[subprocess.Popen]":
+        """Waits until all, or the first, of the processes have stopped.
+
+        Returns processes that are still running.
+        """
+        running = lambda: [p for p in processes if p.poll() is None]
+        max_time = time.time() + timeout if timeout is not None else None
+        with self._exit_waiter(processes) as wait:
+            while True:
+                remaining = running()
+                if not remaining or first and len(remaining) < len(processes):
+                    break
+                delay = 0.1 if max_time is None else min(0.1, max_time - time.time())
+                if delay < 0:
+                    break
+                # Waiting in short periods allows Robot's timeouts to work.
+                wait(delay)
+        return running()
+
+    @contextmanager
+    def _exit_waiter(self, processes: "list[subprocess.Popen]"):
+        """Returns a function that waits for any of the processes to exit.
+
+        On Linux the function uses pidfds and returns as soon as a process
+        exits. Elsewhere it sleeps the given time.
+        """
+        if not hasattr(os, "pidfd_open"):
+            yield time.sleep
+            return
+        selector = selectors.DefaultSelector()
+        try:
+            for process in processes:
+                try:
+                    selector.register(os.pidfd_open(process.pid), selectors.EVENT_READ)
+                except OSError:
+                    pass
+            yield lambda delay: self._select(selector, delay)
+        finally:
+            for key in list(selector.get_map().values()):
+                os.close(key.fd)
+            selector.close()
+
+    def _select(self, selector: selectors.BaseSelector, delay: float):
+        # Pidfds of exited processes stay readable and are thus unregistered.
+        if not selector.get_map():
+            time.sleep(delay)
+            return
+        for key, _ in selector.select(delay):
+            selector.unregister(key.fd)
+            os.close(key.fd)
 
     def split_command_line(self, command: str, escaping: bool = False) -> "list[str]":
         """Splits command line string into a list of arguments.
@@ -22,7 +22,9 @@ from typing import Callable, Literal
 
 from robot.api import logger
 from robot.api.deco import library
-from robot.utils import FileReader, parse_re_flags, plural_or_not as s, type_name
+from robot.utils import (
+    compile_pattern, FileReader, parse_re_flags, plural_or_not as s, type_name
+)
 from robot.version import get_version
 
 from .normalizer import Normalizer
@@ -197,7 +199,7 @@ class String:
             splitter, joiner = rb"(\s+)", b""
             exclude = [self._ensure_bytes(e) for e in exclude]
         try:
-            exclude = [re.compile(e) for e in exclude]
+            exclude = [compile_pattern(e) for e in exclude]
         except re.error as err:
             raise ValueError(
                 f"Compiling exclude pattern {err.pattern!r} to a regular expression "
@@ -647,7 +649,7 @@ class String:
         """
         if isinstance(string, bytes):
             pattern = self._ensure_bytes(pattern)
-        regexp = re.compile(pattern, flags=parse_re_flags(flags))
+        regexp = compile_pattern(pattern, parse_re_flags(flags))
         match = regexp.search if partial_match else regexp.fullmatch
         return self._get_matching_lines(string, match)
 
@@ -734,7 +736,7 @@ class String:
         """
         if isinstance(string, bytes):
             pattern = self._ensure_bytes(pattern)
-        regexp = re.compile(pattern, flags=parse_re_flags(flags))
+        regexp = compile_pattern(pattern, parse_re_flags(flags))
         groups = [self._parse_group(g) for g in groups]
         return [m.group(*groups) for m in regexp.finditer(string)]
 
@@ -846,13 +848,8 @@ class String:
         if isinstance(string, bytes):
             pattern = self._ensure_bytes(pattern)
             replace_with = self._ensure_bytes(replace_with)
-        return re.sub(
-            pattern,
-            replace_with,
-            string,
-            count=max(count, 0),
-            flags=parse_re_flags(flags),
-        )
+        regexp = compile_pattern(pattern, parse_re_flags(flags))
+        return regexp.sub(replace_with, string, count=max(count, 0))
 
     def remove_string(
         self,
@@ -14,7 +14,7 @@
 #  limitations under the License.
 
 import inspect
-import re
+import selectors
 import socket
 import struct
 import telnetlib
@@ -29,7 +29,8 @@ except ImportError:
 from robot.api import logger
 from robot.api.deco import keyword
 from robot.utils import (
-    ConnectionCache, is_truthy, secs_to_timestr, seq2str, timestr_to_secs
+    compile_pattern, ConnectionCache, is_truthy, secs_to_timestr, seq2str,
+    timestr_to_secs
 )
 from robot.version import get_version
 
@@ -532,7 +533,7 @@ class TelnetConnection(telnetlib.Telnet):
     NEW_ENVIRON_IS = b"\x00"
     NEW_ENVIRON_VAR = b"\x00"
     NEW_ENVIRON_VALUE = b"\x01"
-    INTERNAL_UPDATE_FREQUENCY = 0.03
+    RECEIVE_BUFFER_SIZE = 65536
 
     def __init__(
         self,
@@ -650,7 +651,7 @@ class TelnetConnection(telnetlib.Telnet):
 
     def _set_prompt(self, prompt, prompt_is_regexp):
         if prompt_is_regexp:
-            self._prompt = (re.compile(prompt), True)
+            self._prompt = (compile_pattern(prompt), True)
         else:
             self._prompt = (prompt, False)
 
@@ -984,69 +985,118 @@ class TelnetConnection(telnetlib.Telnet):
         if self._terminal_emulator:
             return self._terminal_read_until(expected)
         expected = self._encode(expected)
-        output = super().read_until(expected, self._timeout)
-        return output.endswith(expected), self._decode(output)
+        start = 0
 
-    @property
-    def _terminal_frequency(self):
-        return min(self.INTERNAL_UPDATE_FREQUENCY, self._timeout)
+        def find():
+            nonlocal start
+            index = self.cookedq.find(expected, start)
+            if index == -1:
+                # Only the end of the already searched output can contain
+                # the beginning of the match.
+                start = max(len(self.cookedq) - len(expected) + 1, 0)
+                return None
+            return index + len(expected)
+
+        return self._expect(find)
 
     def _terminal_read_until(self, expected):
-        max_time = time.time() + self._timeout
-        output = self._terminal_emulator.read_until(expected)
-        if output:
-            return True, output
-        while time.time() < max_time:
-            output = super().read_until(
-                self._encode(expected), self._terminal_frequency
-            )
-            self._terminal_emulator.feed(self._decode(output))
-            output = self._terminal_emulator.read_until(expected)
-            if output:
-                return True, output
-        return False, self._terminal_emulator.read()
+        return self._terminal_expect(
+            lambda: self._terminal_emulator.read_until(expected)
+        )
 
     def _read_until_regexp(self, *expected):
         self._verify_connection()
+        regexps = [self._to_byte_regexp(e) for e in expected]
         if self._terminal_emulator:
-            return self._terminal_read_until_regexp(expected)
-        expected = [self._encode(e) if isinstance(e, str) else e for e in expected]
-        return self._telnet_read_until_regexp(expected)
-
-    def _terminal_read_until_regexp(self, expected_list):
-        max_time = time.time() + self._timeout
-        regexps_bytes = [self._to_byte_regexp(rgx) for rgx in expected_list]
-        regexps_unicode = [
-            re.compile(self._decode(rgx.pattern)) for rgx in regexps_bytes
-        ]
-        out = self._terminal_emulator.read_until_regexp(regexps_unicode)
-        if out:
-            return True, out
-        while time.time() < max_time:
-            output = self.expect(regexps_bytes, self._terminal_frequency)[-1]
-            self._terminal_emulator.feed(self._decode(output))
-            out = self._terminal_emulator.read_until_regexp(regexps_unicode)
-            if out:
-                return True, out
-        return False, self._terminal_emulator.read()
+            return self._terminal_read_until_regexp(regexps)
+        return self._telnet_read_until_regexp(regexps)
 
-    def _telnet_read_until_regexp(self, expected_list):
-        expected = [self._to_byte_regexp(exp) for exp in expected_list]
-        try:
-            index, _, output = self.expect(expected, self._timeout)
-        except TypeError:
-            index, output = -1, b""
-        return index != -1, self._decode(output)
+    def _terminal_read_until_regexp(self, regexps):
+        regexps = [compile_pattern(self._decode(r.pattern)) for r in regexps]
+        return self._terminal_expect(
+            lambda: self._terminal_emulator.read_until_regexp(regexps)
+        )
+
+    def _telnet_read_until_regexp(self, regexps):
+        def find():
+            for regexp in regexps:
+                match = regexp.search(self.cookedq)
+                if match:
+                    return match.end()
+            return None
+
+        return self._expect(find)
 
     def _to_byte_regexp(self, exp):
         if isinstance(exp, (bytes, bytearray)):
-            return re.compile(exp)
+            return compile_pattern(bytes(exp))
         if isinstance(exp, str):
-            return re.compile(self._encode(exp))
+            return compile_pattern(self._encode(exp))
         pattern = exp.pattern
         if isinstance(pattern, (bytes, bytearray)):
             return exp
-        return re.compile(self._encode(pattern))
+        return compile_pattern(self._encode(pattern))
+
+    def _expect(self, find):
+        """Reads output until ``find`` finds a match or the timeout expires.
+
+        ``find`` is called whenever new output has been received and it must
+        return the end index of the match in ``self.cookedq``, or ``None`` if
+        there is no match. The socket is waited using a selector, so a match
+        is noticed as soon as the matching output is received.
+        """
+        for _ in self._wait_for_output():
+            end = find()
+            if end is not None:
+                output, self.cookedq = self.cookedq[:end], self.cookedq[end:]
+                return True, self._decode(output)
+        return False, self._decode(self.read_very_lazy())
+
+    def _terminal_expect(self, read):
+        for _ in self._wait_for_output():
+            if self.cookedq:
+                self._terminal_emulator.feed(self._decode(self.cookedq))
+                self.cookedq = b""
+            output = read()
+            if output:
+                return True, output
+        return False, self._terminal_emulator.read()
+
+    def _wait_for_output(self):
+        """Yields when output has been received until the timeout expires.
+
+        Yields also once initially to allow using already received output.
+        """
+        max_time = time.monotonic() + self._timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(self, selectors.EVENT_READ)
+            while True:
+                self.process_rawq()
+                yield
+                timeout = max_time - time.monotonic()
+                if self.eof or timeout <= 0 or not selector.select(timeout):
+                    return
+                self.fill_rawq()
+
+    def fill_rawq(self):
+        # Overridden because `telnetlib` reads only 50 bytes at a time.
+        if self.irawq >= len(self.rawq):
+            self.rawq = b""
+            self.irawq = 0
+        data = self.sock.recv(self.RECEIVE_BUFFER_SIZE)
+        self.msg("recv %r", data)
+        self.eof = not data
+        self.rawq += data
+
+    def process_rawq(self):
+        # `telnetlib` processes data byte by byte, which is slow with large
+        # outputs. Data not containing telnet commands can be handled at once.
+        data = self.rawq[self.irawq :]
+        if self.iacseq or self.sb or telnetlib.IAC in data:
+            return super().process_rawq()
+        self.rawq = b""
+        self.irawq = 0
+        self.cookedq += data.replace(telnetlib.theNULL, b"").replace(b"\021", b"")
 
     def read_until_regexp(self, *expected):
         """Reads output until any of the ``expected`` regular expressions match.
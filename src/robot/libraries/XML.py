@@ -14,8 +14,11 @@
 #  limitations under the License.
 
 import copy
+import os
 import re
+from collections import OrderedDict
 from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, NoReturn, TYPE_CHECKING
 from xml.etree import ElementTree as ET
@@ -37,7 +40,7 @@ else:
 
 from robot.api import logger
 from robot.api.deco import library
-from robot.libraries.BuiltIn import BuiltIn
+from robot.libraries.BuiltIn import BuiltIn, register_run_keyword
 from robot.utils import asserts, ETSource, plural_or_not as s
 from robot.version import get_version
 
@@ -159,6 +162,29 @@ class XML:
     than the standard ElementTree and enables using `Evaluate Xpath` keyword.
     It also preserves the doctype and possible namespace prefixes saving XML.
 
+    = Streaming large files =
+
+    Keywords like `Get Element` parse the whole XML document into memory.
+    With very large files that can be slow or even impossible, and
+    `Count Elements In File`, `Element Should Not Exist In File` and
+    `Run Keyword For Each Element In File` can be used instead. They parse
+    the document incrementally and discard elements after they have been
+    processed, so memory usage does not depend on the document size. When
+    `using lxml`, it is also used for parsing incrementally.
+
+    These keywords support only a subset of the xpath syntax:
+
+    - Tag names like ``item`` and paths like ``items/item`` relative to
+      the root element.
+    - The ``*`` wildcard matching any element.
+    - The ``//`` syntax for matching elements on any level below. For example,
+      ``.//item`` matches all ``item`` elements and ``items//name`` matches
+      ``name`` elements anywhere under ``items``.
+    - Attribute predicates like ``item[@id]`` and ``item[@status='failed']``.
+
+    Namespaces are handled the same way as with `Parse XML` by default.
+    Streaming keywords are new in Robot Framework 7.5.
+
     = Example =
 
     The following simple example demonstrates parsing XML and verifying its
@@ -481,7 +507,7 @@ class XML:
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     ROBOT_LIBRARY_VERSION = get_version()
 
-    def __init__(self, use_lxml: bool = False):
+    def __init__(self, use_lxml: bool = False, cache_size: int = 0):
         """Import library with optionally lxml mode enabled.
 
         This library uses Python's standard
@@ -493,6 +519,25 @@ class XML:
         Using lxml requires that the lxml module is installed on the system.
         If lxml mode is enabled but the module is not installed, this library
         emits a warning and reverts back to using the standard ElementTree.
+
+        If ``cache_size`` is given a positive value, documents that keywords
+        other than `Parse XML` parse from files or strings are cached, and
+        at most that many latest documents are kept in the cache. This makes
+        repeated validation of the same large document considerably faster:
+
+        | ${response} =           | Get File                  | response.xml |
+        | Element Text Should Be  | ${response}               | OK           | xpath=status |
+        | Element Should Exist    | ${response}               | items/item   |
+
+        Files are parsed again if their modification time or size changes,
+        and strings are cached based on their content. Elements got from
+        a cached document, for example, by using `Get Element`, are shared with
+        the cache. Modifying them using keywords in this library clears
+        the cache, but they should not be modified otherwise. Keywords modifying
+        XML never modify cached documents when the source is a file or
+        a string, because they parse the source again.
+
+        Caching is new in Robot Framework 7.5.
         """
         if use_lxml and lxml_etree:
             self.etree = lxml_etree  # type: ignore
@@ -508,6 +553,9 @@ class XML:
                 "because lxml module is not installed."
             )
         self._ns_stripper = NameSpaceStripper(self.etree, self.lxml_etree)
+        self._finder = ElementFinder(self.etree, self.modern_etree, self.lxml_etree)
+        self._cache_size = cache_size
+        self._cache: OrderedDict[Any, tuple[Any, Element]] = OrderedDict()
 
     def parse_xml(
         self,
@@ -621,9 +669,43 @@ class XML:
         | Should Be Empty  |  ${children} |        |             |
         """
         if isinstance(source, (str, bytes, Path)):
-            source = self.parse_xml(source)
-        finder = ElementFinder(self.etree, self.modern_etree, self.lxml_etree)
-        return finder.find_all(source, xpath)
+            source = self._parse_cached(source)
+        return self._finder.find_all(source, xpath)
+
+    def _parse_cached(self, source: "str | bytes | Path") -> Element:
+        if not self._cache_size:
+            return self.parse_xml(source)
+        key, stamp = self._get_cache_key(source)
+        if key in self._cache:
+            cached_stamp, root = self._cache[key]
+            if cached_stamp == stamp:
+                self._cache.move_to_end(key)
+                return root
+        root = self.parse_xml(source)
+        self._cache[key] = (stamp, root)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return root
+
+    def _get_cache_key(self, source: "str | bytes | Path") -> "tuple[Any, Any]":
+        if isinstance(source, str) and source.lstrip().startswith("<"):
+            return source, None
+        if isinstance(source, bytes) and source.lstrip().startswith(b"<"):
+            return source, None
+        path = os.path.abspath(source)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return path, None
+        return path, (stat.st_mtime_ns, stat.st_size)
+
+    def _get_modifiable_element(self, source: Source) -> Element:
+        if isinstance(source, (str, bytes, Path)):
+            return self.parse_xml(source)
+        # The element may belong to a cached document.
+        self._cache.clear()
+        return self.get_element(source)
 
     def get_child_elements(self, source: Source, xpath: str = ".") -> "list[Element]":
         """Returns the child elements of the specified element as a list.
@@ -1075,7 +1157,12 @@ class XML:
         element_comparator = ElementComparator(
             comparator, normalizer, sorter, exclude_children
         )
-        element_comparator.compare(self.get_element(source), self.get_element(expected))
+        # Sorting children modifies elements.
+        if sort_children:
+            get_element = self._get_modifiable_element
+        else:
+            get_element = self.get_element
+        element_comparator.compare(get_element(source), get_element(expected))
 
     def _sort_children(self, element: Element):
         tails = [child.tail for child in element]
@@ -1101,7 +1188,7 @@ class XML:
         Can only set the tag of a single element. Use `Set Elements Tag` to set
         the tag of multiple elements in one call.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         self.get_element(source, xpath).tag = tag
         return source
 
@@ -1111,7 +1198,7 @@ class XML:
         Like `Set Element Tag` but sets the tag of all elements matching
         the given ``xpath``.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         for elem in self.get_elements(source, xpath):
             self.set_element_tag(elem, tag)
         return source
@@ -1145,7 +1232,7 @@ class XML:
         Can only set the text/tail of a single element. Use `Set Elements Text`
         to set the text/tail of multiple elements in one call.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         element = self.get_element(source, xpath)
         if text is not None:
             element.text = text
@@ -1165,7 +1252,7 @@ class XML:
         Like `Set Element Text` but sets the text or tail of all elements
         matching the given ``xpath``.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         for elem in self.get_elements(source, xpath):
             self.set_element_text(elem, text, tail)
         return source
@@ -1199,7 +1286,7 @@ class XML:
         """
         if not name:
             raise RuntimeError("Attribute name can not be empty.")
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         self.get_element(source, xpath).attrib[name] = value
         return source
 
@@ -1215,7 +1302,7 @@ class XML:
         Like `Set Element Attribute` but sets the attribute of all elements
         matching the given ``xpath``.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         for elem in self.get_elements(source, xpath):
             self.set_element_attribute(elem, name, value)
         return source
@@ -1244,7 +1331,7 @@ class XML:
         Can only remove an attribute from a single element. Use `Remove Elements
         Attribute` to remove an attribute of multiple elements in one call.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         attrib = self.get_element(source, xpath).attrib
         if name in attrib:
             attrib.pop(name)
@@ -1261,7 +1348,7 @@ class XML:
         Like `Remove Element Attribute` but removes the attribute of all
         elements matching the given ``xpath``.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         for elem in self.get_elements(source, xpath):
             self.remove_element_attribute(elem, name)
         return source
@@ -1284,7 +1371,7 @@ class XML:
         Can only remove attributes from a single element. Use `Remove Elements
         Attributes` to remove all attributes of multiple elements in one call.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         self.get_element(source, xpath).attrib.clear()
         return source
 
@@ -1294,7 +1381,7 @@ class XML:
         Like `Remove Element Attributes` but removes all attributes of all
         elements matching the given ``xpath``.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         for elem in self.get_elements(source, xpath):
             self.remove_element_attributes(elem)
         return source
@@ -1332,7 +1419,7 @@ class XML:
 
         Use `Remove Element` or `Remove Elements` to remove elements.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         parent = self.get_element(source, xpath)
         element = self.copy_element(element)
         if index is None:
@@ -1367,7 +1454,7 @@ class XML:
         | Remove Element           | ${XML} | xpath=html/p/b | remove_tail=yes |
         | Element Text Should Be   | ${XML} | Text with italics. | xpath=html/p | normalize_whitespace=yes |
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         self._remove_element(source, self.get_element(source, xpath), remove_tail)
         return source
 
@@ -1395,7 +1482,7 @@ class XML:
         | Element Should Not Exist | ${XML} | xpath=second/child |
         | Element Should Not Exist | ${XML} | xpath=third/child  |
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         for element in self.get_elements(source, xpath):
             self._remove_element(source, element, remove_tail)
         return source
@@ -1457,7 +1544,7 @@ class XML:
 
         Use `Remove Element` to remove the whole element.
         """
-        source = self.get_element(source)
+        source = self._get_modifiable_element(source)
         element = self.get_element(source, xpath)
         tail = element.tail
         element.clear()
@@ -1558,6 +1645,7 @@ class XML:
         """
         path = path.absolute()
         elem = self.get_element(source)
+        self._cache.pop(os.path.abspath(path), None)
         tree = self.etree.ElementTree(elem)
         config: dict[str, object] = {"encoding": encoding}
         if self.modern_etree:
@@ -1606,6 +1694,125 @@ class XML:
             raise RuntimeError("'Evaluate Xpath' keyword only works in lxml mode.")
         return self.get_element(source, context).xpath(expression)  # type: ignore
 
+    def count_elements_in_file(self, source: Source, xpath: str = ".") -> int:
+        """Returns and logs how many elements the ``xpath`` matches in a file.
+
+        Like `Get Element Count` but the ``source`` is parsed incrementally
+        and elements are discarded after they have been processed. This allows
+        handling files that are too large to be parsed into memory at once.
+        The ``source`` can be a path to an XML file or a string containing
+        XML. Only a subset of the xpath syntax is supported. See
+        `Streaming large files` for more details.
+
+        Examples:
+        | ${count} = | Count Elements In File | ${CURDIR}/export.xml | .//item |
+        | ${count} = | Count Elements In File | ${CURDIR}/export.xml | items/item[@status='failed'] |
+
+        New in Robot Framework 7.5.
+        """
+        count = sum(1 for _ in self._iter_elements(source, xpath))
+        logger.info(f"{count} element{s(count)} matched '{xpath}'.")
+        return count
+
+    def element_should_not_exist_in_file(
+        self,
+        source: Source,
+        xpath: str = ".",
+        message: "str | None" = None,
+    ):
+        """Verifies that no element matches the ``xpath`` in a file.
+
+        Like `Element Should Not Exist` but the ``source`` is parsed
+        incrementally similarly as with `Count Elements In File`. Parsing is
+        stopped when the first matching element is found. The default error
+        message can be overridden with the ``message`` argument.
+
+        Examples:
+        | Element Should Not Exist In File | ${CURDIR}/export.xml | .//error |
+
+        New in Robot Framework 7.5.
+        """
+        for _ in self._iter_elements(source, xpath):
+            raise AssertionError(message or f"Element matching '{xpath}' found.")
+
+    def run_keyword_for_each_element_in_file(
+        self,
+        source: Source,
+        xpath: str,
+        name: str,
+        *args,
+    ) -> int:
+        """Runs the specified keyword for each element matching ``xpath``.
+
+        The ``source`` is parsed incrementally similarly as with `Count
+        Elements In File`, and the keyword ``name`` is run each time a matching
+        element has been fully parsed. The element is given to the keyword as
+        the first argument and possible ``args`` after it. Elements are
+        discarded after the keyword has been run, so the whole document is
+        never in memory at the same time. Elements are handled in the document
+        order based on where they end. Returns the number of matching elements.
+
+        Examples:
+        | Run Keyword For Each Element In File | ${CURDIR}/export.xml | .//item | Validate Item |
+        | Run Keyword For Each Element In File | ${CURDIR}/export.xml | items/item | `Element Attribute Should Be` | status | passed |
+
+        New in Robot Framework 7.5.
+        """
+        count = 0
+        for element in self._iter_elements(source, xpath):
+            BuiltIn().run_keyword(name, element, *args)
+            count += 1
+        logger.info(f"{count} element{s(count)} matched '{xpath}'.")
+        return count
+
+    def _iter_elements(self, source: Source, xpath: str) -> "Iterator[Element]":
+        # Namespaces are stripped when elements start so that matching works
+        # the same way as with parsed documents. Elements are detached from
+        # their parents when they end, unless they are inside a matching
+        # element, to keep memory usage bounded.
+        path = StreamingPath(xpath)
+        config: dict[str, object] = {"events": ("start", "end")}
+        if self.lxml_etree:
+            config.update(remove_comments=True, remove_pis=True)
+        stack = []
+        matches = []
+        namespaces: list["str | None"] = [None]
+        open_matches = 0
+        with ETSource(source) as source_:
+            for event, elem in self.etree.iterparse(source_, **config):
+                if event == "start":
+                    namespaces.append(self._strip_namespace(elem, namespaces[-1]))
+                    stack.append(elem)
+                    matched = path.match(stack[1:])
+                    matches.append(matched)
+                    open_matches += matched
+                    continue
+                stack.pop()
+                namespaces.pop()
+                if matches.pop():
+                    open_matches -= 1
+                    yield elem
+                if stack and not open_matches:
+                    del stack[-1][-1]
+
+    def _strip_namespace(self, elem: Element, current_ns: "str | None"):
+        if elem.tag.startswith("{") and "}" in elem.tag:
+            ns, elem.tag = elem.tag[1:].split("}", 1)
+        else:
+            ns = None
+        if ns != current_ns:
+            elem.attrib["xmlns"] = ns or ""
+        return ns
+
+
+# Arguments passed to the executed keyword must not be resolved twice.
+register_run_keyword(
+    "XML",
+    "run_keyword_for_each_element_in_file",
+    args_to_process=2,
+    deprecation_warning=False,
+)
+
 
 class NameSpaceStripper:
 
@@ -1660,6 +1867,9 @@ class ElementFinder:
         self.etree = etree
         self.modern = modern
         self.lxml = lxml
+        # ElementTree caches compiled paths itself, lxml does not.
+        if lxml:
+            self._compile = lru_cache(maxsize=256)(etree.ETXPath)
 
     def find_all(self, elem: Element, xpath: str) -> "list[Element]":
         xpath = self._get_xpath(xpath)
@@ -1667,7 +1877,7 @@ class ElementFinder:
             return [elem]
         if not self.lxml:
             return elem.findall(xpath)
-        finder = self.etree.ETXPath(xpath)  # type: ignore
+        finder = self._compile(xpath)
         return finder(elem)
 
     def _get_xpath(self, xpath: str) -> str:
@@ -1687,6 +1897,89 @@ class ElementFinder:
             return xpath
 
 
+class StreamingPath:
+    """Matches elements against a simple xpath while parsing incrementally.
+
+    Supports tag names, the ``*`` wildcard, the ``//`` descendant axis and
+    attribute predicates like ``[@name]`` and ``[@name='value']``.
+    """
+
+    # Names with namespace prefixes, as well as steps like `@attr` or `text()`,
+    # are not valid tags and must not silently match nothing.
+    _name = r"(?![\d.-])[\w.-]+"
+    _step = re.compile(
+        rf"""(\*|{_name})((?:\[@{_name}(?:=(?:'[^']*'|"[^"]*"))?\])*)$"""
+    )
+    _predicate = re.compile(rf"""\[@({_name})(?:=('[^']*'|"[^"]*"))?\]""")
+
+    def __init__(self, xpath: str):
+        if not xpath:
+            raise RuntimeError("No xpath given.")
+        self.xpath = xpath
+        self.steps = self._parse(xpath)
+        self._last_tag = self.steps[-1][0] if self.steps else None
+
+    def _parse(self, xpath: str) -> list:
+        if xpath == ".":
+            return []
+        steps = []
+        if xpath.startswith(".//"):
+            steps.append(None)
+            xpath = xpath[3:]
+        elif xpath.startswith("./"):
+            xpath = xpath[2:]
+        for part in xpath.split("//"):
+            for step in part.split("/"):
+                steps.append(self._parse_step(step))
+            steps.append(None)
+        return steps[:-1]
+
+    def _parse_step(self, step: str) -> tuple:
+        match = self._step.match(step)
+        if not match:
+            self._unsupported()
+        predicates = [
+            (name, value[1:-1] if value else None)
+            for name, value in self._predicate.findall(match.group(2))
+        ]
+        return match.group(1), predicates
+
+    def _unsupported(self):
+        raise RuntimeError(
+            f"Xpath '{self.xpath}' is not supported when parsing incrementally."
+        )
+
+    def match(self, elements: "list[Element]") -> bool:
+        # Fast path for the common case where the tag does not match.
+        if self._last_tag not in (None, "*") and elements[-1:]:
+            if elements[-1].tag != self._last_tag:
+                return False
+        return self._match(self.steps, elements)
+
+    def _match(self, steps: list, elements: "list[Element]") -> bool:
+        if not steps:
+            return not elements
+        if steps[0] is None:
+            return any(
+                self._match(steps[1:], elements[index:])
+                for index in range(len(elements))
+            )
+        if not elements or not self._match_step(steps[0], elements[0]):
+            return False
+        return self._match(steps[1:], elements[1:])
+
+    def _match_step(self, step: tuple, element: Element) -> bool:
+        tag, predicates = step
+        if tag != "*" and tag != element.tag:
+            return False
+        for name, value in predicates:
+            if value is None and name not in element.attrib:
+                return False
+            if value is not None and element.attrib.get(name) != value:
+                return False
+        return True
+
+
 class Location:
 
     def __init__(self, path: str, is_root: bool = True):
@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from .stats import SuiteStat
 from .suitestatistics import SuiteStatistics, SuiteStatisticsBuilder
 from .tagstatistics import TagStatistics, TagStatisticsBuilder
 from .totalstatistics import TotalStatistics, TotalStatisticsBuilder
@@ -24,11 +25,16 @@ class Statistics:
 
     Accepted parameters have the same semantics as the matching command line
     options.
+
+    If ``suite`` is not given, statistics can be built incrementally using
+    :meth:`start_suite`, :meth:`add_test` and :meth:`end_suite`. This is
+    used during execution to have up-to-date statistics available without
+    walking through the whole suite structure.
     """
 
     def __init__(
         self,
-        suite,
+        suite=None,
         suite_stat_level=-1,
         tag_stat_include=None,
         tag_stat_exclude=None,
@@ -38,7 +44,7 @@ class Statistics:
         rpa=False,
     ):
         total_builder = TotalStatisticsBuilder(rpa=rpa)
-        suite_builder = SuiteStatisticsBuilder(suite_stat_level)
+        self._suite_builder = SuiteStatisticsBuilder(suite_stat_level)
         tag_builder = TagStatisticsBuilder(
             tag_stat_include,
             tag_stat_exclude,
@@ -46,11 +52,42 @@ class Statistics:
             tag_doc,
             tag_stat_link,
         )
-        suite.visit(StatisticsBuilder(total_builder, suite_builder, tag_builder))
+        self._builder = StatisticsBuilder(
+            total_builder, self._suite_builder, tag_builder
+        )
+        if suite is not None:
+            suite.visit(self._builder)
         self.total: TotalStatistics = total_builder.stats
-        self.suite: SuiteStatistics = suite_builder.stats
         self.tags: TagStatistics = tag_builder.stats
 
+    @property
+    def suite(self) -> "SuiteStatistics | None":
+        return self._suite_builder.stats
+
+    @property
+    def current_suite(self) -> "SuiteStat | None":
+        """Statistics of the suite that has been started but not yet ended.
+
+        Contains statistics of tests added to the suite itself and to its child
+        suites that have already been ended. ``None`` if there is no such suite.
+        """
+        current = self._suite_builder.current
+        return current.stat if current else None
+
+    def start_suite(self, suite):
+        """Start collecting statistics for the given suite and its tests."""
+        self._builder.start_suite(suite)
+
+    def add_test(self, test):
+        """Add the given test to total, suite and tag statistics."""
+        self._builder.visit_test(test)
+
+    def end_suite(self, suite):
+        """End collecting statistics for the given suite."""
+        # Elapsed time is not known when the suite is started.
+        self.current_suite.elapsed = suite.elapsed_time
+        self._builder.end_suite(suite)
+
     def to_dict(self):
         return {
             "total": self.total.stat.get_attributes(include_label=True),
@@ -15,17 +15,19 @@
 from abc import ABC, abstractmethod
 from typing import Iterable, Iterator, overload, Sequence
 
-from robot.utils import Matcher, normalize, NormalizedDict
+from robot.utils import Matcher, MultiMatcher, normalize, NormalizedDict
 
 
 class Tags(Sequence[str]):
-    __slots__ = ("_tags", "_reserved")
+    __slots__ = ("_tags", "_reserved", "_normalized")
 
     def __init__(self, tags: Iterable[str] = ()):
         if isinstance(tags, Tags):
             self._tags, self._reserved = tags._tags, tags._reserved
+            self._normalized = tags._normalized
         else:
             self._tags, self._reserved = self._init_tags(tags)
+            self._normalized = None
 
     def robot(self, name: str) -> bool:
         """Check do tags contain a reserved tag in format `robot:<name>`.
@@ -122,6 +124,7 @@ class TagPatterns(Sequence["TagPattern"]):
 
     def __init__(self, patterns: Iterable[str] = (), usage: "str | None" = None):
         self._patterns = tuple(TagPattern.from_string(p, usage) for p in Tags(patterns))
+        self._matcher = AnyTagPatternMatcher(self._patterns)
 
     @property
     def is_constant(self):
@@ -130,8 +133,7 @@ class TagPatterns(Sequence["TagPattern"]):
     def match(self, tags: Iterable[str]) -> bool:
         if not self._patterns:
             return False
-        tags = normalize_tags(tags)
-        return any(p.match(tags) for p in self._patterns)
+        return self._matcher.match(normalize_tags(tags))
 
     def __contains__(self, tag: str) -> bool:
         return self.match(tag)
@@ -248,6 +250,10 @@ class SingleTagPattern(TagPattern):
         # Preserve original patter mostly for string representation purposes.
         self._pattern = pattern.strip()
 
+    @property
+    def normalized_pattern(self) -> str:
+        return self._matcher.pattern
+
     @property
     def is_constant(self):
         pattern = self._pattern
@@ -287,10 +293,10 @@ class OrTagPattern(TagPattern):
 
     def __init__(self, patterns: Iterable[str]):
         self._patterns = tuple(TagPattern.from_string(p) for p in patterns)
+        self._matcher = AnyTagPatternMatcher(self._patterns)
 
     def match(self, tags: Iterable[str]) -> bool:
-        tags = normalize_tags(tags)
-        return any(p.match(tags) for p in self._patterns)
+        return self._matcher.match(normalize_tags(tags))
 
     def __iter__(self) -> Iterator["TagPattern"]:
         return iter(self._patterns)
@@ -319,10 +325,40 @@ class NotTagPattern(TagPattern):
         return " NOT ".join(str(pattern) for pattern in self).lstrip()
 
 
+class AnyTagPatternMatcher:
+    """Matches tags against multiple patterns.
+
+    Single tag patterns are combined and matched using one regular expression,
+    which is considerably faster than matching them one by one.
+    """
+
+    def __init__(self, patterns: Iterable[TagPattern]):
+        single = []
+        others = []
+        for pattern in patterns:
+            if isinstance(pattern, SingleTagPattern):
+                single.append(pattern.normalized_pattern)
+            else:
+                others.append(pattern)
+        self._single = MultiMatcher(single, caseless=False, spaceless=False)
+        self._others = tuple(others)
+
+    def match(self, tags: "NormalizedTags") -> bool:
+        if self._single.match_any(tags):
+            return True
+        return any(p.match(tags) for p in self._others)
+
+
 def normalize_tags(tags: Iterable[str]) -> Iterable[str]:
     """Performance optimization to normalize tags only once."""
     if isinstance(tags, NormalizedTags):
         return tags
+    if isinstance(tags, Tags):
+        # Normalized tags are cached to avoid normalizing them again when
+        # the same tags are matched against multiple patterns.
+        if tags._normalized is None:
+            tags._normalized = NormalizedTags([normalize(t, ignore="_") for t in tags])
+        return tags._normalized
     if isinstance(tags, str):
         tags = [tags]
     return NormalizedTags([normalize(t, ignore="_") for t in tags])
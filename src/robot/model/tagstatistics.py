@@ -50,6 +50,10 @@ class TagStatisticsBuilder:
         self._reserved = TagPatterns("robot:*")
         self._info = TagStatInfo(docs, links)
         self.stats = TagStatistics(self._info.get_combined_stats(combined))
+        # Tags are typically shared by many tests. Caching stats based on
+        # the original tags avoids matching same tags repeatedly.
+        self._stats_by_tag = {}
+        self._combined_by_tags = {}
 
     def add_test(self, test):
         self._add_tags_to_statistics(test)
@@ -57,10 +61,19 @@ class TagStatisticsBuilder:
 
     def _add_tags_to_statistics(self, test):
         for tag in test.tags:
-            if self._is_included(tag) and not self._suppress_reserved(tag):
-                if tag not in self.stats.tags:
-                    self.stats.tags[tag] = self._info.get_stat(tag)
-                self.stats.tags[tag].add_test(test)
+            if tag in self._stats_by_tag:
+                stat = self._stats_by_tag[tag]
+            else:
+                stat = self._stats_by_tag[tag] = self._get_stat(tag)
+            if stat is not None:
+                stat.add_test(test)
+
+    def _get_stat(self, tag):
+        if not self._is_included(tag) or self._suppress_reserved(tag):
+            return None
+        if tag not in self.stats.tags:
+            self.stats.tags[tag] = self._info.get_stat(tag)
+        return self.stats.tags[tag]
 
     def _is_included(self, tag):
         if self._included and tag not in self._included:
@@ -71,9 +84,14 @@ class TagStatisticsBuilder:
         return tag in self._reserved and tag not in self._included
 
     def _add_to_combined_statistics(self, test):
-        for stat in self.stats.combined:
-            if stat.match(test.tags):
-                stat.add_test(test)
+        key = tuple(test.tags)
+        if key in self._combined_by_tags:
+            stats = self._combined_by_tags[key]
+        else:
+            stats = [stat for stat in self.stats.combined if stat.match(test.tags)]
+            self._combined_by_tags[key] = stats
+        for stat in stats:
+            stat.add_test(test)
 
 
 class TagStatInfo:
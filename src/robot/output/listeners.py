@@ -16,6 +16,7 @@
 import os.path
 from abc import ABC
 from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
 
 from robot.errors import DataError
@@ -85,18 +86,40 @@ class LibraryListeners(Listeners):
     def discard_suite_scope(self):
         self._listeners.pop()
 
-    def register(self, library):
-        listeners = self._import_listeners(library.listeners, library=library)
+    def register(self, library, listeners: "list[ListenerFacade] | None" = None):
+        """Registers listeners of the given library.
+
+        Listeners returned earlier by :meth:`unregister` can be given to
+        avoid importing them again.
+        """
+        if listeners is None:
+            listeners = self._import_listeners(library.listeners, library=library)
         self._listeners[-1].extend(listeners)
 
-    def unregister(self, library, close=False):
+    def unregister(self, library, close=False) -> "list[ListenerFacade]":
         remaining = []
+        removed = []
         for listener in self._listeners[-1]:
             if listener.library is not library:
                 remaining.append(listener)
-            elif close:
-                listener.close()
+            else:
+                removed.append(listener)
+                if close:
+                    listener.close()
         self._listeners[-1] = remaining
+        return removed
+
+
+@lru_cache(maxsize=None)
+def _get_method_names(name: str, library: bool) -> "tuple[str, ...]":
+    if "_" in name:
+        first, *rest = name.split("_")
+        names = (name, "".join([first] + [part.capitalize() for part in rest]))
+    else:
+        names = (name,)
+    if library:
+        names += tuple("_" + name for name in names)
+    return names
 
 
 class ListenerFacade(LoggerApi, ABC):
@@ -173,14 +196,7 @@ class ListenerFacade(LoggerApi, ABC):
         return fallback or ListenerMethod(None, self.name)
 
     def _get_method_names(self, name):
-        names = [name, self._to_camelCase(name)] if "_" in name else [name]
-        if self.library is not None:
-            names += ["_" + name for name in names]
-        return names
-
-    def _to_camelCase(self, name):
-        first, *rest = name.split("_")
-        return "".join([first] + [part.capitalize() for part in rest])
+        return _get_method_names(name, self.library is not None)
 
 
 class ListenerV3Facade(ListenerFacade):
@@ -59,8 +59,11 @@ class Output(AbstractLogger, LoggerApi):
     def delayed_logging_paused(self):
         return self.output_file.delayed_logging_paused
 
-    def close(self, result):
-        self.output_file.statistics(result.statistics)
+    def close(self, result, statistics=None):
+        # Statistics collected during execution avoid walking the result tree.
+        if statistics is None:
+            statistics = result.statistics
+        self.output_file.statistics(statistics)
         self.output_file.close()
         LOGGER.unregister_output_file()
         LOGGER.output_file(self._settings["Output"])
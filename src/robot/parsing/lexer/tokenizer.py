@@ -25,14 +25,14 @@ class Tokenizer:
 
     def tokenize(self, data: str, data_only: bool = False) -> "Iterator[list[Token]]":
         current: list[Token] = []
+        tokenize_line = self._tokenize_line
         for lineno, line in enumerate(data.splitlines(not data_only), start=1):
-            tokens = self._tokenize_line(line, lineno, not data_only)
-            tokens, starts_new = self._cleanup_tokens(tokens, data_only)
+            tokens, starts_new = tokenize_line(line, lineno, data_only)
             if starts_new:
                 if current:
                     yield current
                 current = tokens
-            else:
+            elif tokens:
                 current.extend(tokens)
         yield current
 
@@ -40,111 +40,100 @@ class Tokenizer:
         self,
         line: str,
         lineno: int,
-        include_separators: bool,
-    ) -> "list[Token]":
-        # Performance optimized code.
+        data_only: bool,
+    ) -> "tuple[list[Token], bool]":
+        # Performance optimized code. Cell values are classified first and
+        # tokens are created only for values that are actually returned.
+        content = line.rstrip()
+        if not content:
+            if data_only:
+                return [], False
+            return [Token(Token.EOL, line, lineno, 0)], False
+        if content[0] == "|" and content[:2].strip() == "|":
+            values = self._split_from_pipes(content)
+            first_data = 1
+        else:
+            values = self._space_splitter.split(content)
+            first_data = 0
+        if first_data or "#" in content or "..." in content:
+            return self._tokenize_values(values, first_data, lineno, data_only, line)
+        # Common case without pipes, comments and continuation. All values are
+        # used and the last value is never empty because the line is stripped.
+        types = (None, Token.SEPARATOR)
         tokens = []
         append = tokens.append
         offset = 0
-        if line[:1] == "|" and line[:2].strip() == "|":
-            splitter = self._split_from_pipes
-        else:
-            splitter = self._split_from_spaces
-        for value, is_data in splitter(line.rstrip()):
+        for index, value in enumerate(values):
+            if not (data_only and index & 1):
+                append(Token(types[index & 1], value, lineno, offset))
+            offset += len(value)
+        if not data_only:
+            append(Token(Token.EOL, line[offset:], lineno, offset))
+        return tokens, True
+
+    def _tokenize_values(
+        self,
+        values: "list[str]",
+        first_data: int,
+        lineno: int,
+        data_only: bool,
+        line: str,
+    ) -> "tuple[list[Token], bool]":
+        comment, continuation, last_data = self._classify(values, first_data)
+        has_data = last_data >= 0
+        tokens = []
+        append = tokens.append
+        offset = 0
+        is_data = first_data == 0
+        for index, value in enumerate(values):
             if is_data:
-                append(Token(None, value, lineno, offset))
-            elif include_separators:
+                if comment <= index:
+                    if not data_only and (value or index < last_data):
+                        append(Token(Token.COMMENT, value, lineno, offset))
+                elif index == continuation:
+                    if not data_only:
+                        append(Token(Token.CONTINUATION, value, lineno, offset))
+                    if not has_data:
+                        append(Token(None, "", lineno, offset + len(value)))
+                elif value or continuation < index < last_data:
+                    append(Token(None, value, lineno, offset))
+            elif not data_only:
                 append(Token(Token.SEPARATOR, value, lineno, offset))
             offset += len(value)
-        if include_separators:
-            trailing_whitespace = line[len(line.rstrip()) :]
-            append(Token(Token.EOL, trailing_whitespace, lineno, offset))
-        return tokens
-
-    def _split_from_spaces(self, line: str) -> "Iterator[tuple[str, bool]]":
-        is_data = True
-        for value in self._space_splitter.split(line):
-            yield value, is_data
             is_data = not is_data
+        if not data_only:
+            append(Token(Token.EOL, line[offset:], lineno, offset))
+        return tokens, has_data and continuation < 0
+
+    def _classify(self, values: "list[str]", first_data: int) -> "tuple[int, int, int]":
+        """Returns indices of the first comment, the continuation and the last data.
 
-    def _split_from_pipes(self, line) -> "Iterator[tuple[str, bool]]":
+        Indices not found are returned as ``-1`` except the comment index that
+        is returned as the total number of values. Empty values after the last
+        data and before the continuation are ignored.
+        """
+        comment = len(values)
+        continuation = last_data = -1
+        for index in range(first_data, comment, 2):
+            # The first value may have a leading space. With others spaces
+            # have been consumed as separators.
+            value = values[index] if index else values[0].lstrip()
+            if value:
+                if value[0] == "#":
+                    comment = index
+                    break
+                if last_data < 0 and continuation < 0 and value == "...":
+                    continuation = index
+                else:
+                    last_data = index
+        return comment, continuation, last_data
+
+    def _split_from_pipes(self, line: str) -> "list[str]":
         splitter = self._pipe_splitter
         _, separator, rest = splitter.split(line, 1)
-        yield separator, False
+        values = [separator]
         while splitter.search(rest):
             token, separator, rest = splitter.split(rest, 1)
-            yield token, True
-            yield separator, False
-        yield rest, True
-
-    def _cleanup_tokens(
-        self,
-        tokens: "list[Token]",
-        data_only: bool,
-    ) -> "tuple[list[Token], bool]":
-        has_data, comments, continues = self._handle_comments_and_continuation(tokens)
-        self._remove_trailing_empty(tokens)
-        if continues:
-            self._remove_leading_empty(tokens)
-            if not has_data:
-                self._ensure_data_after_continuation(tokens)
-            starts_new = False
-        else:
-            starts_new = has_data
-        if data_only and (comments or continues):
-            tokens = [t for t in tokens if t.type is None]
-        return tokens, starts_new
-
-    def _handle_comments_and_continuation(
-        self,
-        tokens: "list[Token]",
-    ) -> "tuple[bool, bool, bool]":
-        first = True
-        has_data = False
-        comments = False
-        continues = False
-        for token in tokens:
-            if token.type is None:
-                # The first token may have a leading space. With others spaces
-                # have been consumed as separators.
-                value = token.value.lstrip() if first else token.value
-                if comments:
-                    token.type = Token.COMMENT
-                elif value:
-                    if value[0] == "#":
-                        token.type = Token.COMMENT
-                        comments = True
-                    elif not has_data:
-                        if value == "..." and not continues:
-                            token.type = Token.CONTINUATION
-                            continues = True
-                        else:
-                            has_data = True
-            first = False
-        return has_data, comments, continues
-
-    def _remove_trailing_empty(self, tokens: "list[Token]"):
-        for token in reversed(tokens):
-            if not token.value and token.type != Token.EOL:
-                tokens.remove(token)
-            elif token.type is None:
-                break
-
-    def _remove_leading_empty(self, tokens: "list[Token]"):
-        data_or_continuation = (None, Token.CONTINUATION)
-        for token in list(tokens):
-            if not token.value:
-                tokens.remove(token)
-            elif token.type in data_or_continuation:
-                break
-
-    def _ensure_data_after_continuation(self, tokens: "list[Token]"):
-        cont = self._find_continuation(tokens)
-        token = Token(lineno=cont.lineno, col_offset=cont.end_col_offset)
-        tokens.insert(tokens.index(cont) + 1, token)
-
-    def _find_continuation(self, tokens: "list[Token]") -> Token:
-        for token in tokens:
-            if token.type == Token.CONTINUATION:
-                return token
-        raise ValueError("Continuation not found.")
+            values += [token, separator]
+        values.append(rest)
+        return values
@@ -17,4 +17,5 @@ from .parser import (
     get_init_model as get_init_model,
     get_model as get_model,
     get_resource_model as get_resource_model,
+    update_model as update_model,
 )
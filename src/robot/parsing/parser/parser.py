@@ -13,13 +13,21 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Callable, Iterator
+import ast
+from bisect import bisect_right
+from io import StringIO
+from typing import Callable, Iterator, Sequence
 
-from robot.conf import LanguagesLike
+from robot.conf import Languages, LanguagesLike
 from robot.utils import Source
 
 from ..lexer import get_init_tokens, get_resource_tokens, get_tokens, Token
-from ..model import Config, File, ModelVisitor, Statement
+from ..model import (
+    Config, File, Keyword, KeywordSection, ModelVisitor, Section, SettingSection,
+    Statement, TestCase, TestCaseSection
+)
+from ..model.blocks import ModelWriter
+from ..model.statements import Node
 from .blockparsers import Parser
 from .fileparser import FileParser
 
@@ -89,6 +97,48 @@ def get_init_model(
     return _get_model(get_init_tokens, source, data_only, curdir, lang)
 
 
+def update_model(
+    model: File,
+    lineno: int,
+    end_lineno: int,
+    text: str,
+    model_getter: "Callable[..., File]" = get_model,
+    curdir: "str | None" = None,
+    lang: LanguagesLike = None,
+) -> File:
+    """Updates the given model based on an edit and returns the updated model.
+
+    :param model: The model to update. Must have been created with
+        ``data_only=False`` using :func:`get_model`, :func:`get_resource_model`,
+        :func:`get_init_model`, or this function.
+    :param lineno: The first line to replace. Line numbers start from one.
+    :param end_lineno: The last line to replace. If it is smaller than
+        ``lineno``, ``text`` is inserted before ``lineno`` without replacing
+        anything.
+    :param text: The new text. Typically ends with a newline.
+    :param model_getter: The function that was used to create the model.
+        :func:`get_model` by default.
+    :param curdir: Same as with :func:`get_model`.
+    :param lang: Same as with :func:`get_model`.
+
+    The returned model is equal to the model that would be got by parsing
+    the whole edited data, but only the sections, tests and keywords affected
+    by the edit are parsed again. Other nodes are reused and only their line
+    numbers are updated. Unchanged tests and keywords are reused also if they
+    are near the edit. Edits affecting data before the first section header,
+    possibly containing language configuration, or any Settings section
+    cause the whole data to be parsed again.
+
+    The given model and nodes reused from it are modified in place and
+    the given model should not be used after calling this function.
+
+    New in Robot Framework 7.5.
+    """
+    return ModelUpdater(model, model_getter, curdir, lang).update(
+        lineno, end_lineno, text
+    )
+
+
 def _get_model(
     token_getter: Callable[..., Iterator[Token]],
     source: Source,
@@ -147,3 +197,257 @@ class ConfigParser(ModelVisitor):
         language = node.language
         if language:
             self.model.languages.append(language.code)
+
+
+class ModelUpdater:
+    """Updates models incrementally. Used by :func:`update_model`.
+
+    Models are split into units that can be parsed separately. Tests and
+    keywords are units of their own. Other sections as well as headers of
+    test and keyword sections, along with statements before the first test
+    or keyword, are separate units.
+    """
+
+    def __init__(
+        self,
+        model: File,
+        model_getter: "Callable[..., File]" = get_model,
+        curdir: "str | None" = None,
+        lang: LanguagesLike = None,
+    ):
+        self.model = model
+        self.model_getter = model_getter
+        self.curdir = curdir
+        self.lang = lang
+
+    def update(self, lineno: int, end_lineno: int, text: str) -> File:
+        sections = self.model.sections
+        if not sections:
+            return self._parse_all([], lineno, end_lineno, text)
+        if not next(self._get_statements(sections[0])).get_token(Token.EOL):
+            raise ValueError("Models created with 'data_only=True' cannot be updated.")
+        units = self._get_units(sections)
+        starts = [unit.lineno for unit in units]
+        # The line before the edit is included because the edit may continue it.
+        # The line after the edit is included if the new text does not end with
+        # a newline and the line thus changes.
+        first = max(bisect_right(starts, lineno - 1) - 1, 0)
+        if text.endswith("\n") or not text:
+            last_line = end_lineno
+        else:
+            last_line = max(end_lineno, lineno - 1) + 1
+        last = max(bisect_right(starts, last_line) - 1, first)
+        _, removed, _ = self._edit(units[first : last + 1], lineno, end_lineno, text)
+        if self._has_header(removed, text):
+            # New or removed headers affect everything after them in the section.
+            while last + 1 < len(units) and not units[last + 1].is_section_start:
+                last += 1
+        # Tests and keywords without a name belong to the preceding item
+        # if there is one after the edit.
+        while last + 1 < len(units) and units[last + 1].is_nameless:
+            last += 1
+        region = units[first : last + 1]
+        if self._affects_config(region, lineno) or any(
+            isinstance(unit.section, SettingSection) for unit in region
+        ):
+            return self._parse_all(units, lineno, end_lineno, text)
+        old, _, new = self._edit(region, lineno, end_lineno, text)
+        updated = self._update(region, old, new)
+        if not updated:
+            return self._parse_all(units, lineno, end_lineno, text)
+        return updated
+
+    def _get_units(self, sections: "list[Section]") -> "list[_Unit]":
+        units = []
+        for index, section in enumerate(sections):
+            body = section.body
+            items = len(body)
+            if isinstance(section, (TestCaseSection, KeywordSection)):
+                for position, node in enumerate(body):
+                    if isinstance(node, (TestCase, Keyword)):
+                        items = position
+                        break
+            units.append(_Unit(section, index, 0, items, is_section_start=True))
+            units.extend(
+                _Unit(section, index, position, position + 1)
+                for position in range(items, len(body))
+            )
+        return units
+
+    def _edit(
+        self,
+        units: "list[_Unit]",
+        lineno: int,
+        end_lineno: int,
+        text: str,
+    ) -> "tuple[str, list[str], str]":
+        old = self._get_text(*units)
+        lines = old.splitlines(keepends=True)
+        start = lineno - units[0].lineno
+        end = max(end_lineno - units[0].lineno + 1, start)
+        new = "".join(lines[:start]) + text + "".join(lines[end:])
+        return old, lines[start:end], new
+
+    def _get_text(self, *nodes: "_Unit | Node") -> str:
+        output = StringIO()
+        writer = ModelWriter(output)
+        for node in nodes:
+            for child in node.nodes if isinstance(node, _Unit) else [node]:
+                writer.write(child)
+        return output.getvalue()
+
+    def _affects_config(self, region: "list[_Unit]", lineno: int) -> bool:
+        # Language configuration is possible only before the first header.
+        section = region[0].section
+        if section is not self.model.sections[0]:
+            return False
+        return not section.header or lineno <= section.header.lineno
+
+    def _has_header(self, removed: "list[str]", text: str) -> bool:
+        # Statements starting with an asterisk start a new section. Possible
+        # leading pipes and spaces are ignored to err on the safe side.
+        lines = [*removed, *text.splitlines()]
+        return any(line.lstrip("| \t").startswith("*") for line in lines)
+
+    def _update(self, region: "list[_Unit]", old: str, new: str) -> "File | None":
+        sections = self.model.sections
+        first, last = region[0], region[-1]
+        settings = [s for s in sections if isinstance(s, SettingSection)]
+        if settings and new and not new.endswith("\n"):
+            return None
+        # Tests and keywords parsed without their section get the original
+        # header. Settings are included because they affect parsing tests.
+        prefix = "" if first.is_section_start else self._get_text(first.section.header)
+        parsed = self._parse(prefix + new + self._get_text(*settings)).sections
+        if settings:
+            if not all(isinstance(s, SettingSection) for s in parsed[-len(settings) :]):
+                return None
+            parsed = parsed[: -len(settings)]
+        tail = last.section.body[last.end :]
+        if (
+            not parsed
+            or any(isinstance(s, SettingSection) for s in parsed)
+            or (prefix and type(parsed[0]) is not type(first.section))
+            or (tail and type(parsed[-1]) is not type(last.section))
+        ):
+            return None
+        self._shift(parsed, first.lineno - 1 - prefix.count("\n"))
+        self._reuse_unchanged(region, parsed, skip_header=bool(prefix))
+        if prefix:
+            first.section.body = first.section.body[: first.start] + parsed[0].body
+            parsed[0] = first.section
+        delta = new.count("\n") - old.count("\n")
+        self._shift(tail, delta)
+        parsed[-1].body += tail
+        after = sections[last.section_index + 1 :]
+        self._shift(after, delta)
+        return File(
+            [*sections[: first.section_index], *parsed, *after],
+            source=self.model.source,
+            languages=self.model.languages,
+        )
+
+    def _reuse_unchanged(
+        self,
+        region: "list[_Unit]",
+        parsed: "list[Section]",
+        skip_header: bool,
+    ):
+        reusable: dict[tuple, list[Node]] = {}
+        for unit in region:
+            for node in unit.nodes:
+                reusable.setdefault(self._get_key(node), []).append(node)
+        for index, section in enumerate(parsed):
+            if section.header and not (index == 0 and skip_header):
+                section.header = self._reuse(section.header, reusable)
+            section.body = [self._reuse(node, reusable) for node in section.body]
+
+    def _reuse(self, node: Node, reusable: "dict[tuple, list[Node]]") -> Node:
+        candidates = reusable.get(self._get_key(node))
+        if not candidates:
+            return node
+        old = candidates.pop(0)
+        self._shift([old], node.lineno - old.lineno)
+        return old
+
+    def _get_key(self, node: Node) -> tuple:
+        base = node.lineno
+        tokens = tuple(
+            (token.type, token.value, token.lineno - base, token.col_offset)
+            for statement in self._get_statements(node)
+            for token in statement.tokens
+        )
+        # Errors depend also on the context, e.g. on the section header.
+        errors = tuple(getattr(child, "errors", ()) for child in ast.walk(node))
+        return type(node), tokens, errors
+
+    def _get_statements(self, node: Node) -> "Iterator[Statement]":
+        if isinstance(node, Statement):
+            yield node
+        else:
+            for child in ast.walk(node):
+                if isinstance(child, Statement):
+                    yield child
+
+    def _shift(self, nodes: "Sequence[Node]", delta: int):
+        if delta:
+            for node in nodes:
+                for statement in self._get_statements(node):
+                    for token in statement.tokens:
+                        token.lineno += delta
+
+    def _parse_all(
+        self,
+        units: "list[_Unit]",
+        lineno: int,
+        end_lineno: int,
+        text: str,
+    ) -> File:
+        if units:
+            _, _, data = self._edit(units, lineno, end_lineno, text)
+        else:
+            data = text
+        model = self.model_getter(StringIO(data), curdir=self.curdir, lang=self.lang)
+        model.source = self.model.source
+        return model
+
+    def _parse(self, data: str) -> File:
+        languages = Languages(self.lang)
+        for lang in self.model.languages:
+            languages.add_language(lang)
+        return self.model_getter(StringIO(data), curdir=self.curdir, lang=languages)
+
+
+class _Unit:
+
+    def __init__(
+        self,
+        section: Section,
+        section_index: int,
+        start: int,
+        end: int,
+        is_section_start: bool = False,
+    ):
+        self.section = section
+        self.section_index = section_index
+        self.start = start
+        self.end = end
+        self.is_section_start = is_section_start
+
+    @property
+    def nodes(self) -> "list[Node]":
+        nodes = self.section.body[self.start : self.end]
+        if self.is_section_start and self.section.header:
+            nodes.insert(0, self.section.header)
+        return nodes
+
+    @property
+    def lineno(self) -> int:
+        return self.nodes[0].lineno
+
+    @property
+    def is_nameless(self) -> bool:
+        if self.is_section_start:
+            return False
+        node = self.section.body[self.start]
+        return isinstance(node, (TestCase, Keyword)) and not node.name
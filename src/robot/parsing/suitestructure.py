@@ -14,7 +14,8 @@
 #  limitations under the License.
 
 import fnmatch
-import os.path
+import json
+import os
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -121,14 +122,21 @@ class SuiteStructureBuilder:
         self,
         extensions: Sequence[str] = (".robot", ".rbt", ".robot.rst", ".robot.md"),
         included_files: Sequence[str] = (),
+        cache: "DirectoryCache | Path | str | None" = None,
     ):
         self.extensions = ValidExtensions(extensions, included_files)
         self.included_files = IncludedFiles(included_files)
+        if not isinstance(cache, DirectoryCache):
+            cache = DirectoryCache(cache)
+        self.cache = cache
 
     def build(self, *paths: Path) -> SuiteStructure:
         if len(paths) == 1:
-            return self._build(paths[0])
-        return self._build_multi_source(paths)
+            structure = self._build(paths[0])
+        else:
+            structure = self._build_multi_source(paths)
+        self.cache.save()
+        return structure
 
     def _build(self, path: Path) -> SuiteStructure:
         if path.is_file():
@@ -137,22 +145,30 @@ class SuiteStructureBuilder:
 
     def _build_directory(self, path: Path) -> SuiteStructure:
         structure = SuiteDirectory(self.extensions, path)
-        for item in self._list_dir(path):
-            if self._is_init_file(item):
+        for name, kind in self._list_dir(path):
+            if kind == FILE and not self.extensions.match(name):
+                # Avoid creating `Path` objects for files that are not parsed.
+                LOGGER.info(f"Ignoring file or directory '{os.path.join(path, name)}'.")
+                continue
+            item = path / name
+            if kind == FILE and self._is_init_file(item):
                 if structure.init_file:
                     # TODO: This error should fail parsing for good.
                     LOGGER.error(f"Ignoring second test suite init file '{item}'.")
                 else:
                     structure.init_file = item
-            elif self._is_included(item):
-                structure.add(self._build(item))
+            elif self._is_included(item, kind):
+                if kind == DIRECTORY:
+                    structure.add(self._build_directory(item))
+                else:
+                    structure.add(SuiteFile(self.extensions, item))
             else:
                 LOGGER.info(f"Ignoring file or directory '{item}'.")
         return structure
 
-    def _list_dir(self, path: Path) -> "list[Path]":
+    def _list_dir(self, path: Path) -> "list[tuple[str, str | None]]":
         try:
-            return sorted(path.iterdir(), key=lambda p: p.name.lower())
+            return self.cache.list(path)
         except OSError:
             raise DataError(f"Reading directory '{path}' failed: {get_error_message()}")
 
@@ -163,12 +179,14 @@ class SuiteStructureBuilder:
             and path.is_file()
         )
 
-    def _is_included(self, path: Path) -> bool:
+    def _is_included(self, path: Path, kind: "str | None" = None) -> bool:
         if path.name.startswith(self.ignored_prefixes):
             return False
-        if path.is_dir():
+        if kind is None:
+            kind = _get_kind(path)
+        if kind == DIRECTORY:
             return path.name not in self.ignored_dirs
-        if not path.is_file():
+        if kind != FILE:
             return False
         if not self.extensions.match(path):
             return False
@@ -186,6 +204,95 @@ class SuiteStructureBuilder:
         return structure
 
 
+DIRECTORY = "directory"
+FILE = "file"
+
+
+def _get_kind(path: "Path | os.DirEntry") -> "str | None":
+    if path.is_dir():
+        return DIRECTORY
+    if path.is_file():
+        return FILE
+    return None
+
+
+class DirectoryCache:
+    """Lists directories and optionally caches listings to a file.
+
+    Directories are listed using :func:`os.scandir` so that file types
+    are typically got without separate system calls. If a cache file is
+    given, listings are stored to it and a directory is listed again only
+    if its modification time has changed. Changes inside subdirectories
+    do not affect the modification time of the parent directory, but
+    subdirectories are checked separately when they are processed.
+    Changes to targets of symbolic links are not detected.
+
+    By default, the cache file is got from the ``ROBOT_DIRECTORY_CACHE``
+    environment variable. If it is not set, listings are not cached.
+
+    New in Robot Framework 7.5.
+    """
+
+    def __init__(self, path: "Path | str | None" = None):
+        if path is None:
+            path = os.getenv("ROBOT_DIRECTORY_CACHE", "")
+        if str(path).upper() in ("", "NONE"):
+            self.path = None
+        else:
+            self.path = Path(path)
+        self._listings = self._load()
+        self._changed = False
+
+    def _load(self) -> dict:
+        if not self.path:
+            return {}
+        try:
+            with open(self.path, encoding="UTF-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):  # Missing or invalid cache file.
+            return {}
+        if not (isinstance(data, dict) and data.get("version") == 1):
+            return {}
+        return data.get("directories", {})
+
+    def list(self, path: Path) -> "list[tuple[str, str | None]]":
+        """Returns names and kinds of items in the directory sorted by name.
+
+        Kind is ``"directory"``, ``"file"`` or ``None`` if the item is neither.
+        """
+        if not self.path:
+            return self._list(path)
+        key = str(path.absolute())
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._listings.get(key)
+        if cached and cached[0] == mtime:
+            return [tuple(item) for item in cached[1]]
+        listing = self._list(path)
+        self._listings[key] = [mtime, listing]
+        self._changed = True
+        return listing
+
+    def _list(self, path: Path) -> "list[tuple[str, str | None]]":
+        with os.scandir(path) as entries:
+            listing = [(entry.name, _get_kind(entry)) for entry in entries]
+        return sorted(listing, key=lambda item: item[0].lower())
+
+    def save(self):
+        if not (self.path and self._changed):
+            return
+        temp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp, "w", encoding="UTF-8") as file:
+                json.dump({"version": 1, "directories": self._listings}, file)
+            os.replace(temp, self.path)
+        except OSError as err:
+            LOGGER.info(f"Saving directory cache '{self.path}' failed: {err}")
+            if temp.exists():
+                temp.unlink()
+        else:
+            self._changed = False
+
+
 class ValidExtensions:
 
     def __init__(self, extensions: Sequence[str], included_files: Sequence[str] = ()):
@@ -195,7 +302,7 @@ class ValidExtensions:
             if ext:
                 self.extensions.add(ext.lstrip(".").lower())
 
-    def match(self, path: Path) -> bool:
+    def match(self, path: "Path | str") -> bool:
         return any(ext in self.extensions for ext in self._extensions_from(path))
 
     def get_extension(self, path: Path) -> str:
@@ -204,10 +311,14 @@ class ValidExtensions:
                 return ext
         return path.suffix.lower()[1:]
 
-    def _extensions_from(self, path: Path) -> Iterator[str]:
-        suffixes = path.suffixes
+    def _extensions_from(self, path: "Path | str") -> Iterator[str]:
+        # Same logic as with `Path.suffixes`, but string operations are faster.
+        name = path.name if isinstance(path, Path) else os.path.basename(path)
+        if name.endswith("."):
+            return
+        suffixes = name.lstrip(".").lower().split(".")[1:]
         while suffixes:
-            yield "".join(suffixes).lower()[1:]
+            yield ".".join(suffixes)
             suffixes.pop(0)
 
 
@@ -37,10 +37,7 @@ if __name__ == "__main__" and "robot" not in sys.modules:
 
     set_pythonpath()
 
-from robot.conf import RebotSettings
 from robot.errors import DataError
-from robot.output import LOGGER
-from robot.reporting import ResultWriter
 from robot.run import RobotFramework
 from robot.utils import Application
 
@@ -347,6 +344,8 @@ $ python -m robot.rebot --name Combined outputs/*.xml
 class Rebot(RobotFramework):
 
     def __init__(self):
+        from robot.output import LOGGER
+
         Application.__init__(
             self,
             USAGE,
@@ -356,6 +355,10 @@ class Rebot(RobotFramework):
         )
 
     def main(self, datasources, **options):
+        from robot.conf import RebotSettings
+        from robot.output import LOGGER
+        from robot.reporting import ResultWriter
+
         try:
             settings = RebotSettings(options)
         except DataError:
@@ -18,13 +18,13 @@ from pathlib import Path
 from typing import overload, Sequence, TextIO
 
 from robot.errors import DataError
-from robot.model import Statistics, SuiteVisitor
+from robot.model import DataDict, Statistics, SuiteVisitor
 from robot.utils import JsonDumper, JsonLoader, setter
 from robot.version import get_full_version
 
 from .executionerrors import ExecutionErrors
 from .flattenkeywordmatcher import Flattener
-from .model import TestSuite
+from .model import Body, Branches, For, If, Iterations, TestSuite, Try, While
 
 
 def is_json_source(source) -> bool:
@@ -211,7 +211,18 @@ class Result:
     @classmethod
     def _get_json_loader(cls, include_keywords: bool) -> JsonLoader:
         if include_keywords:
-            return JsonLoader()
+
+            def create_body_items(obj):
+                # Creating body items already when parsing avoids holding all data
+                # both as dictionaries and as model objects in memory. Items are
+                # created when their parent is parsed, because the parent type
+                # determines what kind of items its body can contain.
+                body = obj.get("body")
+                if isinstance(body, list):
+                    obj["body"] = cls._create_body(obj.get("type"), body)
+                return obj
+
+            return JsonLoader(object_hook=create_body_items)
 
         def remove_keywords(obj):
             obj.pop("body", None)
@@ -222,6 +233,18 @@ class Result:
 
         return JsonLoader(object_hook=remove_keywords)
 
+    @classmethod
+    def _create_body(
+        cls, parent_type: "str | None", items: "list[DataDict]"
+    ) -> "Body | Branches | Iterations":
+        if parent_type in (For.type, While.type):
+            parent = For if parent_type == For.type else While
+            return parent.iterations_class(parent.iteration_class, None, items)
+        if parent_type in (If.type, Try.type):
+            parent = If if parent_type == If.type else Try
+            return parent.branches_class(parent.branch_class, None, items)
+        return Body(None, items)
+
     @classmethod
     def _from_full_json(cls, data) -> "Result":
         return Result(
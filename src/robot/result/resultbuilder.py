@@ -142,6 +142,9 @@ class ExecutionResultBuilder:
 
     def build(self, result):
         # Parsing is performance optimized. Do not change without profiling!
+        # Parsing and building the model in separate threads has been tested,
+        # but it is considerably slower because expat holds the GIL. Feeding
+        # `XMLPullParser` with bigger chunks does not make a difference either.
         handler = XmlElementHandler(result)
         with self._source as source:
             self._parse(source, handler.start, handler.end)
@@ -155,10 +158,11 @@ class ExecutionResultBuilder:
         return result
 
     def _parse(self, source, start, end):
-        context = ET.iterparse(source, events=("start", "end"))
         if not self._include_keywords:
-            context = self._omit_keywords(context)
-        elif self._flattened_keywords:
+            self._parse_without_keywords(source, start, end)
+            return
+        context = ET.iterparse(source, events=("start", "end"))
+        if self._flattened_keywords:
             context = self._flatten_keywords(context, self._flattened_keywords)
         for event, elem in context:
             if event == "start":
@@ -173,22 +177,29 @@ class ExecutionResultBuilder:
         except AttributeError:
             pass
 
-    def _omit_keywords(self, context):
-        omitted_elements = {"kw", "for", "while", "if", "try", "group", "variable"}
-        omitted = 0
-        for event, elem in context:
-            # Teardowns cannot be removed yet, because we need to check suite
-            # teardown status. They are removed later using KeywordRemover.
-            omit = elem.tag in omitted_elements and elem.get("type") != "TEARDOWN"
-            start = event == "start"
-            if omit and start:
-                omitted += 1
-            if not omitted:
-                yield event, elem
-            elif not start:
-                elem.clear()
-            if omit and not start:
-                omitted -= 1
+    def _parse_without_keywords(self, source, start, end):
+        # Keywords are omitted already by the parser target so that elements
+        # are not created for them at all. This is considerably faster than
+        # omitting them from events generated by `iterparse`.
+        events = []
+        parser = ET.XMLParser(target=KeywordOmittingTarget(events))
+        for data in self._read(source):
+            parser.feed(data)
+            for event, elem in events:
+                if event == "start":
+                    start(elem)
+                else:
+                    end(elem)
+                    elem.clear()
+            events.clear()
+        parser.close()
+
+    def _read(self, source, chunk_size=64 * 1024):
+        if hasattr(source, "read"):
+            yield from iter(lambda: source.read(chunk_size), source.read(0))
+        else:
+            with open(source, "rb") as file:
+                yield from iter(lambda: file.read(chunk_size), b"")
 
     def _flatten_keywords(self, context, flattened):
         # Performance optimized. Do not change without profiling!
@@ -225,3 +236,44 @@ class ExecutionResultBuilder:
     def _get_matcher(self, matcher_class, flattened):
         matcher = matcher_class(flattened)
         return matcher.match, bool(matcher)
+
+
+class KeywordOmittingTarget:
+    """Parser target omitting keywords and control structures.
+
+    Generated events are added to the given list as ``(event, elem)`` tuples
+    similarly as with ``iterparse``. Elements inside omitted elements are
+    not created at all.
+    """
+
+    omitted_elements = frozenset(
+        ("kw", "for", "while", "if", "try", "group", "variable")
+    )
+
+    def __init__(self, events):
+        self._events = events
+        self._builder = ET.TreeBuilder()
+        self._omitted = 0
+
+    def start(self, tag, attrs):
+        if self._omitted:
+            self._omitted += 1
+        # Teardowns cannot be removed yet, because we need to check suite
+        # teardown status. They are removed later using KeywordRemover.
+        elif tag in self.omitted_elements and attrs.get("type") != "TEARDOWN":
+            self._omitted = 1
+        else:
+            self._events.append(("start", self._builder.start(tag, attrs)))
+
+    def end(self, tag):
+        if self._omitted:
+            self._omitted -= 1
+        else:
+            self._events.append(("end", self._builder.end(tag)))
+
+    def data(self, data):
+        if not self._omitted:
+            self._builder.data(data)
+
+    def close(self):
+        pass
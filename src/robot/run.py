@@ -38,12 +38,7 @@ if __name__ == "__main__" and "robot" not in sys.modules:
 
     set_pythonpath()
 
-from robot.conf import RobotSettings
 from robot.errors import DataError
-from robot.model import ModelModifier
-from robot.output import librarylogger, LOGGER, pyloggingconf
-from robot.reporting import ResultWriter
-from robot.running.builder import TestSuiteBuilder
 from robot.utils import Application, text
 
 USAGE = """Robot Framework -- A generic automation framework
@@ -448,6 +443,8 @@ $ robot tests.robot
 class RobotFramework(Application):
 
     def __init__(self):
+        from robot.output import LOGGER
+
         super().__init__(
             USAGE,
             arg_limits=(1,),
@@ -456,6 +453,14 @@ class RobotFramework(Application):
         )
 
     def main(self, datasources, **options):
+        # Modules needed only when running tests are imported here to keep
+        # `import robot` and commands like `robot --version` fast.
+        from robot.conf import RobotSettings
+        from robot.model import ModelModifier
+        from robot.output import librarylogger, LOGGER, pyloggingconf
+        from robot.reporting import ResultWriter
+        from robot.running.builder import TestSuiteBuilder
+
         try:
             settings = RobotSettings(options)
         except DataError:
@@ -475,6 +480,7 @@ class RobotFramework(Application):
             rpa=settings.rpa,
             lang=settings.languages,
             allow_empty_suite=settings.run_empty_suite,
+            prefilter=self._get_prefilter(settings),
         )
         suite = builder.build(*datasources)
         if settings.pre_run_modifiers:
@@ -506,6 +512,27 @@ class RobotFramework(Application):
                 writer.write_results(settings.get_rebot_settings())
         return result.return_code
 
+    def _get_prefilter(self, settings):
+        # Pre-run modifiers can change tests before they are filtered.
+        if settings.pre_run_modifiers:
+            return None
+        config = settings.suite_config
+        selectors = [
+            config["include_suites"],
+            config["include_tests"],
+            config["include_tags"],
+            config["exclude_tags"],
+        ]
+        if not any(selectors):
+            return None
+
+        def prefilter(suite):
+            if config["name"]:
+                suite.name = config["name"]
+            suite.filter(*selectors)
+
+        return prefilter
+
     def validate(self, options, arguments):
         return self._filter_options_without_value(options), arguments
 
@@ -126,6 +126,7 @@ from .builder import (
     TestSuiteBuilder as TestSuiteBuilder,
 )
 from .context import EXECUTION_CONTEXTS as EXECUTION_CONTEXTS
+from .dryrun import DryRunError as DryRunError, DryRunValidator as DryRunValidator
 from .invalidkeyword import InvalidKeyword as InvalidKeyword
 from .keywordimplementation import KeywordImplementation as KeywordImplementation
 from .librarykeyword import LibraryKeyword as LibraryKeyword
@@ -16,7 +16,7 @@
 import warnings
 from os.path import normpath
 from pathlib import Path
-from typing import cast, Sequence
+from typing import Any, Callable, cast, Iterator, Sequence
 
 from robot.conf import LanguagesLike
 from robot.errors import DataError
@@ -31,7 +31,7 @@ from ..model import TestSuite
 from ..resourcemodel import ResourceFile
 from .parsers import (
     CustomParser, JsonParser, MarkdownParser, NoInitFileDirectoryParser, Parser,
-    RestParser, RobotParser
+    PrescanParser, RestParser, RobotParser
 )
 from .settings import TestDefaults
 
@@ -76,6 +76,7 @@ class TestSuiteBuilder:
         lang: LanguagesLike = None,
         allow_empty_suite: bool = False,
         process_curdir: bool = True,
+        prefilter: "Callable[[TestSuite], Any] | None" = None,
     ):
         """
         :param included_suites:
@@ -111,6 +112,15 @@ class TestSuiteBuilder:
             Control processing the special ``${CURDIR}`` variable. It is
             resolved already at parsing time by default, but that can be
             changed by giving this argument ``False`` value.
+        :param prefilter:
+            Callable for selecting tests before suite files are parsed fully.
+            It is called with a suite that contains only suite names as well
+            as test names and tags, and it is expected to filter that suite,
+            for example, by using :meth:`TestSuite.filter`. Files that do not
+            contain any tests afterwards are not parsed, which also means that
+            possible errors in them are not reported. The built suite still
+            contains all tests in the remaining files and needs to be filtered
+            normally. Not used with custom parsers. New in RF 7.5.
         """
         self.standard_parsers = self._get_standard_parsers(lang, process_curdir)
         self.custom_parsers = self._get_custom_parsers(custom_parsers)
@@ -119,6 +129,7 @@ class TestSuiteBuilder:
         self.included_files = tuple(included_files or ())
         self.rpa = rpa
         self.allow_empty_suite = allow_empty_suite
+        self.prefilter = prefilter
         # TODO: Remove in RF 8.0.
         if included_suites != "DEPRECATED":
             warnings.warn(
@@ -173,16 +184,71 @@ class TestSuiteBuilder:
         paths = self._normalize_paths(paths)
         extensions = self.included_extensions + tuple(self.custom_parsers)
         structure = SuiteStructureBuilder(extensions, self.included_files).build(*paths)
-        suite = SuiteStructureParser(
-            self._get_parsers(paths),
-            self.defaults,
-            self.rpa,
-        ).parse(structure)
-        if not self.allow_empty_suite:
-            self._validate_not_empty(suite, multi_source=len(paths) > 1)
-        suite.remove_empty_suites(preserve_direct_children=len(paths) > 1)
+        parsers = self._get_parsers(paths)
+        multi_source = len(paths) > 1
+        validate = not self.allow_empty_suite
+        if self.prefilter and not self.custom_parsers:
+            prescanned = self._prescan(structure, parsers)
+            if prescanned:
+                if validate:
+                    self._validate_not_empty(prescanned, multi_source)
+                    validate = False
+                self._prefilter(structure, prescanned)
+        suite = SuiteStructureParser(parsers, self.defaults, self.rpa).parse(structure)
+        if validate:
+            self._validate_not_empty(suite, multi_source)
+        suite.remove_empty_suites(preserve_direct_children=multi_source)
         return suite
 
+    def _prescan(
+        self,
+        structure: SuiteStructure,
+        parsers: "dict[str | None, Parser]",
+    ) -> "TestSuite | None":
+        parsers = {
+            ext: PrescanParser(parser) if isinstance(parser, RobotParser) else parser
+            for ext, parser in parsers.items()
+        }
+        try:
+            return PrescanStructureParser(parsers, self.defaults).parse(structure)
+        except DataError:
+            # Errors are reported when the data is parsed normally.
+            return None
+
+    def _prefilter(self, structure: SuiteStructure, prescanned: TestSuite):
+        total = prescanned.test_count
+        try:
+            self.prefilter(prescanned)
+        except DataError:
+            return
+        if not prescanned.test_count:
+            return
+        sources = set(self._get_sources(prescanned))
+        LOGGER.info(
+            f"Pre-filtering selected {prescanned.test_count} tests or tasks out of "
+            f"{total} in {len(sources)} files."
+        )
+        self._prune(structure, sources)
+
+    def _get_sources(self, suite: TestSuite) -> "Iterator[Path]":
+        if suite.tests:
+            yield suite.source
+        for child in suite.suites:
+            yield from self._get_sources(child)
+
+    def _prune(self, structure: SuiteStructure, sources: "set[Path]") -> bool:
+        if isinstance(structure, SuiteFile):
+            return structure.source in sources
+        # Direct children of a multi-source suite are preserved because
+        # the name of the suite is got from them.
+        children = [
+            child
+            for child in structure.children
+            if self._prune(child, sources) or structure.is_multi_source
+        ]
+        structure.children = children
+        return bool(children)
+
     def _normalize_paths(self, paths: "Sequence[Path | str]") -> "tuple[Path, ...]":
         if not paths:
             raise DataError("One or more source paths required.")
@@ -248,7 +314,6 @@ class SuiteStructureParser(SuiteStructureVisitor):
         return cast(TestSuite, self.suite)
 
     def visit_file(self, structure: SuiteFile):
-        LOGGER.info(f"Parsing file '{structure.source}'.")
         suite = self._build_suite_file(structure)
         if self.rpa is not None:
             suite.rpa = self.rpa
@@ -258,8 +323,6 @@ class SuiteStructureParser(SuiteStructureVisitor):
             self._stack[-1][0].suites.append(suite)
 
     def start_directory(self, structure: SuiteDirectory):
-        if structure.source:
-            LOGGER.info(f"Parsing directory '{structure.source}'.")
         suite, defaults = self._build_suite_directory(structure)
         if self.suite is None:
             self.suite = suite
@@ -278,6 +341,7 @@ class SuiteStructureParser(SuiteStructureVisitor):
                 suite.rpa = True
 
     def _build_suite_file(self, structure: SuiteFile):
+        LOGGER.info(f"Parsing file '{structure.source}'.")
         parser = self.parsers[structure.extension]
         defaults = self.parent_defaults or TestDefaults()
         try:
@@ -289,6 +353,8 @@ class SuiteStructureParser(SuiteStructureVisitor):
         return suite
 
     def _build_suite_directory(self, structure: SuiteDirectory):
+        if structure.source:
+            LOGGER.info(f"Parsing directory '{structure.source}'.")
         parser = self.parsers[structure.extension]
         defaults = TestDefaults(self.parent_defaults)
         source = cast(Path, structure.init_file or structure.source)
@@ -301,6 +367,24 @@ class SuiteStructureParser(SuiteStructureVisitor):
         return suite, defaults
 
 
+class PrescanStructureParser(SuiteStructureParser):
+    """Parses suite structure using :class:`PrescanParser` parsers."""
+
+    def _build_suite_file(self, structure: SuiteFile):
+        parser = self.parsers[structure.extension]
+        defaults = self.parent_defaults or TestDefaults()
+        return parser.parse_suite_file(structure.source, defaults)
+
+    def _build_suite_directory(self, structure: SuiteDirectory):
+        parser = self.parsers[structure.extension]
+        defaults = TestDefaults(self.parent_defaults)
+        source = cast(Path, structure.init_file or structure.source)
+        suite = parser.parse_init_file(source, defaults)
+        if structure.is_multi_source:
+            suite.config(name="", source=None)
+        return suite, defaults
+
+
 class ResourceFileBuilder:
 
     def __init__(self, lang: LanguagesLike = None, process_curdir: bool = True):
@@ -19,15 +19,15 @@ from inspect import signature
 from pathlib import Path
 from textwrap import dedent
 
-from robot.conf import LanguagesLike
+from robot.conf import Languages, LanguagesLike
 from robot.errors import DataError
 from robot.parsing import File, get_init_model, get_model, get_resource_model
-from robot.utils import FileReader, get_error_message, type_name
+from robot.utils import FileReader, get_error_message, normalize_whitespace, type_name
 
 from ..model import TestSuite
 from ..resourcemodel import ResourceFile
 from .settings import FileSettings, InitFileSettings, TestDefaults
-from .transformers import ResourceBuilder, SuiteBuilder
+from .transformers import PrescanBuilder, ResourceBuilder, SuiteBuilder
 
 
 class Parser(ABC):
@@ -176,6 +176,122 @@ class NoInitFileDirectoryParser(Parser):
         )
 
 
+class PrescanParser(Parser):
+    """Parses only suite names as well as test names and tags.
+
+    Lines that cannot affect them, most importantly test and keyword bodies,
+    are dropped before the data is tokenized. Sections with unrecognized
+    headers are preserved, and files configuring languages are parsed fully.
+    """
+
+    _separator = re.compile(r"\s{2,}|\t")
+    _pipe_separator = re.compile(r"\s+\|(?=\s|$)")
+    _test_headers = {"Test Cases", "Tasks"}
+    _dropped_headers = {"Keywords", "Variables", "Comments"}
+
+    def __init__(self, parser: RobotParser):
+        self.parser = parser
+        languages = Languages(parser.lang)
+        self.headers = languages.headers
+        self.tag_settings = {n for n, v in languages.settings.items() if v == "Tags"}
+
+    def parse_suite_file(self, source: Path, defaults: TestDefaults) -> TestSuite:
+        model = get_model(
+            self._get_source(source),
+            data_only=True,
+            curdir=self.parser._get_curdir(source),
+            lang=self.parser.lang,
+        )
+        suite = TestSuite(
+            name=TestSuite.name_from_source(source, self.parser.extensions),
+            source=source,
+        )
+        PrescanBuilder(suite, FileSettings(defaults)).build(model)
+        return suite
+
+    def parse_init_file(self, source: Path, defaults: TestDefaults) -> TestSuite:
+        model = get_init_model(
+            self._get_source(source),
+            data_only=True,
+            curdir=self.parser._get_curdir(source),
+            lang=self.parser.lang,
+        )
+        suite = TestSuite(
+            name=TestSuite.name_from_source(source.parent),
+            source=source.parent,
+            rpa=None,
+        )
+        PrescanBuilder(suite, InitFileSettings(defaults)).build(model)
+        return suite
+
+    def _get_source(self, source: Path) -> str:
+        try:
+            data = self.parser._get_source(source)
+            if isinstance(data, Path):
+                with FileReader(data) as reader:
+                    data = reader.read()
+        except Exception:
+            raise DataError(get_error_message())
+        lines = self._reduce(data.splitlines(keepends=True))
+        return "".join(lines) if lines is not None else data
+
+    def _reduce(self, lines: "list[str]") -> "list[str] | None":
+        reduced = []
+        section = None
+        keep = False
+        for line in lines:
+            if line[:2].strip() == "|":
+                first, indented = self._split_pipes(line)
+            else:
+                first = line.lstrip()
+                indented = line[:1] == "\t" or line[:2] in ("  ", " \t")
+            if not first or first[0] == "#":
+                continue
+            if first[:3] == "..." and not first[3:4].strip():
+                if keep:
+                    reduced.append(line)
+                continue
+            if first[0] == "*":
+                section = self._get_section(first)
+                keep = True
+            elif section == "tests":
+                keep = not indented or self._is_tags_setting(first)
+            elif section:
+                keep = section == "keep"
+            elif first[:9].lower() == "language:":
+                return None
+            else:
+                keep = False
+            if keep:
+                reduced.append(line)
+        return reduced
+
+    def _split_pipes(self, line: str) -> "tuple[str, bool]":
+        cells = self._pipe_separator.split(" " + line.rstrip())[1:]
+        for index, cell in enumerate(cells):
+            cell = cell.strip()
+            if cell:
+                return cell, index > 0
+        return "", False
+
+    def _get_section(self, first: str) -> str:
+        header = self._separator.split(first, 1)[0]
+        header = self.headers.get(" ".join(header.strip("* \n").split()).title())
+        if header in self._test_headers:
+            return "tests"
+        if header in self._dropped_headers:
+            return "drop"
+        return "keep"
+
+    def _is_tags_setting(self, first: str) -> bool:
+        if first[0] != "[":
+            return False
+        name = self._separator.split(first.rstrip(), 1)[0]
+        if name[-1:] != "]":
+            return False
+        return normalize_whitespace(name[1:-1]).strip().title() in self.tag_settings
+
+
 class CustomParser(Parser):
 
     def __init__(self, parser):
@@ -18,6 +18,7 @@ from typing import Union
 from robot.errors import DataError
 from robot.output import LOGGER
 from robot.parsing import File, ModelVisitor, Token
+from robot.parsing.model.statements import Tags
 from robot.utils import NormalizedDict
 from robot.variables import VariableMatches
 
@@ -156,6 +157,48 @@ class SuiteBuilder(ModelVisitor):
         ).build(node)
 
 
+class PrescanBuilder(ModelVisitor):
+    """Creates tests with only names and tags.
+
+    Used when pre-filtering tests before parsing suite files fully. Possible
+    errors are not reported, because they are reported if the file is parsed.
+    """
+
+    def __init__(self, suite: TestSuite, settings: FileSettings):
+        self.suite = suite
+        self.settings = settings
+        self.tests = []
+
+    def build(self, model: File):
+        self.visit(model)
+        for node in self.tests:
+            self._build_test(node)
+
+    def _build_test(self, node):
+        test = self.suite.tests.create(name=node.name, tags=self.settings.test_tags)
+        tags = [item for item in node.body if isinstance(item, Tags)]
+        for item in tags:
+            test.tags.add(item.values, remove_negated=True)
+        if not tags:
+            test.tags.add(self.settings.default_tags)
+
+    def visit_SuiteName(self, node):
+        self.suite.name = node.value
+
+    def visit_TestTags(self, node):
+        self.settings.test_tags = node.values
+
+    def visit_DefaultTags(self, node):
+        self.settings.default_tags = node.values
+
+    def visit_TestCase(self, node):
+        # Tests are created only after all settings have been processed.
+        self.tests.append(node)
+
+    def visit_Keyword(self, node):
+        pass
+
+
 class ResourceBuilder(ModelVisitor):
 
     def __init__(self, resource: ResourceFile):
@@ -0,0 +1,258 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+from robot.conf import RobotSettings
+from robot.model import ModelModifier
+from robot.output import LOGGER
+from robot.output.loggerapi import LoggerApi
+
+from .builder import TestSuiteBuilder
+from .model import TestSuite
+
+__all__ = ["DryRunError", "DryRunValidator"]
+
+
+@dataclass
+class DryRunError:
+    """Error detected when validating test data in the dry-run mode."""
+
+    message: str
+    source: "Path | None" = None
+    lineno: "int | None" = None
+    name: str = ""
+
+    def __str__(self) -> str:
+        location = ":".join(str(i) for i in (self.source, self.lineno) if i)
+        prefix = ": ".join(p for p in (location, self.name) if p)
+        return f"{prefix}: {self.message}" if prefix else self.message
+
+
+class DryRunValidator:
+    """Validates test data using the dry-run mode in parallel processes.
+
+    Suite files having tests are split into chunks that are executed in
+    the dry-run mode in separate processes. Each process parses only the files
+    it needs. Output files are not created, the console output is disabled,
+    and only errors are reported. Typical errors are keywords not being found,
+    keywords being called with an invalid number of arguments, imports failing
+    and invalid syntax.
+
+    :param processes: Maximum number of processes to use. Defaults to
+        the number of CPUs. If the value is ``1``, data is validated in
+        the current process.
+    :param options: Options having same names and semantics as options
+        accepted by the :func:`robot.run <robot.run.run>` function, for
+        example, ``variable=['NAME:value']`` or ``include='smoke'``. Options
+        related to output files and to the console output are ignored.
+
+    Example::
+
+        from robot.running import DryRunValidator
+
+        for error in DryRunValidator().validate('path/to/tests'):
+            print(error)
+
+    New in Robot Framework 7.5.
+    """
+
+    def __init__(self, processes: "int | None" = None, **options):
+        self.processes = processes or os.cpu_count() or 1
+        self.options = {
+            **options,
+            "dryrun": True,
+            "output": None,
+            "log": None,
+            "report": None,
+            "xunit": None,
+            "console": "none",
+        }
+
+    def validate(self, *sources: "Path | str") -> "list[DryRunError]":
+        """Validates the given files and directories.
+
+        :return: List of :class:`DryRunError` objects.
+        """
+        settings = RobotSettings(self.options)
+        if settings.pythonpath:
+            sys.path = settings.pythonpath + sys.path
+        errors = []
+        with LOGGER:
+            LOGGER.register_console_logger(**settings.console_output_config)
+            with ErrorCollector(errors):
+                suite = _build(sources, settings)
+                chunks = self._split(suite)
+                if len(chunks) < 2 or self.processes < 2:
+                    suite.run(settings)
+                    chunks = []
+        if chunks:
+            errors.extend(
+                self._validate_in_parallel(sources, suite, chunks, settings.rpa)
+            )
+        return self._remove_duplicates(errors)
+
+    def _split(self, suite: TestSuite) -> "list[list[TestSuite]]":
+        """Splits suites having tests to chunks with roughly same test count."""
+        suites = [s for s in self._get_suites(suite) if s.tests]
+        if not suites:
+            return []
+        target = suite.test_count / self.processes
+        chunks = [[]]
+        count = 0
+        for child in suites:
+            if count >= target * len(chunks):
+                chunks.append([])
+            chunks[-1].append(child)
+            count += len(child.tests)
+        return chunks
+
+    def _get_suites(self, suite: TestSuite) -> "Iterator[TestSuite]":
+        yield suite
+        for child in suite.suites:
+            yield from self._get_suites(child)
+
+    def _validate_in_parallel(
+        self,
+        sources: "Sequence[Path | str]",
+        suite: TestSuite,
+        chunks: "list[list[TestSuite]]",
+        rpa: "bool | None",
+    ) -> "list[DryRunError]":
+        # The name of the top level suite and the execution mode are passed to
+        # child processes explicitly, because they can depend on files that
+        # the processes do not parse. Processes also need to allow empty
+        # suites for the same reason.
+        options = {
+            **self.options,
+            "name": suite.name,
+            "rpa": rpa,
+            "runemptysuite": True,
+        }
+        args = []
+        for chunk in chunks:
+            files = [glob.escape(str(s.source)) for s in chunk]
+            args.append((sources, options, files))
+        errors = []
+        with ProcessPoolExecutor(min(self.processes, len(chunks))) as executor:
+            for chunk_errors in executor.map(_validate, *zip(*args)):
+                errors.extend(chunk_errors)
+        return errors
+
+    def _remove_duplicates(self, errors: "list[DryRunError]") -> "list[DryRunError]":
+        # Errors in imports and fixtures of shared parent suites are reported
+        # by all processes.
+        seen = set()
+        result = []
+        for error in errors:
+            key = (error.message, error.source, error.lineno, error.name)
+            if key not in seen:
+                seen.add(key)
+                result.append(error)
+        return result
+
+
+class ErrorCollector(LoggerApi):
+    """Collects dry-run errors during execution."""
+
+    def __init__(self, errors: "list[DryRunError]"):
+        self.errors = errors
+        self._active = False
+
+    def __enter__(self):
+        # Registering relays earlier messages and they are ignored.
+        LOGGER.register_logger(self)
+        self._active = True
+        return self
+
+    def __exit__(self, *exc_info):
+        LOGGER.unregister_logger(self)
+        self._active = False
+
+    def end_test(self, data, result):
+        if result.failed and not self._parent_setup_failed(result.parent):
+            self._add(result.message, data.source, data.lineno, data.full_name)
+
+    def end_suite(self, data, result):
+        if result.has_setup and result.setup.failed:
+            self._add_fixture_error(data, data.setup, result.setup)
+        if result.has_teardown and result.teardown.failed:
+            self._add_fixture_error(data, data.teardown, result.teardown)
+
+    def _add_fixture_error(self, suite, data, result):
+        self._add(result.message, suite.source, data.lineno, suite.full_name)
+
+    def _parent_setup_failed(self, suite) -> bool:
+        while suite:
+            if suite.has_setup and suite.setup.failed:
+                return True
+            suite = suite.parent
+        return False
+
+    def message(self, message):
+        if message.level == "ERROR":
+            self._add(message.message)
+
+    def _add(self, message, source=None, lineno=None, name=""):
+        if self._active:
+            self.errors.append(DryRunError(message, source, lineno, name))
+
+
+def _build(sources: "Sequence[Path | str]", settings: RobotSettings, files=None):
+    builder = TestSuiteBuilder(
+        included_extensions=settings.extension,
+        included_files=files or settings.parse_include,
+        custom_parsers=settings.parsers,
+        rpa=settings.rpa,
+        lang=settings.languages,
+        allow_empty_suite=settings.run_empty_suite,
+    )
+    suite = builder.build(*sources)
+    if settings.pre_run_modifiers:
+        modifier = ModelModifier(
+            settings.pre_run_modifiers,
+            settings.run_empty_suite,
+            LOGGER,
+        )
+        suite.visit(modifier)
+    suite.configure(**settings.suite_config)
+    settings.rpa = suite.validate_execution_mode()
+    return suite
+
+
+def _validate(
+    sources: "Sequence[Path | str]",
+    options: "dict[str, Any]",
+    files: "list[str]",
+) -> "list[DryRunError]":
+    settings = RobotSettings(options)
+    if settings.pythonpath:
+        sys.path = settings.pythonpath + sys.path
+    errors = []
+    with LOGGER:
+        LOGGER.register_console_logger(**settings.console_output_config)
+        # Errors in parsing files have already been reported.
+        suite = _build(sources, settings, files)
+        suite.remove_empty_suites()
+        with ErrorCollector(errors):
+            suite.run(settings)
+    return errors
+
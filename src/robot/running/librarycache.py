@@ -0,0 +1,210 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import sys
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Iterable, TYPE_CHECKING
+
+from robot.version import VERSION
+
+if TYPE_CHECKING:
+    from .testlibraries import TestLibrary
+
+
+class LibraryCache:
+    """Caches information about library keywords on the file system.
+
+    Creating keywords requires inspecting library methods, parsing their
+    arguments and resolving type hints, and with dynamic libraries calling
+    various ``get_keyword_*`` methods. With big libraries that can take
+    a considerable amount of time, and this cache allows avoiding it if
+    the library has not changed.
+
+    The cache is enabled by setting the ``ROBOT_LIBRARY_CACHE`` environment
+    variable to a directory where to store cache files. Cache files are
+    keyed by the library source files, the library name, version and
+    initialization arguments as well as by Robot Framework and Python versions.
+    Cache files also contain hashes of the files where keywords are
+    implemented, and cached data is not used if any of these files has changed.
+    Libraries having initialization arguments other than strings, numbers,
+    booleans, ``None`` and containers of them are not cached, because
+    representations of other objects can differ between runs. At most
+    :attr:`max_entries` of the most recently used cache files are preserved
+    per library. The cache directory must not be writable by untrusted users,
+    because cache files are loaded using :mod:`pickle`.
+
+    New in Robot Framework 7.5.
+    """
+
+    max_entries = 10
+
+    def __init__(
+        self,
+        library: "TestLibrary",
+        names: "list[str] | None" = None,
+        directory: "Path | str | None" = None,
+    ):
+        self.library = library
+        self.names = names
+        if directory is None:
+            directory = os.getenv("ROBOT_LIBRARY_CACHE", "")
+        if str(directory).upper() in ("", "NONE"):
+            self.directory = None
+        else:
+            self.directory = Path(directory)
+
+    @cached_property
+    def path(self) -> "Path | None":
+        if not self.directory:
+            return None
+        key = self._get_key()
+        return self.directory / f"{self._prefix}-{key}.pickle" if key else None
+
+    @property
+    def _prefix(self) -> str:
+        return re.sub(r"[^\w.-]", "_", self.library.real_name)
+
+    def _get_key(self) -> "str | None":
+        library = self.library
+        # Keywords of the Remote library depend on the remote server.
+        if library.real_name == "Remote":
+            return None
+        if not self._is_stable([library.init.positional, library.init.named]):
+            return None
+        files = self._files
+        if not files:
+            return None
+        digest = hashlib.sha256()
+        for item in (
+            VERSION,
+            sys.version,
+            type(library).__name__,
+            library.real_name,
+            library.version,
+            library.init.positional,
+            library.init.named,
+            self.names,
+        ):
+            digest.update(repr(item).encode("UTF-8") + b"\0")
+        for path in files:
+            try:
+                digest.update(path.read_bytes())
+            except OSError:
+                return None
+        return digest.hexdigest()
+
+    def _is_stable(self, value: Any) -> bool:
+        # Representations of other objects can contain memory addresses or
+        # otherwise differ between runs. Using them in the key would create
+        # a new cache file every time.
+        if isinstance(value, (list, tuple)):
+            return all(self._is_stable(item) for item in value)
+        if isinstance(value, dict):
+            return all(self._is_stable(item) for item in value.items())
+        return value is None or isinstance(value, (str, bytes, int, float))
+
+    @cached_property
+    def _files(self) -> "list[Path]":
+        source = self.library.source
+        if not (source and source.is_file()):
+            return []
+        files = [source]
+        code = self.library.code
+        for cls in inspect.getmro(code) if inspect.isclass(code) else ():
+            try:
+                path = Path(inspect.getfile(cls))
+            except TypeError:  # Built-in classes.
+                continue
+            if path not in files and path.is_file():
+                files.append(path)
+        return files
+
+    def load(self) -> Any:
+        """Returns cached data or ``None`` if there is no valid cache."""
+        if not self.path:
+            return None
+        try:
+            with open(self.path, "rb") as file:
+                digests, data = pickle.load(file)
+        except Exception:  # Missing or invalid cache file.
+            return None
+        # Keywords can be implemented in files not included in the key,
+        # for example, in modules a module library imports keywords from.
+        if self._get_digests(digests) != digests:
+            return None
+        # Update the modification time to tell pruning the file is in use.
+        try:
+            os.utime(self.path)
+        except OSError:
+            pass
+        return data
+
+    def save(self, data: Any, sources: "Iterable[Path | None]" = ()):
+        """Saves data to the cache.
+
+        :param sources: Source files of the cached keywords. Cached data is
+            not used later if any of them has changed.
+        """
+        if not self.path:
+            return
+        files = {s for s in sources if s and s not in self._files and s.is_file()}
+        digests = self._get_digests(files)
+        if digests is None:
+            return
+        # Write to a temporary file first to avoid concurrent processes seeing
+        # partially written files.
+        temp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(temp, "wb") as file:
+                pickle.dump((digests, data), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp, self.path)
+            self._prune()
+        except Exception as err:
+            self.library._logger.debug(
+                f"Caching keywords of library '{self.library.name}' failed: {err}"
+            )
+            if temp.exists():
+                temp.unlink()
+
+    def _prune(self):
+        # Old files are left behind when libraries or their arguments change.
+        # Other processes can remove files concurrently.
+        pattern = f"{self._prefix}-{'?' * 64}.pickle"
+        try:
+            paths = sorted(
+                self.directory.glob(pattern),
+                key=lambda path: path.stat().st_mtime,
+                reverse=True,
+            )
+            for path in paths[self.max_entries :]:
+                path.unlink()
+        except OSError:
+            pass
+
+    def _get_digests(self, files: "Iterable[Path]") -> "dict[Path, str] | None":
+        digests = {}
+        for path in files:
+            try:
+                digests[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                return None
+        return digests
@@ -59,19 +59,20 @@ class ScopeManager:
     def close_global_listeners(self):
         pass
 
-    def register_listeners(self):
+    def register_listeners(self, registered: "list | None" = None):
         if self.library.listeners:
             try:
                 listeners = EXECUTION_CONTEXTS.current.output.library_listeners
-                listeners.register(self.library)
+                listeners.register(self.library, registered)
             except DataError as err:
                 self.library._has_listeners = False
                 self.library.report_error(f"Registering listeners failed: {err}")
 
-    def unregister_listeners(self, close=False):
-        if self.library.listeners:
-            listeners = EXECUTION_CONTEXTS.current.output.library_listeners
-            listeners.unregister(self.library, close)
+    def unregister_listeners(self, close=False) -> list:
+        if not self.library.listeners:
+            return []
+        listeners = EXECUTION_CONTEXTS.current.output.library_listeners
+        return listeners.unregister(self.library, close)
 
 
 class GlobalScopeManager(ScopeManager):
@@ -105,8 +106,14 @@ class SuiteScopeManager(ScopeManager):
 
 class TestScopeManager(SuiteScopeManager):
 
+    def __init__(self, library):
+        super().__init__(library)
+        self.listener_cache = []
+
     def start_test(self):
-        self.unregister_listeners()
+        # Listeners of the suite level instance are restored after the test
+        # to avoid importing them again.
+        self.listener_cache.append(self.unregister_listeners())
         self.instance_cache.append(self.library._instance)
         self.library.instance = None
         self.register_listeners()
@@ -114,4 +121,4 @@ class TestScopeManager(SuiteScopeManager):
     def end_test(self):
         self.unregister_listeners(close=True)
         self.library.instance = self.instance_cache.pop()
-        self.register_listeners()
+        self.register_listeners(self.listener_cache.pop() or None)
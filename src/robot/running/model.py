@@ -919,7 +919,7 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
                     output = Output(settings)
                     runner = SuiteRunner(output, settings)
                     self.visit(runner)
-                output.close(runner.result)
+                output.close(runner.result, runner.statistics)
         return runner.result
 
     def to_dict(self) -> DataDict:
@@ -340,27 +340,12 @@ class KeywordStore:
         return runner
 
     def _get_bdd_style_runner(self, name):
-        # TODO: Consider using 'startswith' instead of regexps for checking does any
-        # prefix match. That ought to make that check a bit faster (especially if the
-        # tuple of prefixes is pre-built in 'Languages'), but finding the keyword if
-        # there's a match can be a bit slower. It also makes it explicit that prefixes
-        # are constants, not patterns, and allows deprecating 'bdd_prefix_regexp'.
-        match = self.languages.bdd_prefix_regexp.match(name)
-        if not match:
-            return None
-        runner = self._get_runner(name[match.end() :], strip_bdd_prefix=False)
-        if runner:
-            return runner
-        # Some prefix matched, but there was no matching keyword. Go through all
-        # prefixes individually to see were there possibly multiple matching ones.
+        # If there are multiple matching prefixes, the longest one is tried first.
         # https://github.com/robotframework/robotframework/issues/5456
-        name = " ".join(name.split()).title()  # Normalize spaces and case.
-        for prefix in sorted(self.languages.bdd_prefixes, key=len, reverse=True):
-            prefix += " "
-            if name.startswith(prefix):
-                runner = self._get_runner(name[len(prefix) :], strip_bdd_prefix=False)
-                if runner:
-                    return runner
+        for _, rest in self.languages.split_bdd_prefix(name):
+            runner = self._get_runner(rest, strip_bdd_prefix=False)
+            if runner:
+                return runner
         return None
 
     def _get_implicit_runner(self, name):
@@ -14,9 +14,11 @@
 #  limitations under the License.
 
 from datetime import datetime
+from itertools import chain
 
 from robot.errors import ExecutionStatus, PassExecution
-from robot.model import SuiteVisitor, TagPatterns
+from robot.model import Statistics, SuiteVisitor, TagPatterns
+from robot.output.listeners import ListenerV3Facade
 from robot.result import (
     Keyword as KeywordResult, Result, TestCase as TestResult, TestSuite as SuiteResult
 )
@@ -46,6 +48,40 @@ class SuiteRunner(SuiteVisitor):
         self.skipped_tags = TagPatterns(
             settings.skip, "finding tests to be skipped based on tags"
         )
+        self.statistics = self._create_statistics()
+
+    def _create_statistics(self):
+        return Statistics(rpa=self.settings.rpa, **self.settings.statistics_config)
+
+    def _rebuild_statistics(self, running_test=None):
+        # Needed if statuses of already ended tests change or if new combined tag
+        # statistics are added. Suites and tests still running are not ended.
+        running = [running_test]
+        suite = self.suite_result
+        while suite is not None:
+            running.append(suite)
+            suite = suite.parent
+        self.statistics = self._create_statistics()
+        self._add_to_statistics(self.result.suite, running)
+
+    def _add_to_statistics(self, suite, running):
+        self.statistics.start_suite(suite)
+        for test in suite.tests:
+            if not any(test is item for item in running):
+                self.statistics.add_test(test)
+        for child in suite.suites:
+            self._add_to_statistics(child, running)
+        if not any(suite is item for item in running):
+            self.statistics.end_suite(suite)
+
+    def _has_end_suite_listeners(self):
+        # Listener v3 `end_suite` methods can change results of already
+        # ended tests.
+        listeners = chain(self.output.listeners, self.output.library_listeners)
+        return any(
+            isinstance(listener, ListenerV3Facade) and listener.end_suite
+            for listener in listeners
+        )
 
     @property
     def context(self):
@@ -77,6 +113,7 @@ class SuiteRunner(SuiteVisitor):
         else:
             self.suite_result.suites.append(result)
         self.suite_result = result
+        self.statistics.start_suite(result)
         self.suite_status = SuiteStatus(
             self.suite_status,
             self.settings.exit_on_failure,
@@ -135,9 +172,13 @@ class SuiteRunner(SuiteVisitor):
                     self.suite_result.suite_teardown_skipped(str(failure))
                 else:
                     self.suite_result.suite_teardown_failed(str(failure))
+                self._rebuild_statistics()
         self.suite_result.end_time = datetime.now()
         self.suite_result.message = self.suite_status.message
         self.context.end_suite(suite, self.suite_result)
+        if self._has_end_suite_listeners():
+            self._rebuild_statistics()
+        self.statistics.end_suite(self.suite_result)
         self._clear_result(self.suite_result)
         self.executed.pop()
         self.suite_result = self.suite_result.parent
@@ -178,7 +219,7 @@ class SuiteRunner(SuiteVisitor):
             settings.rpa,
         )
         if status.exit:
-            self._add_exit_combine()
+            self._add_exit_combine(result)
             result.tags.add("robot:exit")
         if status.passed:
             if not data.error:
@@ -229,6 +270,7 @@ class SuiteRunner(SuiteVisitor):
         failed_before_listeners = result.failed
         # TODO: can this be removed to context
         self.output.end_test(data, result)
+        self.statistics.add_test(result)
         if result.failed and not failed_before_listeners:
             status.failure_occurred()
         self.context.end_test(result)
@@ -248,10 +290,11 @@ class SuiteRunner(SuiteVisitor):
         if hasattr(result, "body"):
             result.body.clear()
 
-    def _add_exit_combine(self):
+    def _add_exit_combine(self, running_test):
         exit_combine = ("NOT robot:exit", "")
         if exit_combine not in self.settings["TagStatCombine"]:
             self.settings["TagStatCombine"].append(exit_combine)
+            self._rebuild_statistics(running_test)
 
     def _get_timeout(self, test: TestData):
         if not test.timeout:
@@ -27,12 +27,14 @@ from robot.utils import (
     NormalizedDict, seq2str2, setter, type_name
 )
 
-from .arguments import CustomArgumentConverters
+from .arguments import ArgumentSpec, CustomArgumentConverters
 from .dynamicmethods import GetKeywordDocumentation, GetKeywordNames, RunKeyword
 from .keywordfinder import KeywordFinder
+from .librarycache import LibraryCache
 from .librarykeyword import DynamicKeyword, LibraryInit, LibraryKeyword, StaticKeyword
 from .libraryscopes import Scope, ScopeManager
 from .outputcapture import OutputCapturer
+from .runkwregister import RUN_KW_REGISTER
 
 Self = TypeVar("Self", bound="TestLibrary")
 
@@ -421,6 +423,7 @@ class KeywordCreator:
     def __init__(self, library: TestLibrary, getting_method_failed_level="INFO"):
         self.library = library
         self.getting_method_failed_level = getting_method_failed_level
+        self._cache_entries = []
 
     def get_keyword_names(self) -> "list[str]":
         raise NotImplementedError
@@ -430,6 +433,11 @@ class KeywordCreator:
         library.keyword_finder.invalidate_cache()
         instance = library.instance
         keywords = library.keywords = []
+        cache = LibraryCache(library, names)
+        entries = cache.load()
+        if entries is not None:
+            self._create_keywords_from_cache(entries)
+            return
         if names is None:
             names = self.get_keyword_names()
         seen = NormalizedDict(ignore="_")
@@ -452,7 +460,59 @@ class KeywordCreator:
                     self._adding_keyword_failed(kw.name, err.message, err.details)
                 else:
                     keywords.append(kw)
+                    self._cache_entries.append(("keyword", kw))
                     library._logger.debug(f"Created keyword '{kw.name}'.")
+        if cache.path:
+            cache.save(
+                [
+                    (kind, self._get_cache_data(data) if kind == "keyword" else data)
+                    for kind, data in self._cache_entries
+                ],
+                sources=[kw.source for kw in keywords],
+            )
+
+    def _get_cache_data(self, kw: LibraryKeyword) -> tuple:
+        args = kw.args.copy()
+        args.name = None
+        return (
+            self._get_creator_name(kw),
+            kw.name,
+            args,
+            kw._doc,
+            list(kw.tags),
+            kw.error,
+        )
+
+    def _get_creator_name(self, kw: LibraryKeyword) -> str:
+        raise NotImplementedError
+
+    def _create_keywords_from_cache(self, entries: "list[tuple[str, tuple]]"):
+        library = self.library
+        for kind, data in entries:
+            if kind == "keyword":
+                kw = self._create_cached_keyword(*data)
+                kw.args.name = lambda kw=kw: kw.full_name
+                library.keywords.append(kw)
+                library._logger.debug(f"Created keyword '{kw.name}'.")
+            else:
+                self._adding_keyword_failed(*data)
+
+    def _create_cached_keyword(
+        self,
+        creator_name: str,
+        name: str,
+        args: ArgumentSpec,
+        doc: str,
+        tags: "list[str]",
+        error: "str | None",
+    ) -> LibraryKeyword:
+        raise NotImplementedError
+
+    def _get_resolve_args_until(self, creator_name: str) -> "int | None":
+        real_name = self.library.real_name
+        if RUN_KW_REGISTER.is_run_keyword(real_name, creator_name):
+            return RUN_KW_REGISTER.get_args_to_process(real_name, creator_name)
+        return None
 
     def _create_keyword(self, instance, name) -> "LibraryKeyword | None":
         raise NotImplementedError
@@ -482,6 +542,7 @@ class KeywordCreator:
         kw.args.embedded = kw.embedded.args
 
     def _adding_keyword_failed(self, name, error, details, level="ERROR"):
+        self._cache_entries.append(("error", (name, error, details, level)))
         self.library.report_error(
             f"Adding keyword '{name}' failed: {error}",
             details,
@@ -567,6 +628,23 @@ class StaticKeywordCreator(KeywordCreator):
             self._adding_keyword_failed(name, err.message, err.details)
         return None
 
+    def _get_creator_name(self, kw: StaticKeyword) -> str:
+        return kw.method_name
+
+    def _create_cached_keyword(
+        self, creator_name, name, args, doc, tags, error
+    ) -> StaticKeyword:
+        return StaticKeyword(
+            creator_name,
+            self.library,
+            name,
+            args,
+            doc,
+            tags,
+            self._get_resolve_args_until(creator_name),
+            error=error,
+        )
+
     def _pre_validate_method(self, instance, name):
         try:
             candidate = inspect.getattr_static(instance, name)
@@ -601,3 +679,19 @@ class DynamicKeywordCreator(KeywordCreator):
 
     def _create_keyword(self, instance, name) -> DynamicKeyword:
         return DynamicKeyword.from_name(name, self.library)
+
+    def _get_creator_name(self, kw: DynamicKeyword) -> str:
+        return kw._orig_name
+
+    def _create_cached_keyword(
+        self, creator_name, name, args, doc, tags, error
+    ) -> DynamicKeyword:
+        return DynamicKeyword(
+            self.library,
+            creator_name,
+            args,
+            doc,
+            tags,
+            self._get_resolve_args_until(creator_name),
+            error=error,
+        )
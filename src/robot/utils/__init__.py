@@ -64,6 +64,7 @@ from .escaping import (
 )
 from .etreewrapper import ETSource as ETSource
 from .filereader import FileReader as FileReader, Source as Source
+from .filewatcher import FileWatcher as FileWatcher
 from .frange import frange as frange
 from .importer import Importer as Importer
 from .json import JsonDumper as JsonDumper, JsonLoader as JsonLoader
@@ -78,7 +79,14 @@ from .markupwriters import (
     NullMarkupWriter as NullMarkupWriter,
     XmlWriter as XmlWriter,
 )
-from .match import eq as eq, Matcher as Matcher, MultiMatcher as MultiMatcher
+from .match import (
+    compile_pattern as compile_pattern,
+    eq as eq,
+    Matcher as Matcher,
+    MultiMatcher as MultiMatcher,
+    PATTERN_CACHE as PATTERN_CACHE,
+    PatternCache as PatternCache,
+)
 from .misc import (
     classproperty as classproperty,
     isatty as isatty,
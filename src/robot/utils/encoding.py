@@ -34,15 +34,17 @@ def console_decode(string, encoding=CONSOLE_ENCODING):
     it is possible to use case-insensitive values `CONSOLE` and `SYSTEM` to
     use the system console and system encoding, respectively.
 
-    If `string` is already Unicode, it is returned as-is.
+    If `string` is already Unicode, it is returned as-is. In addition to
+    `bytes`, other objects supporting the buffer protocol, such as `mmap`,
+    are supported as well.
     """
     if isinstance(string, str):
         return string
     encoding = CUSTOM_ENCODINGS.get(encoding.upper(), encoding)
     try:
-        return string.decode(encoding)
+        return str(string, encoding)
     except UnicodeError:
-        return safe_str(string)
+        return safe_str(bytes(string))
 
 
 def console_encode(
@@ -0,0 +1,230 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import ctypes
+import glob
+import os
+import selectors
+import struct
+import sys
+import time
+from typing import Iterable
+
+# Flags from <sys/inotify.h>.
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+WATCH_MASK = (
+    IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+EVENT = struct.Struct("iIII")
+
+
+class FileWatcher:
+    """Waits for files and directories to be created or removed.
+
+    Watched paths can be exact paths or glob patterns. On Linux changes are
+    detected using inotify, and :meth:`wait` returns immediately when a file
+    or a directory is created, removed or moved in a directory where one of
+    the watched paths could exist. Elsewhere, or if inotify cannot be used,
+    :meth:`wait` simply sleeps for a short period.
+
+    The watcher does not know what the caller is waiting for, and the caller
+    must check its condition after each :meth:`wait`::
+
+        with FileWatcher(paths) as watcher:
+            while not condition():
+                watcher.wait(timeout)
+    """
+
+    poll_interval = 0.1
+    recheck_interval = 1.0
+
+    def __init__(self, paths: Iterable[str]):
+        self.paths = list(paths)
+        self._inotify = _Inotify.acquire()
+        self._watches: dict[str, int] = {}
+        self._update()
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify is not None
+
+    def wait(self, timeout: "float | None" = None):
+        """Waits until a change is detected or the timeout expires.
+
+        Also with inotify the wait is at most :attr:`recheck_interval`
+        seconds to be safe, for example, with network file systems where
+        all changes are not reported.
+        """
+        if timeout is not None and timeout <= 0:
+            return
+        if not self._inotify:
+            time.sleep(min(timeout or self.poll_interval, self.poll_interval))
+            return
+        timeout = min(timeout or self.recheck_interval, self.recheck_interval)
+        ignored = self._inotify.wait(timeout)
+        if ignored is not None:
+            self._update(ignored)
+
+    def _update(self, ignored: Iterable[int] = ()):
+        if not self._inotify:
+            return
+        ignored = set(ignored)
+        for directory, wd in list(self._watches.items()):
+            if wd in ignored:
+                self._watches.pop(directory)
+        directories = set()
+        for path in self.paths:
+            directories.update(self._get_directories(path))
+        for directory in set(self._watches) - directories:
+            self._inotify.remove_watch(self._watches.pop(directory))
+        for directory in directories - set(self._watches):
+            try:
+                self._watches[directory] = self._inotify.add_watch(directory)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # For example, the maximum number of watches has been reached.
+                self.close()
+                return
+
+    def _get_directories(self, path: str) -> "set[str]":
+        """Returns directories where changes can affect the given path.
+
+        The parent directory is watched if it exists, otherwise the nearest
+        existing ancestor. With glob patterns also directories matching
+        the pattern on all levels are watched, because matching paths can
+        appear under any of them.
+        """
+        directories = set()
+        current = os.path.dirname(path)
+        while True:
+            matches = self._get_matching_directories(current)
+            directories.update(matches)
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            if matches and not glob.has_magic(current):
+                break
+            current = parent
+        return directories
+
+    def _get_matching_directories(self, pattern: str) -> "list[str]":
+        if os.path.isdir(pattern):
+            return [pattern]
+        if not glob.has_magic(pattern):
+            return []
+        return [p for p in glob.glob(pattern) if os.path.isdir(p)]
+
+    def close(self):
+        if self._inotify:
+            for wd in self._watches.values():
+                self._inotify.remove_watch(wd)
+            self._watches.clear()
+            self._inotify.release()
+            self._inotify = None
+
+    def __enter__(self) -> "FileWatcher":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _Inotify:
+    """Minimal inotify wrapper using ``ctypes``.
+
+    Closing an inotify instance that has had watches can take tens of
+    milliseconds, so instances are not closed but reused instead.
+    """
+
+    _pool: "list[_Inotify]" = []
+
+    def __init__(self, libc):
+        self._libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            self._raise_error()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.fd, selectors.EVENT_READ)
+
+    @classmethod
+    def acquire(cls) -> "_Inotify | None":
+        try:
+            return cls._pool.pop()
+        except IndexError:
+            return cls.create()
+
+    def release(self):
+        self.wait(0)
+        self._pool.append(self)
+
+    @classmethod
+    def create(cls) -> "_Inotify | None":
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            libc.inotify_add_watch.argtypes = [
+                ctypes.c_int,
+                ctypes.c_char_p,
+                ctypes.c_uint32,
+            ]
+            return cls(libc)
+        except (AttributeError, OSError):
+            return None
+
+    def add_watch(self, directory: str) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            self._raise_error(directory)
+        return wd
+
+    def remove_watch(self, wd: int):
+        # Fails if the watch has already been removed, which is fine.
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def wait(self, timeout: float) -> "list[int] | None":
+        """Waits for events and returns removed watches or ``None`` on timeout."""
+        if not self._selector.select(timeout):
+            return None
+        ignored = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return ignored
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT.unpack_from(data, offset)
+                if mask & IN_IGNORED:
+                    ignored.append(wd)
+                offset += EVENT.size + length
+
+    def _raise_error(self, filename: "str | None" = None):
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), filename)
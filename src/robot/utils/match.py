@@ -15,7 +15,9 @@
 
 import fnmatch
 import re
-from typing import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from threading import Lock
+from typing import AnyStr, Iterable, Iterator, Sequence
 
 from .normalizing import normalize
 
@@ -32,6 +34,87 @@ def eq(
     return str1 == str2
 
 
+@dataclass(frozen=True)
+class PatternCacheInfo:
+    """Statistics about a :class:`PatternCache`."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class PatternCache:
+    """Bounded cache for compiled regular expressions and glob patterns.
+
+    Python's :mod:`re` module has an internal cache as well, but it is
+    relatively small and shared by everything in the process, and glob
+    patterns need to be translated to regular expressions before they can
+    be used with it. This cache is used by :class:`Matcher` and standard
+    libraries. When the cache is full, the least recently used pattern is
+    discarded. Statistics can be inspected using :meth:`info` for profiling.
+
+    New in Robot Framework 7.5.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._patterns: "dict[tuple, re.Pattern]" = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    def compile(
+        self,
+        pattern: AnyStr,
+        flags: int = 0,
+        glob: bool = False,
+    ) -> "re.Pattern[AnyStr]":
+        """Returns ``pattern`` compiled to a regular expression.
+
+        If ``glob`` is true, ``pattern`` is considered a glob pattern and
+        it is translated to a regular expression using :func:`fnmatch.translate`.
+        Invalid patterns raise :class:`re.error` and are not cached.
+        """
+        key = (type(pattern), pattern, flags, glob)
+        with self._lock:
+            compiled = self._patterns.pop(key, None)
+            if compiled is not None:
+                self._hits += 1
+                self._patterns[key] = compiled
+                return compiled
+            self._misses += 1
+        compiled = re.compile(fnmatch.translate(pattern) if glob else pattern, flags)
+        with self._lock:
+            self._patterns[key] = compiled
+            while len(self._patterns) > self.maxsize:
+                self._patterns.pop(next(iter(self._patterns)))
+        return compiled
+
+    def info(self) -> PatternCacheInfo:
+        with self._lock:
+            return PatternCacheInfo(
+                self._hits, self._misses, len(self._patterns), self.maxsize
+            )
+
+    def clear(self):
+        """Removes cached patterns and resets statistics."""
+        with self._lock:
+            self._patterns.clear()
+            self._hits = self._misses = 0
+
+
+PATTERN_CACHE = PatternCache()
+
+
+def compile_pattern(pattern: AnyStr, flags: int = 0) -> "re.Pattern[AnyStr]":
+    """Compiles ``pattern`` to a regular expression using :data:`PATTERN_CACHE`.
+
+    New in Robot Framework 7.5.
+    """
+    return PATTERN_CACHE.compile(pattern, flags)
+
+
 class Matcher:
 
     def __init__(
@@ -51,15 +134,14 @@ class Matcher:
         self._regexp = self._compile(self._normalize(pattern), regexp=regexp)
 
     def _compile(self, pattern, regexp=False):
-        if not regexp:
-            pattern = fnmatch.translate(pattern)
-        return re.compile(pattern, re.DOTALL)
+        return PATTERN_CACHE.compile(pattern, re.DOTALL, glob=not regexp)
 
     def match(self, string: str) -> bool:
         return self._regexp.match(self._normalize(string)) is not None
 
     def match_any(self, strings: Iterable[str]) -> bool:
-        return any(self.match(s) for s in strings)
+        match, normalize = self._regexp.match, self._normalize
+        return any(match(normalize(s)) for s in strings)
 
     def __bool__(self) -> bool:
         return bool(self._normalize(self.pattern))
@@ -81,6 +163,18 @@ class MultiMatcher(Iterable[Matcher]):
             for pattern in self._ensure_iterable(patterns)
         ]
         self.match_if_no_patterns = match_if_no_patterns
+        self._regexp = self._combine(self.matchers) if not regexp else None
+
+    def _combine(self, matchers):
+        # Matching all glob patterns using one regexp is considerably faster than
+        # matching them one by one. Custom regexps are not combined, because
+        # possible backreferences in them would not work anymore.
+        # Duplicate patterns are removed, because compiled patterns are cached
+        # and on Python < 3.11 same translated globs contain same group names.
+        if len(matchers) < 2:
+            return None
+        pattern = "|".join(dict.fromkeys(m._regexp.pattern for m in matchers))
+        return re.compile(pattern, re.DOTALL)
 
     def _ensure_iterable(self, patterns):
         if patterns is None:
@@ -90,11 +184,17 @@ class MultiMatcher(Iterable[Matcher]):
         return patterns
 
     def match(self, string: str) -> bool:
+        if self._regexp:
+            string = self.matchers[0]._normalize(string)
+            return self._regexp.match(string) is not None
         if self.matchers:
             return any(m.match(string) for m in self.matchers)
         return self.match_if_no_patterns
 
     def match_any(self, strings: Iterable[str]) -> bool:
+        if self._regexp:
+            match, normalize = self._regexp.match, self.matchers[0]._normalize
+            return any(match(normalize(s)) for s in strings)
         return any(self.match(s) for s in strings)
 
     def __len__(self) -> int:
@@ -17,6 +17,7 @@ import re
 import time
 import warnings
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from .misc import plural_or_not as s
 from .normalizing import normalize
@@ -50,15 +51,28 @@ def timestr_to_secs(
     The result is rounded according to the `round_to` argument.
     Use `round_to=None` to disable rounding altogether.
     """
-    if isinstance(timestr, (str, int, float)):
-        converters = [_number_to_secs, _timer_to_secs, _time_string_to_secs]
-        for converter in converters:
-            secs = converter(timestr)
-            if secs is not None:
-                return secs if round_to is None else round(secs, round_to)
-    if isinstance(timestr, timedelta):
+    if isinstance(timestr, (int, float)):
+        secs = float(timestr)
+    elif isinstance(timestr, str):
+        secs = _timestr_to_secs(timestr)
+    elif isinstance(timestr, timedelta):
         return timestr.total_seconds()
-    raise ValueError(f"Invalid time string '{timestr}'.")
+    else:
+        secs = None
+    if secs is None:
+        raise ValueError(f"Invalid time string '{timestr}'.")
+    return secs if round_to is None else round(secs, round_to)
+
+
+@lru_cache(maxsize=1024)
+def _timestr_to_secs(timestr: str) -> "float | None":
+    # Same time strings, such as timeouts and retry intervals, are typically
+    # used over and over again and normalizing them is relatively expensive.
+    for converter in [_number_to_secs, _timer_to_secs, _time_string_to_secs]:
+        secs = converter(timestr)
+        if secs is not None:
+            return secs
+    return None
 
 
 def _number_to_secs(number):
@@ -316,6 +330,11 @@ def parse_timestamp(timestamp: "str | datetime") -> datetime:
     """
     if isinstance(timestamp, datetime):
         return timestamp
+    return _parse_timestamp(timestamp)
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(timestamp: str) -> datetime:
     try:
         return datetime.fromisoformat(timestamp)
     except ValueError:
@@ -31,6 +31,14 @@ class TestExposedApi(unittest.TestCase):
         assert_equal(api.get_resource_tokens, parsing.get_resource_tokens)
         assert_equal(api.Token, parsing.Token)
 
+    def test_star_import(self):
+        namespace = {}
+        exec("from robot.api import *", namespace)  # noqa: S102
+        for name in api._LAZY_IMPORTS:
+            assert_equal(namespace[name], getattr(api, name))
+        assert_equal(namespace["SkipExecution"], api.SkipExecution)
+        assert_true("import_module" not in namespace)
+
     def test_parsing_getters(self):
         assert_equal(api_parsing.get_model, parsing.get_model)
         assert_equal(api_parsing.get_resource_model, parsing.get_resource_model)
@@ -0,0 +1,73 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import robot
+from robot.utils.asserts import assert_equal, assert_true
+
+SRC = Path(robot.__file__).parent.parent
+HEAVY = [
+    "robot.conf.settings",
+    "robot.libraries.BuiltIn",
+    "robot.parsing",
+    "robot.reporting",
+    "robot.result",
+    "robot.running",
+]
+
+
+def import_in_subprocess(*modules):
+    code = f"""
+import sys, time
+start = time.perf_counter()
+{"; ".join(f"import {m}" for m in modules)}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(" ".join(m for m in {HEAVY!r} if m in sys.modules))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+    )
+    assert_equal(result.returncode, 0, result.stderr)
+    elapsed, heavy = (result.stdout.splitlines() + [""])[:2]
+    return float(elapsed), heavy.split()
+
+
+class TestImportTime(unittest.TestCase):
+
+    def _verify_lightweight(self, *modules):
+        elapsed, heavy = import_in_subprocess(*modules)
+        assert_equal(heavy, [], f"Importing {modules} imported heavy modules.")
+        return elapsed
+
+    def test_robot(self):
+        self._verify_lightweight("robot")
+
+    def test_api(self):
+        self._verify_lightweight("robot.api")
+
+    def test_deco(self):
+        self._verify_lightweight("robot.api.deco")
+
+    def test_logger(self):
+        self._verify_lightweight("robot.api.logger")
+
+    def test_languages(self):
+        self._verify_lightweight("robot.conf.languages")
+
+    def test_lightweight_import_is_faster_than_importing_everything(self):
+        # Each measurement is done multiple times to avoid random variation.
+        light = min(self._verify_lightweight("robot") for _ in range(3))
+        full = min(
+            import_in_subprocess("robot.api", "robot.running", "robot.reporting")[0]
+            for _ in range(3)
+        )
+        assert_true(light < full, f"'import robot' took {light}s, all {full}s.")
+
+
+if __name__ == "__main__":
+    unittest.main()
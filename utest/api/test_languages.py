@@ -8,7 +8,7 @@ from robot.conf import languages
 from robot.conf.languages import En, Fi, PtBr, Th
 from robot.errors import DataError
 from robot.utils.asserts import (
-    assert_equal, assert_not_equal, assert_raises, assert_raises_with_msg
+    assert_equal, assert_not_equal, assert_raises, assert_raises_with_msg, assert_true
 )
 
 STANDARD_LANGUAGES = Language.__subclasses__()
@@ -249,6 +249,41 @@ class TestLanguages(unittest.TestCase):
             languages.add_language(lang)
         assert_equal(list(languages), to_add)
 
+    def test_split_bdd_prefix(self):
+        languages = Languages()
+        assert_equal(languages.split_bdd_prefix("Given x"), [("Given", "x")])
+        assert_equal(
+            languages.split_bdd_prefix("and   the   thing"), [("And", "the   thing")]
+        )
+        assert_equal(languages.split_bdd_prefix("Given"), [])
+        assert_equal(languages.split_bdd_prefix("Givenx y"), [])
+        assert_equal(languages.split_bdd_prefix("Keyword"), [])
+
+    def test_split_bdd_prefix_with_multiple_matches(self):
+        class X(Language):
+            given_prefixes = ["a", "A b", "a b c"]
+
+        languages = Languages(X(), add_english=False)
+        assert_equal(
+            languages.split_bdd_prefix("A B C D"),
+            [("A B C", "D"), ("A B", "C D"), ("A", "B C D")],
+        )
+        assert_equal(languages.split_bdd_prefix("a b c"), [("A B", "c"), ("A", "b c")])
+
+    def test_split_bdd_prefix_after_adding_language(self):
+        languages = Languages()
+        assert_equal(languages.split_bdd_prefix("Oletetaan x"), [])
+        languages.add_language("fi")
+        assert_equal(languages.split_bdd_prefix("Oletetaan x"), [("Oletetaan", "x")])
+
+    def test_instances_are_independent(self):
+        first, second = Languages("fi"), Languages("fi")
+        first.add_language("de")
+        first.settings["Custom"] = "Tags"
+        assert_equal(second.settings["Tagit"], "Tags")
+        assert_true("Custom" not in second.settings)
+        assert_true("Angenommen" not in second.bdd_prefixes)
+
 
 class TestDeprecation(unittest.TestCase):
 
@@ -1,7 +1,9 @@
+import json
 import sys
 import tempfile
 import unittest
 from io import StringIO
+from pathlib import Path
 
 from robot import libdoc
 from robot.utils.asserts import assert_equal
@@ -48,5 +50,132 @@ class TestLibdoc(unittest.TestCase):
         assert_equal(doc.name, "OperatingSystem")
 
 
+class TestLibdocBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.source = Path(self.tempdir.name, "src")
+        self.output = Path(self.tempdir.name, "out")
+        for path, content in [
+            ("first.resource", "*** Keywords ***\nFirst\n    No Operation\n"),
+            ("sub/second.resource", "*** Keywords ***\nSecond\n    No Operation\n"),
+            ("sub/Library.py", "def keyword():\n    pass\n"),
+            ("_private/ignored.resource", ""),
+            ("ignored.txt", ""),
+        ]:
+            path = self.source / path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="UTF-8")
+        sys.stdout = StringIO()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+        sys.stdout = sys.__stdout__
+
+    def test_generate(self):
+        entries = libdoc.LibdocBatch(self.output).build(self.source)
+        assert_equal(
+            [(e["output"], e["name"], e["type"], e["status"]) for e in entries],
+            [
+                ("first.html", "first", "RESOURCE", "generated"),
+                ("sub/Library.html", "Library", "LIBRARY", "generated"),
+                ("sub/second.html", "second", "RESOURCE", "generated"),
+            ],
+        )
+        for entry in entries:
+            assert (self.output / entry["output"]).is_file()
+        with open(self.output / "index.json", encoding="UTF-8") as file:
+            index = json.load(file)
+        assert_equal(
+            [e["output"] for e in index["entries"]],
+            [e["output"] for e in entries],
+        )
+        with open(self.output / "index.html", encoding="UTF-8") as file:
+            assert '<a href="sub/second.html">second</a>' in file.read()
+
+    def test_unchanged_sources_are_skipped(self):
+        batch = libdoc.LibdocBatch(self.output, format="JSON", processes=1)
+        batch.build(self.source)
+        (self.source / "first.resource").write_text(
+            "*** Keywords ***\nChanged\n    No Operation\n", encoding="UTF-8"
+        )
+        (self.output / "sub/second.json").unlink()
+        entries = batch.build(self.source)
+        assert_equal(
+            [(e["output"], e["status"]) for e in entries],
+            [
+                ("first.json", "generated"),
+                ("sub/Library.json", "unchanged"),
+                ("sub/second.json", "generated"),
+            ],
+        )
+        assert not (self.output / "index.html").exists()
+
+    def test_failures(self):
+        entries = libdoc.LibdocBatch(self.output, processes=1).build(
+            self.source / "first.resource", "NonExisting"
+        )
+        assert_equal(entries[0]["status"], "generated")
+        assert_equal(entries[1]["status"], "failed")
+        assert entries[1]["error"].startswith("Importing library 'NonExisting' failed")
+        with open(self.output / "index.json", encoding="UTF-8") as file:
+            assert_equal(len(json.load(file)["entries"]), 1)
+
+    def test_same_name_with_different_extensions(self):
+        (self.source / "sub/second.py").write_text("", encoding="UTF-8")
+        entries = libdoc.LibdocBatch(self.output, processes=1).build(
+            self.source, self.source / "first.resource", "first"
+        )
+        assert_equal(
+            [(e["output"], e["status"]) for e in entries],
+            [
+                ("first.resource.html", "generated"),
+                ("sub/Library.html", "generated"),
+                ("sub/second.py.html", "generated"),
+                ("sub/second.resource.html", "generated"),
+                ("first.resource.html", "failed"),
+                ("first.html", "failed"),
+            ],
+        )
+        assert_equal(
+            entries[4]["error"],
+            f"Output file 'first.resource.html' is already used by "
+            f"'{self.source / 'first.resource'}'.",
+        )
+        assert entries[5]["error"].startswith("Importing library 'first' failed")
+
+    def test_conflicting_outputs(self):
+        entries = libdoc.LibdocBatch(self.output, processes=1).build(
+            self.source / "sub",
+            self.source / "sub/Library.py::a",
+            self.source / "sub/Library.py::b",
+        )
+        assert_equal(
+            [(e["output"], e["status"]) for e in entries],
+            [
+                ("Library.py.html", "generated"),
+                ("second.html", "generated"),
+                ("Library.py.html", "failed"),
+                ("Library.py.html", "failed"),
+            ],
+        )
+        for entry in entries[2:]:
+            assert_equal(
+                entry["error"],
+                f"Output file 'Library.py.html' is already used by "
+                f"'{self.source / 'sub/Library.py'}'.",
+            )
+
+    def test_cli(self):
+        libdoc.libdoc_cli(
+            ["--processes", "2", str(self.source), f"{self.output}/"], exit=False
+        )
+        assert (self.output / "sub/second.html").is_file()
+        assert_equal(
+            sys.stdout.getvalue().splitlines()[-1],
+            str((self.output / "index.json").absolute()),
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
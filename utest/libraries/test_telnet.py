@@ -0,0 +1,137 @@
+import socket
+import threading
+import time
+import unittest
+
+from robot.libraries.Telnet import NoMatchError, TelnetConnection
+from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
+
+IAC, DO, WONT, ECHO = b"\xff", b"\xfd", b"\xfc", b"\x01"
+
+
+class TestTelnetConnection(unittest.TestCase):
+
+    def setUp(self):
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.client = None
+        self.sender = None
+
+    def tearDown(self):
+        if self.sender:
+            self.sender.join()
+        if self.client:
+            self.client.close()
+        self.conn.close()
+        self.server.close()
+
+    def _connect(self, **config):
+        port = self.server.getsockname()[1]
+        config.setdefault("telnetlib_log_level", "NONE")
+        self.conn = TelnetConnection("127.0.0.1", port, **config)
+        self.client, _ = self.server.accept()
+        self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return self.conn
+
+    def _send(self, *chunks, close=False):
+        # Chunks are sent separately with a delay so that they are received
+        # by separate `recv()` calls.
+        def send():
+            for chunk in chunks:
+                time.sleep(0.05)
+                self.client.sendall(chunk)
+            if close:
+                time.sleep(0.05)
+                self.client.shutdown(socket.SHUT_WR)
+
+        self.sender = threading.Thread(target=send)
+        self.sender.start()
+
+    def _received(self, size):
+        self.client.settimeout(1)
+        data = b""
+        while len(data) < size:
+            data += self.client.recv(size - len(data))
+        return data
+
+    def test_read_until_match_split_across_chunks(self):
+        conn = self._connect()
+        self._send(b"foo hel", b"lo wo", b"rld bar")
+        assert_equal(conn.read_until("hello world"), "foo hello world")
+        self.sender.join()
+        assert_equal(conn.read(), " bar")
+
+    def test_read_until_with_repeating_prefix_split_across_chunks(self):
+        conn = self._connect()
+        self._send(b"a", b"a", b"a", b"b")
+        assert_equal(conn.read_until("aab"), "aaab")
+
+    def test_command_split_across_chunks(self):
+        conn = self._connect()
+        self._send(b"foo" + IAC, DO, ECHO + b"bar" + IAC, IAC + b"zap\r\n")
+        assert_equal(conn.read_until("zap"), "foobarzap")
+        assert_equal(self._received(3), IAC + WONT + ECHO)
+
+    def test_escaped_iac_split_across_chunks(self):
+        conn = self._connect(encoding="ISO-8859-1")
+        self._send(b"x" + IAC, IAC + b"y")
+        assert_equal(conn.read_until("y"), "x\xffy")
+
+    def test_null_and_xon_are_removed(self):
+        conn = self._connect()
+        self._send(b"a\0b", b"\021c")
+        assert_equal(conn.read_until("c"), "abc")
+
+    def test_read_until_regexp(self):
+        conn = self._connect()
+        self._send(b"found 1", b"23 items\r\n")
+        assert_equal(
+            conn.read_until_regexp(r"\d+ items", "no match"), "found 123 items"
+        )
+        assert_equal(conn.read_until_regexp("nomatch", r"\r\n"), "\r\n")
+
+    def test_read_until_prompt(self):
+        conn = self._connect(prompt="$ ")
+        self._send(b"output\r\n$", b" rest")
+        assert_equal(conn.read_until_prompt(strip_prompt=True), "output\r\n")
+        assert_equal(conn.read(), "rest")
+
+    def test_read_until_regexp_prompt(self):
+        conn = self._connect(prompt=r"[$#] ", prompt_is_regexp=True)
+        self._send(b"output\r\n", b"# ")
+        assert_equal(conn.read_until_prompt(), "output\r\n# ")
+
+    def test_timeout(self):
+        conn = self._connect(timeout=0.3)
+        self._send(b"foo", b"bar")
+        start = time.monotonic()
+        assert_raises_with_msg(
+            NoMatchError,
+            "No match found for 'zap' in 300 milliseconds. Output:\nfoobar",
+            conn.read_until,
+            "zap",
+        )
+        elapsed = time.monotonic() - start
+        assert_true(0.3 <= elapsed < 2, elapsed)
+
+    def test_eof(self):
+        conn = self._connect(timeout=10)
+        self._send(b"foo", close=True)
+        start = time.monotonic()
+        assert_raises_with_msg(
+            NoMatchError,
+            "No match found for 'bar' in 10 seconds. Output:\nfoo",
+            conn.read_until,
+            "bar",
+        )
+        assert_true(time.monotonic() - start < 5)
+
+    def test_match_found_before_eof(self):
+        conn = self._connect(timeout=10)
+        self._send(b"foo", b"bar", close=True)
+        self.sender.join()
+        assert_equal(conn.read_until_regexp("o+"), "foo")
+        assert_equal(conn.read_until("bar"), "bar")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -342,6 +342,42 @@ class TestSuiteStatistics(unittest.TestCase):
         )
 
 
+class TestIncrementalStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.config = dict(
+            suite_stat_level=2,
+            tag_stat_include=["t*", "smoke"],
+            tag_stat_combine=[("t? AND smoke", "")],
+        )
+
+    def _add(self, stats, suite):
+        stats.start_suite(suite)
+        for test in suite.tests:
+            stats.add_test(test)
+        for child in suite.suites:
+            self._add(stats, child)
+        stats.end_suite(suite)
+
+    def test_same_as_visiting_suite(self):
+        suite = generate_suite()
+        stats = Statistics(**self.config)
+        self._add(stats, suite)
+        assert_equal(stats.to_dict(), Statistics(suite, **self.config).to_dict())
+
+    def test_current_suite(self):
+        suite = generate_suite()
+        stats = Statistics(**self.config)
+        assert_equal(stats.current_suite, None)
+        stats.start_suite(suite)
+        self._add(stats, suite.suites[0])
+        verify_stat(stats.current_suite, "Root Suite", 4, 2, 1, id="s1")
+        stats.start_suite(suite.suites[1])
+        verify_stat(stats.current_suite, "Root Suite.Second Sub Suite", 0, 0, 0,
+                    id="s1-s2")  # fmt: skip
+        verify_stat(stats.total.stat, "All Tests", 4, 2, 1)
+
+
 class TestElapsedTime(unittest.TestCase):
 
     def setUp(self):
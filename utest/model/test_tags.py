@@ -223,6 +223,28 @@ class TestTagPatterns(unittest.TestCase):
         assert_true(patterns.match(["x"]))
         assert_true(patterns.match(["xxx", "zzz"]))
 
+    def test_duplicate_patterns(self):
+        patterns = TagPatterns(["a*b*c OR A*B*C", "a*b*c"])
+        assert_true(patterns.match(["axbxc"]))
+        assert_false(patterns.match(["axbx"]))
+
+    def test_single_patterns_and_boolean_patterns(self):
+        patterns = TagPatterns(["x", "a AND b", "y?", "c OR d*", "e NOT f"])
+        assert_false(patterns.match([]))
+        assert_false(patterns.match(["a", "yyy", "f", "e f"]))
+        for tags in (["X"], ["A", "B"], ["y_y"], ["c"], ["DDD"], ["E"]):
+            assert_true(patterns.match(tags), tags)
+        assert_true(patterns.match(Tags(["_Y Y"])))
+
+    def test_matching_tags_after_modifying_them(self):
+        tags = Tags(["a"])
+        patterns = TagPatterns(["b*"])
+        assert_false(patterns.match(tags))
+        tags.add("B B")
+        assert_true(patterns.match(tags))
+        tags.remove("bb")
+        assert_false(patterns.match(tags))
+
     def test_and(self):
         patterns = TagPatterns(["xANDy", "???ANDz"])
         assert_false(patterns.match([]))
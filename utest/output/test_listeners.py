@@ -4,10 +4,10 @@ import unittest
 from robot.errors import DataError
 from robot.model import BodyItem
 from robot.output import LOGGER
-from robot.output.listeners import ListenerFacade, Listeners
+from robot.output.listeners import LibraryListeners, ListenerFacade, Listeners
 from robot.running.outputcapture import OutputCapturer
 from robot.utils import DotDict
-from robot.utils.asserts import assert_equal, assert_raises_with_msg
+from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
 
 LOGGER.unregister_console_logger()
 
@@ -179,6 +179,28 @@ class TestListeners(unittest.TestCase):
         assert_equal(stdout.rstrip(), expected)
 
 
+class TestLibraryListeners(unittest.TestCase):
+
+    def setUp(self):
+        self.listeners = LibraryListeners()
+        self.listeners.new_suite_scope()
+        self.library = DotDict(listeners=[ListenAll()])
+
+    def test_register_and_unregister(self):
+        self.listeners.register(self.library)
+        (listener,) = self.listeners
+        assert_true(listener.library is self.library)
+        assert_equal(self.listeners.unregister(self.library), [listener])
+        assert_equal(list(self.listeners), [])
+
+    def test_register_earlier_unregistered_listeners(self):
+        self.listeners.register(self.library)
+        removed = self.listeners.unregister(self.library)
+        self.library.listeners = []
+        self.listeners.register(self.library, removed)
+        assert_equal(list(self.listeners), removed)
+
+
 class TestListenerPriority(unittest.TestCase):
 
     def test_no_priority(self):
@@ -7,7 +7,7 @@ from pathlib import Path
 from parsing_test_utils import assert_model, remove_non_data
 
 from robot.parsing import (
-    get_model, get_resource_model, ModelTransformer, ModelVisitor, Token
+    get_model, get_resource_model, ModelTransformer, ModelVisitor, Token, update_model
 )
 from robot.parsing.model.blocks import (
     File, For, Group, If, ImplicitCommentSection, InvalidSection, Keyword,
@@ -3002,5 +3002,102 @@ Dokumentaatio    DE header w/ FI setting
         assert_model(model, expected)
 
 
+class TestUpdateModel(unittest.TestCase):
+    data = """\
+*** Settings ***
+Test Tags    tag
+
+*** Test Cases ***
+First
+    Log    1
+
+Second
+    Log    2
+
+*** Keywords ***
+Keyword
+    Log    3
+"""
+
+    def _update(self, lineno, end_lineno, text, model_getter=get_model):
+        model = model_getter(self.data)
+        lines = self.data.splitlines(keepends=True)
+        data = "".join(lines[: lineno - 1] + [text] + lines[end_lineno:])
+        updated = update_model(model, lineno, end_lineno, text, model_getter)
+        assert_model(updated, model_getter(data))
+        return model, updated
+
+    def test_replace_lines(self):
+        old, new = self._update(6, 6, "    Log    new\n")
+        assert_equal(new.sections[1].body[1], old.sections[1].body[1])
+        assert_equal(new.sections[2], old.sections[2])
+
+    def test_insert_lines(self):
+        old, new = self._update(8, 7, "Third\n    No Operation\n\n")
+        assert_equal(new.sections[1].body[0] is old.sections[1].body[0], True)
+        assert_equal(new.sections[2] is old.sections[2], True)
+        assert_equal(new.sections[2].body[0].lineno, 15)
+
+    def test_remove_lines(self):
+        old, new = self._update(5, 7, "")
+        assert_equal(len(new.sections[1].body), 1)
+        assert_equal(new.sections[2] is old.sections[2], True)
+
+    def test_edit_without_newline(self):
+        self._update(9, 9, "    Log")
+        self._update(13, 13, "")
+        self._update(14, 13, "New")
+
+    def test_new_item_continues_previous(self):
+        self._update(7, 7, "    Log    continued\n")
+        self._update(11, 11, "\n    Log    continued\n")
+
+    def test_add_and_remove_sections(self):
+        self._update(8, 7, "*** Keywords ***\n")
+        self._update(11, 11, "")
+        self._update(4, 4, "*** Tasks ***\n")
+        self._update(14, 14, "*** Comments ***\n")
+
+    def test_edit_settings(self):
+        old, new = self._update(2, 2, "Test Template    Log\n")
+        assert_equal(new.sections[2] is old.sections[2], False)
+        self._update(14, 13, "*** Settings ***\nTest Template    Log\n")
+
+    def test_edit_first_section(self):
+        self.data = self.data.split("\n\n", 1)[1]
+        old, new = self._update(3, 3, "    Log    new\n")
+        assert_equal(new.sections[0] is old.sections[0], True)
+        assert_equal(new.sections[1] is old.sections[1], True)
+        self._update(1, 0, "Language: Finnish\n")
+        self._update(1, 1, "*** Testit ***\n")
+
+    def test_language_config(self):
+        self.data = "Language: Finnish\n\n*** Testit ***\nTesti\n    Log    1\n"
+        self._update(5, 5, "    Log    2\n")
+        self._update(1, 1, "Language: German\n")
+        self._update(2, 1, "Language: German\n")
+
+    def test_resource_file(self):
+        self.data = self.data.split("*** Keywords ***")[1]
+        self.data = "*** Keywords ***" + self.data
+        self._update(3, 3, "    Log    new\n", get_resource_model)
+        self._update(4, 3, "New\n    No Operation\n", get_resource_model)
+
+    def test_empty_model(self):
+        model = update_model(get_model(""), 1, 0, self.data)
+        assert_model(model, get_model(self.data))
+
+    def test_data_only_model_is_not_supported(self):
+        assert_raises_with_msg(
+            ValueError,
+            "Models created with 'data_only=True' cannot be updated.",
+            update_model,
+            get_model(self.data, data_only=True),
+            1,
+            1,
+            "",
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
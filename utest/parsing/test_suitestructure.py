@@ -1,8 +1,12 @@
+import os
+import tempfile
 import unittest
 from pathlib import Path
 
-from robot.parsing.suitestructure import IncludedFiles
-from robot.utils.asserts import assert_equal
+from robot.parsing.suitestructure import (
+    DirectoryCache, IncludedFiles, SuiteStructureBuilder, ValidExtensions
+)
+from robot.utils.asserts import assert_equal, assert_false, assert_true
 
 
 class TestIncludedFiles(unittest.TestCase):
@@ -58,5 +62,79 @@ class TestIncludedFiles(unittest.TestCase):
             assert_equal(IncludedFiles(["no", "match", pattern]).match(path), match)
 
 
+class TestValidExtensions(unittest.TestCase):
+
+    def test_match(self):
+        extensions = ValidExtensions([".robot", "robot.rst"], ["*.txt"])
+        for name in ["x.robot", "X.ROBOT", "x.robot.rst", "x.y.robot", "x.txt"]:
+            assert_true(extensions.match(Path(name)), name)
+            assert_true(extensions.match(name), name)
+        for name in ["x.rst", "robot", ".robot", "x.robot.", "x.robot.md"]:
+            assert_false(extensions.match(Path(name)), name)
+            assert_false(extensions.match(name), name)
+
+    def test_get_extension(self):
+        extensions = ValidExtensions([".robot", "robot.rst"])
+        assert_equal(extensions.get_extension(Path("x.y.robot.rst")), "robot.rst")
+        assert_equal(extensions.get_extension(Path("x.ROBOT")), "robot")
+        assert_equal(extensions.get_extension(Path("x.Txt")), "txt")
+
+
+class TestSuiteStructureBuilder(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempdir.name) / "root"
+        for path in [
+            "__init__.robot",
+            "a.robot",
+            "b.txt",
+            "_ignored.robot",
+            "sub/c.robot",
+            "sub/d.py",
+            "CVS/e.robot",
+        ]:
+            path = self.root / path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("", encoding="UTF-8")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_build(self):
+        self._verify(SuiteStructureBuilder().build(self.root))
+
+    def test_cache(self):
+        path = Path(self.tempdir.name) / "cache.json"
+        self._verify(SuiteStructureBuilder(cache=path).build(self.root))
+        assert_true(path.exists())
+        self._verify(SuiteStructureBuilder(cache=path).build(self.root))
+        (self.root / "sub/f.robot").write_text("", encoding="UTF-8")
+        stat = os.stat(self.root / "sub")
+        os.utime(self.root / "sub", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        structure = SuiteStructureBuilder(cache=path).build(self.root)
+        sub = structure.children[1]
+        assert_equal([c.source.name for c in sub.children], ["c.robot", "f.robot"])
+
+    def test_cached_listing(self):
+        path = Path(self.tempdir.name) / "cache.json"
+        cache = DirectoryCache(path)
+        listing = cache.list(self.root / "sub")
+        assert_equal(listing, [("c.robot", "file"), ("d.py", "file")])
+        cache.save()
+        assert_equal(DirectoryCache(path).list(self.root / "sub"), listing)
+        assert_equal(DirectoryCache().list(self.root / "sub"), listing)
+
+    def _verify(self, structure):
+        assert_equal(structure.source, self.root)
+        assert_equal(structure.init_file, self.root / "__init__.robot")
+        assert_equal(
+            [c.source for c in structure.children],
+            [self.root / "a.robot", self.root / "sub"],
+        )
+        sub = structure.children[1]
+        assert_equal(sub.children[0].source, self.root / "sub/c.robot")
+
+
 if __name__ == "__main__":
     unittest.main()
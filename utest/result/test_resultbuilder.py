@@ -7,6 +7,7 @@ from pathlib import Path
 
 from robot.errors import DataError
 from robot.result import ExecutionResult, ExecutionResultBuilder, Result, TestSuite
+from robot.result.executionresult import KeywordRemover
 from robot.utils.asserts import assert_equal, assert_false, assert_raises, assert_true
 
 CURDIR = Path(__file__).resolve().parent
@@ -151,6 +152,26 @@ class TestBuildingSuiteExecutionResult(unittest.TestCase):
         builder.build(result)
         assert_equal(len(result.suite.tests[0].body), 0)
 
+    def test_omit_keywords_keeps_everything_else(self):
+        for source in CURDIR / "golden.xml", GOLDEN_XML.encode("UTF-8"):
+            result = ExecutionResult(source, include_keywords=False)
+            expected = ExecutionResult(GOLDEN_XML)
+            expected.suite.visit(KeywordRemover())
+            assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+            assert_equal(
+                result.errors.messages[0].message, expected.errors.messages[0].message
+            )
+
+    def test_json_roundtrip(self):
+        result = ExecutionResult(self.result.to_json())
+        assert_equal(result.suite.to_dict(), self.suite.to_dict())
+        for orig, item in zip(self.test.body, result.suite.tests[0].body):
+            assert_equal(type(item), type(orig))
+            assert_equal(item.parent, result.suite.tests[0])
+            for orig_child, child in zip(orig.body, item.body):
+                assert_equal(type(child), type(orig_child))
+                assert_equal(child.parent, item)
+
     def test_rpa_with_xml(self):
         rpa_false = GOLDEN_XML
         self._validate_rpa(ExecutionResult(rpa_false), False)
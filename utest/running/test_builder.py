@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -188,5 +189,119 @@ class TestTemplates(unittest.TestCase):
         assert_equal(test.template, "Expect Exactly Three Args")
 
 
+class TestPrefilter(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempdir.name, "Root")
+        self._create(
+            "__init__.robot",
+            "*** Settings ***\nTest Tags    init\n",
+        )
+        self._create(
+            "first.robot",
+            "*** Test Cases ***\n"
+            "Test 1\n"
+            "    [Tags]    one\n"
+            "    Log    ${1}\n"
+            "    ...    [Tags]    not really\n"
+            "Test 2\n"
+            "    [Documentation]    Tags come\n"
+            "    ...    after documentation.\n"
+            "    [Tags]    two    -init\n"
+            "    FOR    ${x}    IN    a    b\n"
+            "        Log    ${x}\n"
+            "    END\n",
+        )
+        self._create(
+            "second.robot",
+            "*** Test Cases ***\n"
+            "Test 3\n"
+            "    No Operation\n"
+            "\n"
+            "*** Settings ***\n"
+            "Name    Custom\n"
+            "Default Tags    default\n"
+            "...    three\n",
+        )
+        self._create(
+            "sub/third.robot",
+            "| *** Test Cases *** |\n"
+            "| Test 4 | No Operation |\n"
+            "|        | [Tags] | pipes |\n"
+            "*** Keywords ***\n"
+            "Keyword\n"
+            "    [Tags]    keyword\n",
+        )
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _create(self, name, content):
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="UTF-8")
+
+    def _build(self, *paths, **filters):
+        prefiltered = []
+
+        def prefilter(suite):
+            suite.filter(**filters)
+            prefiltered.append([t.name for t in suite.all_tests])
+
+        suite = TestSuiteBuilder(prefilter=prefilter).build(*(paths or [self.root]))
+        return suite, prefiltered[0]
+
+    def test_prescanned_names_and_tags(self):
+        tags = {}
+
+        def prefilter(suite):
+            tags.update((t.name, list(t.tags)) for t in suite.all_tests)
+
+        TestSuiteBuilder(prefilter=prefilter).build(self.root)
+        assert_equal(
+            tags,
+            {
+                "Test 1": ["init", "one"],
+                "Test 2": ["two"],
+                "Test 3": ["default", "init", "three"],
+                "Test 4": ["init", "pipes"],
+            },
+        )
+
+    def test_files_without_selected_tests_are_not_parsed(self):
+        suite, selected = self._build(included_tags=["two"])
+        assert_equal(selected, ["Test 2"])
+        assert_equal([s.name for s in suite.suites], ["First"])
+        assert_equal([t.name for t in suite.all_tests], ["Test 1", "Test 2"])
+
+    def test_filter_by_suite_and_test_name(self):
+        suite, selected = self._build(included_suites=["Root.Custom"])
+        assert_equal(selected, ["Test 3"])
+        assert_equal([s.name for s in suite.suites], ["Custom"])
+        suite, selected = self._build(included_tests=["Test 4"])
+        assert_equal(selected, ["Test 4"])
+        assert_equal([s.name for s in suite.suites], ["Sub"])
+        assert_equal([s.name for s in suite.suites[0].suites], ["Third"])
+
+    def test_init_files_are_parsed(self):
+        suite, _ = self._build(included_tags=["pipes"])
+        test = suite.suites[0].suites[0].tests[0]
+        assert_equal(list(test.tags), ["init", "pipes"])
+
+    def test_nothing_matches(self):
+        suite, selected = self._build(included_tags=["nonex"])
+        assert_equal(selected, [])
+        assert_equal(suite.test_count, 4)
+
+    def test_multiple_sources(self):
+        first, second = self.root / "first.robot", self.root / "second.robot"
+        suite, selected = self._build(first, second, included_tests=["Test 1"])
+        assert_equal(selected, ["Test 1"])
+        assert_equal(suite.name, "First & Custom")
+        assert_equal([s.name for s in suite.suites], ["First", "Custom"])
+        assert_equal(suite.suites[1].test_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
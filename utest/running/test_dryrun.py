@@ -0,0 +1,106 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from robot.running import DryRunError, DryRunValidator
+from robot.utils.asserts import assert_equal
+
+SUITE = """\
+*** Settings ***
+Library    OperatingSystem
+Library    NonExisting
+
+*** Test Cases ***
+Passing
+    Log    Hello
+    File Should Exist    ${CURDIR}
+
+Not found
+    Non-existing keyword
+
+Invalid arguments
+    Log
+"""
+INIT = """\
+*** Settings ***
+Suite Setup       Log    Hello
+Suite Teardown    Log
+"""
+
+
+class TestDryRunValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempdir.name, "Root")
+        for name in "a", "b", "c":
+            path = self.root / f"{name}.robot"
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(SUITE, encoding="UTF-8")
+        (self.root / "__init__.robot").write_text(INIT, encoding="UTF-8")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_in_current_process(self):
+        self._verify(DryRunValidator(processes=1).validate(self.root))
+
+    def test_in_parallel(self):
+        self._verify(DryRunValidator(processes=2).validate(self.root))
+
+    def test_options(self):
+        errors = DryRunValidator(processes=1, test="Passing").validate(self.root)
+        assert_equal(len(errors), 4)
+        errors = DryRunValidator(processes=1, include="x", runemptysuite=True)
+        assert_equal(errors.validate(self.root), [])
+
+    def test_str(self):
+        error = DryRunError("Oops!", Path("x.robot"), 42, "X.Test")
+        assert_equal(str(error), "x.robot:42: X.Test: Oops!")
+        assert_equal(str(DryRunError("Oops!")), "Oops!")
+
+    def _verify(self, errors):
+        expected = []
+        for name in "a", "b", "c":
+            source = self.root / f"{name}.robot"
+            expected.extend(
+                [
+                    DryRunError(
+                        f"Error in file '{source}' on line 3: Importing library "
+                        f"'NonExisting' failed: ModuleNotFoundError: "
+                        f"No module named 'NonExisting'",
+                    ),
+                    DryRunError(
+                        "No keyword with name 'Non-existing keyword' found.",
+                        source,
+                        10,
+                        f"Root.{name.upper()}.Not found",
+                    ),
+                    DryRunError(
+                        "Keyword 'BuiltIn.Log' expected 1 to 6 arguments, got 0.",
+                        source,
+                        13,
+                        f"Root.{name.upper()}.Invalid arguments",
+                    ),
+                ]
+            )
+        expected.append(
+            DryRunError(
+                "Keyword 'BuiltIn.Log' expected 1 to 6 arguments, got 0.",
+                self.root,
+                3,
+                "Root",
+            )
+        )
+        assert_equal(self._normalize(errors), sorted(expected, key=str))
+
+    def _normalize(self, errors):
+        # Import error messages contain a traceback and PYTHONPATH. The order
+        # of errors depends on how suites are split between processes.
+        for error in errors:
+            error.message = error.message.split("\n")[0]
+        return sorted(errors, key=str)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,11 @@ from os.path import abspath, dirname, join
 from resources.Listener import Listener
 from resources.runningtestcase import RunningTestCase
 
+from robot.conf import RobotSettings
 from robot.model import BodyItem
+from robot.output import LOGGER, Output
 from robot.running import TestSuite, TestSuiteBuilder
+from robot.running.suiterunner import SuiteRunner
 from robot.utils.asserts import assert_equal
 
 CURDIR = dirname(abspath(__file__))
@@ -358,6 +361,67 @@ class TestStateBetweenTestRuns(unittest.TestCase):
         assert_equal(logging.raiseExceptions, 1)
 
 
+class TestStatisticsDuringExecution(unittest.TestCase):
+
+    def test_passing_failing_and_skipped(self):
+        suite = TestSuite(name="Root")
+        child = suite.suites.create(name="Child")
+        child.tests.create(name="Pass", tags=["a"]).body.create_keyword("No Operation")
+        child.tests.create(name="Fail", tags=["a", "b"]).body.create_keyword("Fail")
+        child.tests.create(name="Skip", tags=["b"]).body.create_keyword("Skip")
+        suite.suites.create(name="Other").tests.create(name="Pass").body.create_keyword(
+            "No Operation"
+        )
+        self._verify(suite, tagstatcombine=["aANDb"], totals=(2, 1, 1))
+
+    def test_suite_teardown_failure(self):
+        suite = TestSuite(name="Root")
+        child = suite.suites.create(name="Child")
+        child.teardown.config(name="Fail", args=["Teardown failed"])
+        child.tests.create(name="Pass", tags=["a"]).body.create_keyword("No Operation")
+        child.tests.create(name="Skip", tags=["b"]).body.create_keyword("Skip")
+        other = suite.suites.create(name="Other")
+        other.teardown.config(name="Skip")
+        other.tests.create(name="Pass").body.create_keyword("No Operation")
+        self._verify(suite, totals=(0, 1, 2))
+
+    def test_exit_on_failure(self):
+        suite = TestSuite(name="Root")
+        child = suite.suites.create(name="Child")
+        child.tests.create(name="Pass", tags=["a"]).body.create_keyword("No Operation")
+        child.tests.create(name="Fail", tags=["a"]).body.create_keyword("Fail")
+        child.tests.create(name="Not run", tags=["b"])
+        suite.suites.create(name="Other").tests.create(name="Not run")
+        self._verify(suite, exitonfailure=True, totals=(1, 3, 0))
+
+    def test_listener_changing_statuses_in_end_suite(self):
+        class Listener:
+            def end_suite(self, data, result):
+                if result.name == "Child":
+                    for test in result.tests:
+                        test.status = "FAIL"
+
+        suite = TestSuite(name="Root")
+        child = suite.suites.create(name="Child")
+        child.tests.create(name="Pass 1").body.create_keyword("No Operation")
+        child.tests.create(name="Pass 2").body.create_keyword("No Operation")
+        suite.suites.create(name="Other").tests.create(name="Pass").body.create_keyword(
+            "No Operation"
+        )
+        self._verify(suite, listener=[Listener()], totals=(1, 2, 0))
+
+    def _verify(self, suite, totals, **options):
+        settings = RobotSettings(output=None, console="none", **options)
+        with LOGGER:
+            output = Output(settings)
+            runner = SuiteRunner(output, settings)
+            suite.visit(runner)
+            output.close(runner.result, runner.statistics)
+        total = runner.statistics.total.stat
+        assert_equal((total.passed, total.failed, total.skipped), totals)
+        assert_equal(runner.statistics.to_dict(), runner.result.statistics.to_dict())
+
+
 class TestListeners(RunningTestCase):
 
     def test_listeners(self):
@@ -1,6 +1,8 @@
 import os.path
 import re
 import sys
+import tempfile
+import time
 import unittest
 from pathlib import Path
 
@@ -11,6 +13,7 @@ from classes import (
 
 from robot.errors import DataError
 from robot.running import Keyword as KeywordData
+from robot.running.librarycache import LibraryCache
 from robot.running.testlibraries import (
     ClassLibrary, DynamicLibrary, ModuleLibrary, TestLibrary
 )
@@ -565,6 +568,122 @@ class TestSourceAndLineno(unittest.TestCase):
         assert_equal(lib.lineno, lineno)
 
 
+class TestLibraryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tempdir.name)
+        os.environ["ROBOT_LIBRARY_CACHE"] = self.tempdir.name
+
+    def tearDown(self):
+        os.environ.pop("ROBOT_LIBRARY_CACHE")
+        self.tempdir.cleanup()
+
+    def test_static_library(self):
+        self._verify_cached("classes.ArgInfoLibrary")
+        self._verify_cached("classes.NameLibrary")
+
+    def test_dynamic_library(self):
+        self._verify_cached("classes.ArgDocDynamicLibrary")
+        self._verify_cached("classes.ArgDocDynamicLibraryWithKwargsSupport")
+
+    def test_library_with_init_arguments(self):
+        self._verify_cached("ParameterLibrary", args=["a", "b"])
+        self._verify_cached("ParameterLibrary", args=["a", "c"])
+        assert_equal(len(list(self.directory.iterdir())), 2)
+
+    def test_errors_are_reported_also_when_using_cache(self):
+        logger = RecordingLogger()
+        orig = TestLibrary.from_name("classes.InvalidGetDocDynamicLibrary", logger=logger)
+        messages = logger.messages
+        assert_true(messages)
+        logger = RecordingLogger()
+        lib = TestLibrary.from_name("classes.InvalidGetDocDynamicLibrary", logger=logger)
+        assert_equal(logger.messages, messages)
+        assert_equal(len(lib.keywords), len(orig.keywords))
+
+    def test_cache_is_not_used_if_library_changes(self):
+        path = self.directory / "ChangingLibrary.py"
+        path.write_text("def keyword():\n    pass\n", encoding="UTF-8")
+        lib = TestLibrary.from_name(str(path))
+        cache = LibraryCache(lib)
+        assert_not_none(cache.load())
+        path.write_text("def keyword(arg):\n    pass\n", encoding="UTF-8")
+        assert_none(LibraryCache(lib).load())
+
+    def test_cache_is_not_used_if_keyword_source_changes(self):
+        helper = self.directory / "cache_helper.py"
+        helper.write_text("def keyword():\n    pass\n", encoding="UTF-8")
+        path = self.directory / "ImportingLibrary.py"
+        path.write_text("from cache_helper import keyword\n", encoding="UTF-8")
+        sys.path.insert(0, str(self.directory))
+        try:
+            lib = TestLibrary.from_name(str(path))
+        finally:
+            sys.path.remove(str(self.directory))
+            sys.modules.pop("cache_helper", None)
+        assert_equal([kw.name for kw in lib.keywords], ["Keyword"])
+        assert_not_none(LibraryCache(lib).load())
+        helper.write_text("def keyword(arg):\n    pass\n", encoding="UTF-8")
+        assert_none(LibraryCache(lib).load())
+
+    def test_library_with_unstable_init_arguments_is_not_cached(self):
+        for args in [[object()], ["a", {"b": object()}]]:
+            lib = TestLibrary.from_name("ParameterLibrary", args=args)
+            assert_none(LibraryCache(lib).path)
+        lib = TestLibrary.from_name("ParameterLibrary", args=[1, ("a", None)])
+        assert_not_none(LibraryCache(lib).path)
+        assert_equal(len(list(self.directory.iterdir())), 1)
+
+    def test_old_cache_files_are_pruned(self):
+        LibraryCache.max_entries = 2
+        try:
+            for arg in "abc":
+                TestLibrary.from_name("ParameterLibrary", args=[arg, "x"])
+                time.sleep(0.01)
+            TestLibrary.from_name("ParameterLibrary", args=["b", "x"])
+            time.sleep(0.01)
+            TestLibrary.from_name("classes.NameLibrary")
+            TestLibrary.from_name("ParameterLibrary", args=["d", "x"])
+        finally:
+            del LibraryCache.max_entries
+        expected = [
+            LibraryCache(TestLibrary.from_name(name, args=args)).path
+            for name, args in [
+                ("ParameterLibrary", ["b", "x"]),
+                ("ParameterLibrary", ["d", "x"]),
+                ("classes.NameLibrary", None),
+            ]
+        ]
+        assert_equal(sorted(self.directory.iterdir()), sorted(expected))
+
+    def test_cache_is_not_used_by_default(self):
+        os.environ["ROBOT_LIBRARY_CACHE"] = ""
+        lib = TestLibrary.from_name("classes.NameLibrary")
+        assert_none(LibraryCache(lib).path)
+        assert_equal(list(self.directory.iterdir()), [])
+
+    def test_remote_library_is_not_cached(self):
+        lib = TestLibrary.from_name("Remote", create_keywords=False)
+        assert_none(LibraryCache(lib).path)
+
+    def _verify_cached(self, name, args=None):
+        orig = TestLibrary.from_name(name, args=args)
+        assert_not_none(LibraryCache(orig).load())
+        lib = TestLibrary.from_name(name, args=args)
+        assert_equal(len(lib.keywords), len(orig.keywords))
+        for kw, exp in zip(lib.keywords, orig.keywords):
+            assert_equal(type(kw), type(exp))
+            assert_equal(kw.full_name, exp.full_name)
+            assert_equal(kw.args.name, exp.args.name)
+            assert_equal(str(kw.args), str(exp.args))
+            assert_equal(kw.doc, exp.doc)
+            assert_equal(kw.tags, exp.tags)
+            assert_equal(kw.error, exp.error)
+            assert_equal(kw.source, exp.source)
+            assert_equal(kw.lineno, exp.lineno)
+
+
 class NullLogger:
 
     def write(self, *args, **kwargs):
@@ -573,6 +692,27 @@ class NullLogger:
     error = warn = info = debug = write
 
 
+class RecordingLogger:
+
+    def __init__(self):
+        self.messages = []
+
+    def write(self, message, level="INFO", html=False):
+        self.messages.append((message, level))
+
+    def error(self, message):
+        self.write(message, "ERROR")
+
+    def warn(self, message):
+        self.write(message, "WARN")
+
+    def info(self, message):
+        self.write(message, "INFO")
+
+    def debug(self, message):
+        self.write(message, "DEBUG")
+
+
 class FakeNamespace:
 
     def __init__(self):
@@ -0,0 +1,97 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from robot.utils import FileWatcher
+from robot.utils.asserts import assert_equal, assert_true
+
+
+class TestFileWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempdir.name).resolve()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_watched_directories(self):
+        (self.root / "a" / "x").mkdir(parents=True)
+        (self.root / "b").mkdir()
+        root = str(self.root)
+        for path, expected in [
+            (f"{root}/a/file.txt", [f"{root}/a"]),
+            (f"{root}/a/*.txt", [f"{root}/a"]),
+            (f"{root}/a/x/y/z/file.txt", [f"{root}/a/x"]),
+            (f"{root}/*/file.txt", [root, f"{root}/a", f"{root}/b"]),
+            (f"{root}/*/*/file.txt", [root, f"{root}/a", f"{root}/a/x", f"{root}/b"]),
+            (f"{root}/?/x/file.txt", [root, f"{root}/a", f"{root}/a/x", f"{root}/b"]),
+        ]:
+            with FileWatcher([path]) as watcher:
+                assert_equal(
+                    sorted(watcher._get_directories(path)), expected, path
+                )
+
+    def test_wait_returns_when_file_is_created(self):
+        path = self.root / "file.txt"
+        self._verify_wait([str(path)], lambda: path.write_text("x"))
+
+    def test_wait_returns_when_file_is_removed(self):
+        path = self.root / "file.txt"
+        path.write_text("x")
+        self._verify_wait([str(path)], path.unlink)
+
+    def test_wait_with_pattern_in_non_existing_directory(self):
+        path = self.root / "a" / "b" / "file.txt"
+        pattern = str(self.root / "*" / "b" / "*.txt")
+        with FileWatcher([pattern]) as watcher:
+            for action in (
+                lambda: path.parent.parent.mkdir(),
+                lambda: path.parent.mkdir(),
+                lambda: path.write_text("x"),
+            ):
+                self._run_later(action)
+                self._wait(watcher)
+            assert_true(path.exists())
+
+    def test_wait_without_changes_obeys_timeout(self):
+        with FileWatcher([str(self.root / "file.txt")]) as watcher:
+            start = time.time()
+            watcher.wait(0.05)
+            watcher.wait(0)
+            watcher.wait(-1)
+            elapsed = time.time() - start
+        assert_true(0.04 < elapsed < 0.5, elapsed)
+
+    def test_polling_fallback(self):
+        watcher = FileWatcher([str(self.root / "file.txt")])
+        watcher.close()
+        assert_true(not watcher.uses_inotify)
+        start = time.time()
+        watcher.wait(10)
+        assert_true(time.time() - start < 1)
+
+    def _verify_wait(self, paths, action):
+        with FileWatcher(paths) as watcher:
+            self._run_later(action)
+            self._wait(watcher)
+
+    def _run_later(self, action, delay=0.05):
+        timer = threading.Timer(delay, action)
+        timer.start()
+        self.addCleanup(timer.join)
+
+    def _wait(self, watcher):
+        # With inotify the wait must end soon after the change. Polling
+        # returns after a short sleep regardless of changes.
+        start = time.time()
+        watcher.wait(5)
+        elapsed = time.time() - start
+        assert_true(elapsed < 0.5 or not watcher.uses_inotify, elapsed)
+        time.sleep(0.01 if watcher.uses_inotify else 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
+import re
 import unittest
 
-from robot.utils import eq, Matcher, MultiMatcher
+from robot.utils import eq, Matcher, MultiMatcher, PatternCache
 from robot.utils.asserts import assert_equal, assert_raises
 
 
@@ -195,6 +196,12 @@ class TestMultiMatcher(unittest.TestCase):
         assert matcher.match("__::FOO::__")
         assert not matcher.match("bar")
 
+    def test_duplicate_patterns(self):
+        matcher = MultiMatcher(["a*b*c", "a*b*c", "A*B*C"])
+        assert matcher.match("axbxc")
+        assert matcher.match("ABC")
+        assert not matcher.match("axbx")
+
     def test_do_not_match_when_no_patterns_by_default(self):
         assert not MultiMatcher().match("xxx")
 
@@ -247,6 +254,60 @@ class TestMultiMatcher(unittest.TestCase):
         assert not matcher.match_any(("no", "match", "here"))
         assert not matcher.match_any(())
 
+    def test_many_patterns(self):
+        matcher = MultiMatcher(["a*b*c", "x*y*z", "[!a]??", "exact"])
+        for string in ["abc", "A - B - C", "xyz", "x y z", "bcd", "EXACT"]:
+            assert matcher.match(string), string
+            assert matcher.match_any(["no match", string]), string
+        for string in ["ab", "abcd", "acd", "exactly", ""]:
+            assert not matcher.match(string), string
+        assert not matcher.match_any(["ab", "abcd", "acd", "exactly", ""])
+
+    def test_many_regexp_patterns_with_backreferences(self):
+        matcher = MultiMatcher([r"(.)\1", r"(.)(.)\2\1"], regexp=True)
+        assert matcher.match("xx")
+        assert matcher.match("abba")
+        assert not matcher.match("xy")
+        assert not matcher.match("abab")
+
+
+class TestPatternCache(unittest.TestCase):
+
+    def test_compile(self):
+        cache = PatternCache()
+        assert_equal(cache.compile("a.c").pattern, "a.c")
+        assert cache.compile("a.c") is cache.compile("a.c")
+        assert cache.compile("a.c") is not cache.compile("a.c", re.I)
+        assert cache.compile("a.c") is not cache.compile(b"a.c")
+        assert cache.compile("a?c", glob=True).fullmatch("abc")
+        assert not cache.compile("a.c", glob=True).fullmatch("abc")
+
+    def test_info(self):
+        cache = PatternCache()
+        for pattern in "a", "b", "a", "a":
+            cache.compile(pattern)
+        info = cache.info()
+        assert_equal((info.hits, info.misses, info.size), (2, 2, 2))
+        cache.clear()
+        assert_equal(cache.info(), type(info)(0, 0, 0, 1024))
+
+    def test_least_recently_used_is_discarded(self):
+        cache = PatternCache(maxsize=2)
+        a = cache.compile("a")
+        cache.compile("b")
+        cache.compile("a")
+        cache.compile("c")
+        assert_equal(cache.info().size, 2)
+        assert cache.compile("a") is a
+        assert_equal(cache.info().misses, 3)
+        cache.compile("b")
+        assert_equal(cache.info().misses, 4)
+
+    def test_invalid_pattern(self):
+        cache = PatternCache()
+        assert_raises(re.error, cache.compile, "(")
+        assert_equal(cache.info().size, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -213,6 +213,17 @@ class TestTime(unittest.TestCase):
                 inv,
             )
 
+    def test_timestr_to_secs_is_cached(self):
+        for _ in range(2):
+            assert_equal(timestr_to_secs("1 minute 1.23456 s"), 61.235)
+            assert_equal(timestr_to_secs("1 minute 1.23456 s", round_to=1), 61.2)
+            assert_raises_with_msg(
+                ValueError,
+                "Invalid time string '1 minute 1x'.",
+                timestr_to_secs,
+                "1 minute 1x",
+            )
+
     def test_secs_to_timestr(self):
         for inp, compact, verbose in [
             (0.001, "1ms", "1 millisecond"),